@@ -1,5 +1,6 @@
 from django.urls import include, path
 
+from apps.account.urls import async_urlpatterns as account_async_urlpatterns
 from apps.account.urls import router as account_router
 
 
@@ -10,6 +11,10 @@ urlpatterns = [
         "v1/healthcheck/",
         include("apps.healthcheck.urls", namespace="app"),
     ),
+    path(
+        "v1/account/async/",
+        include(account_async_urlpatterns),
+    ),
     path(
         "v1/account/",
         include(account_router.urls),
@@ -22,6 +27,7 @@ URL configuration for API version 1.
 Routes:
 - /v1/healthcheck/  -> Healthcheck app URLs for monitoring API/service health.
 - /v1/account/      -> Includes account app's registered routes (wallets, transactions, etc.).
+- /v1/account/async/ -> Async read-only wallet and transaction list/retrieve endpoints.
 
 Using namespacing and versioned path prefixes facilitates API versioning and modular URL management.
 """
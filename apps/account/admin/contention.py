@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.contrib import admin
+from django.template.response import TemplateResponse
+
+from apps.account.services import WalletContentionService
+
+
+def wallet_contention_view(request):
+    """
+    Admin page listing the wallets with the most lock contention.
+
+    Staff only, through `admin.site.admin_view` in the URL configuration. The `window`
+    and `limit` query parameters narrow the report.
+    """
+    window = _get_positive_int(request.GET.get("window"))
+    limit = _get_positive_int(request.GET.get("limit"))
+    context = {
+        **admin.site.each_context(request),
+        "title": "Wallet lock contention",
+        "wallets": WalletContentionService.get_top_wallets(limit=limit, window=window),
+        "window": min(
+            window or settings.WALLET_LOCK_CONTENTION_WINDOW, settings.WALLET_LOCK_CONTENTION_WINDOW
+        ),
+        "min_wait_ms": settings.WALLET_LOCK_CONTENTION_MIN_WAIT_MS,
+    }
+    return TemplateResponse(request, "admin/account/wallet_contention.html", context)
+
+
+def _get_positive_int(value):
+    """
+    Returns the value as a positive integer, or None if it is not one.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
@@ -10,7 +10,8 @@ class TransactionAdmin(admin.ModelAdmin):
 
     - Uses `list_select_related` to prefetch related wallet objects for efficiency.
     - Displays transaction ID, related wallet, transaction ID string, and amount.
-    - Allows searching by transaction ID and wallet label.
+    - Allows searching by transaction ID and wallet label; the substring searches use
+      the pg_trgm indexes on PostgreSQL once they are created (see `TrigramIndexService`).
     - Enables autocomplete for wallet selection to improve usability.
     - Marks creation and update timestamps as read-only.
     """
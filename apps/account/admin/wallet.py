@@ -41,6 +41,8 @@ class WalletAdmin(admin.ModelAdmin):
     Displays wallet details including a colored balance indicator and count of related transactions.
     Includes an inline of the last 10 transactions.
     Read-only fields prevent editing balance and timestamps.
+    Searches by label substring, which the pg_trgm index serves on PostgreSQL once
+    it is created (see `TrigramIndexService`).
     """
 
     list_display = ("id", "label", "colored_balance", "transaction_count", "created_at")
@@ -89,6 +91,8 @@ class TransactionAdmin(admin.ModelAdmin):
 
     Displays transaction details including associated wallet.
     Read-only fields prevent modifications.
+    Searches by transaction ID substring, which the pg_trgm index serves on PostgreSQL
+    once it is created (see `TrigramIndexService`).
     Disables add/change/delete permissions to enforce creation/modification only via API or Wallet inline.
     """
 
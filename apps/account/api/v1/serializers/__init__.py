@@ -1,9 +1,15 @@
+from apps.account.api.v1.serializers.archive import ArchivedTransactionSerializer
 from apps.account.api.v1.serializers.transaction import (
     TransactionRequestSerializer,
     TransactionSerializer,
 )
 from apps.account.api.v1.serializers.wallet import (
+    BulkDepositAttributesSerializer,
+    BulkDepositRequestSerializer,
+    BulkDepositResultSerializer,
     DepositRequestSerializer,
+    TransferBatchAttributesSerializer,
+    TransferBatchRequestSerializer,
     TransferRequestSerializer,
     WalletCreateUpdateSerializer,
     WalletSerializer,
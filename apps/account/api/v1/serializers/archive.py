@@ -0,0 +1,29 @@
+from rest_framework_json_api import serializers
+
+from apps.account.models import ArchivedTransaction
+
+
+class ArchivedTransactionSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for archived transactions compliant with JSON:API.
+
+    Fields:
+      - id: UUID of the original transaction.
+      - wallet: Foreign key to the associated wallet.
+      - txid: Transaction identifier string.
+      - amount: Decimal amount of the transaction.
+      - is_deleted: Whether the transaction was soft-deleted when archived.
+      - created_at: Creation time of the original transaction.
+      - archived_at: When the transaction was archived.
+
+    JSONAPIMeta:
+        Defines the resource name as "archived-transactions" for JSON:API routing.
+    """
+
+    class Meta:
+        model = ArchivedTransaction
+        fields = ("id", "wallet", "txid", "amount", "is_deleted", "created_at", "archived_at")
+        read_only_fields = fields
+
+    class JSONAPIMeta:
+        resource_name = "archived-transactions"
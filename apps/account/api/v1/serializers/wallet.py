@@ -1,6 +1,7 @@
 from rest_framework_json_api import serializers
 
 from apps.account.models import Wallet
+from apps.common.constants import BULK_OPERATION_MAX_ITEMS
 
 
 class WalletAttributesSerializer(serializers.Serializer):
@@ -109,6 +110,122 @@ class TransferRequestSerializer(serializers.Serializer):
     data = TransferDataSerializer()
 
 
+class TransferBatchAttributesSerializer(serializers.Serializer):
+    """
+    Serializer for the attributes of a Transfer Batch JSON:API resource.
+
+    Fields:
+      - transfers: List of TransferAttributesSerializer entries (source_wallet,
+        destination_wallet, amount), up to BULK_OPERATION_MAX_ITEMS.
+    """
+
+    transfers = TransferAttributesSerializer(
+        many=True, allow_empty=False, max_length=BULK_OPERATION_MAX_ITEMS
+    )
+
+
+class TransferBatchDataSerializer(serializers.Serializer):
+    """
+    Serializer for the data wrapper of a Transfer Batch JSON:API resource.
+
+    Fields:
+      - attributes: TransferBatchAttributesSerializer instance.
+    """
+
+    attributes = TransferBatchAttributesSerializer()
+
+
+class TransferBatchRequestSerializer(serializers.Serializer):
+    """
+    Serializer for the full JSON:API request body to apply a batch of transfers.
+
+    Fields:
+      - data: TransferBatchDataSerializer instance wrapping transfer batch attributes.
+    """
+
+    data = TransferBatchDataSerializer()
+
+
+class BulkDepositItemSerializer(serializers.Serializer):
+    """
+    Serializer for a single cash flow item of a bulk deposit request.
+
+    Fields:
+      - wallet: UUID of the wallet to deposit to or withdraw from.
+      - amount: Decimal amount, positive for deposits and negative for withdrawals.
+      - txid: Optional unique transaction ID; autogenerated if omitted.
+    """
+
+    wallet = serializers.UUIDField()
+    amount = serializers.DecimalField(max_digits=36, decimal_places=18)
+    txid = serializers.CharField(max_length=255, required=False)
+
+
+class BulkDepositAttributesSerializer(serializers.Serializer):
+    """
+    Serializer for the attributes of a Bulk Deposit JSON:API resource.
+
+    Fields:
+      - mode: "atomic" to apply all items or none, "best_effort" to apply every valid item.
+      - items: List of BulkDepositItemSerializer entries, up to BULK_OPERATION_MAX_ITEMS.
+    """
+
+    MODE_ATOMIC = "atomic"
+    MODE_BEST_EFFORT = "best_effort"
+
+    mode = serializers.ChoiceField(
+        choices=[MODE_ATOMIC, MODE_BEST_EFFORT], default=MODE_ATOMIC, required=False
+    )
+    items = BulkDepositItemSerializer(
+        many=True, allow_empty=False, max_length=BULK_OPERATION_MAX_ITEMS
+    )
+
+
+class BulkDepositDataSerializer(serializers.Serializer):
+    """
+    Serializer for the data wrapper of a Bulk Deposit JSON:API resource.
+
+    Fields:
+      - attributes: BulkDepositAttributesSerializer instance.
+    """
+
+    attributes = BulkDepositAttributesSerializer()
+
+
+class BulkDepositRequestSerializer(serializers.Serializer):
+    """
+    Serializer for the full JSON:API request body to apply many deposits or withdrawals.
+
+    Fields:
+      - data: BulkDepositDataSerializer instance wrapping bulk deposit attributes.
+    """
+
+    data = BulkDepositDataSerializer()
+
+
+class BulkDepositResultSerializer(serializers.Serializer):
+    """
+    Serializer describing the per-item result of a bulk deposit.
+
+    Fields:
+      - index: Position of the item in the request.
+      - wallet_id: UUID of the wallet.
+      - txid: Transaction ID used for the item.
+      - amount: Decimal amount of the item.
+      - status: "applied", "failed", or "skipped" when an atomic request was rejected.
+      - transaction_id: UUID of the created transaction, if applied.
+      - error: Reason of the failure, if failed.
+    """
+
+    index = serializers.IntegerField()
+    wallet_id = serializers.UUIDField()
+    txid = serializers.CharField()
+    amount = serializers.DecimalField(max_digits=36, decimal_places=18)
+    status = serializers.ChoiceField(choices=["applied", "failed", "skipped"])
+    transaction_id = serializers.UUIDField(allow_null=True)
+    error = serializers.CharField(allow_null=True)
+
+
 class WalletSerializer(serializers.ModelSerializer):
     """
     Serializer for the Wallet model compliant with JSON:API specification.
@@ -119,7 +236,10 @@ class WalletSerializer(serializers.ModelSerializer):
       - balance: Read-only decimal field representing the current wallet balance
         with high precision (up to 36 digits, 18 decimal places).
 
-    The `balance` field is marked as read-only and sourced directly from the model's balance attribute.
+    The `balance` field is marked as read-only and sourced directly from the model's stored
+    balance column, so serializing a page of wallets costs no per-wallet aggregate queries.
+    The slots of the sharded wallets of a page are summed with one grouped query when
+    the page is fetched (see `WalletQuerySet`).
 
     JSONAPIMeta:
         Defines the resource name as "wallets" for JSON:API routing.
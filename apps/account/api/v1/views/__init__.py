@@ -1,2 +1,4 @@
+from apps.account.api.v1.views.archive import ArchivedTransactionViewSet
+from apps.account.api.v1.views.async_read import AsyncTransactionView, AsyncWalletView
 from apps.account.api.v1.views.transaction import TransactionViewSet
 from apps.account.api.v1.views.wallet import WalletViewSet
@@ -0,0 +1,42 @@
+import logging
+
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.filters import OrderingFilter
+from rest_framework_json_api.views import ReadOnlyModelViewSet
+
+from apps.account.api.v1.serializers import ArchivedTransactionSerializer
+from apps.account.filters import ArchivedTransactionFilter
+from apps.account.models import ArchivedTransaction
+from apps.common.constants import KeysetResultsSetPagination
+from apps.common.mixins import APIHandleExceptionMixin, CacheResponseMixin
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArchivedTransactionViewSet(
+    APIHandleExceptionMixin,
+    CacheResponseMixin,
+    ReadOnlyModelViewSet,
+):
+    """
+    Read-only ViewSet for transactions moved to the archive by `archive_transactions`.
+
+    Features:
+      - Supports list and retrieve only; archived transactions cannot be changed.
+      - Supports pagination via KeysetResultsSetPagination: page numbers by default,
+        keyset pagination on (created_at, id) when "page[cursor]" is given.
+      - Supports filtering by wallet, exact txid and creation time range through
+        ArchivedTransactionFilter.
+      - Defaults ordering by descending creation date.
+      - Caches list and retrieve responses, invalidated when transactions are archived.
+    """
+
+    queryset = ArchivedTransaction.objects.all()
+    serializer_class = ArchivedTransactionSerializer
+    pagination_class = KeysetResultsSetPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = ArchivedTransactionFilter
+    ordering_fields = ["created_at"]
+    ordering = ["-created_at"]
+    cache_timeout = 60 * 60
@@ -0,0 +1,41 @@
+from django_filters.rest_framework import DjangoFilterBackend
+
+from apps.account.api.v1.serializers import TransactionSerializer, WalletSerializer
+from apps.account.exceptions import TransactionNotFoundError, WalletNotFoundError
+from apps.account.filters import TransactionFilter, WalletFilter
+from apps.account.models import Transaction, Wallet
+from apps.common.mixins import APIHandleExceptionMixin
+from apps.common.views import AsyncReadOnlyModelView
+
+
+class AsyncWalletView(APIHandleExceptionMixin, AsyncReadOnlyModelView):
+    """
+    Async read-only variant of the wallet list and retrieve endpoints.
+
+    Accepts the same filters as WalletViewSet and returns the same JSON:API documents,
+    paginated in keyset mode on (created_at, id) in ascending creation order.
+    """
+
+    queryset = Wallet.objects.all()
+    serializer_class = WalletSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = WalletFilter
+    ordering = ["created_at"]
+    not_found_exception_class = WalletNotFoundError
+
+
+class AsyncTransactionView(APIHandleExceptionMixin, AsyncReadOnlyModelView):
+    """
+    Async read-only variant of the transaction list and retrieve endpoints.
+
+    Accepts the same filters as TransactionViewSet and returns the same JSON:API
+    documents, paginated in keyset mode on (created_at, id) in descending creation
+    order.
+    """
+
+    queryset = Transaction.objects.select_related("wallet").all()
+    serializer_class = TransactionSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = TransactionFilter
+    ordering = ["-created_at"]
+    not_found_exception_class = TransactionNotFoundError
@@ -1,5 +1,7 @@
 import logging
 
+from django.conf import settings
+
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework.filters import OrderingFilter
@@ -12,7 +14,7 @@ from apps.account.api.v1.serializers import (
 from apps.account.exceptions import TransactionNotFoundError
 from apps.account.filters import TransactionFilter
 from apps.account.models import Transaction
-from apps.common.constants import StandardResultsSetPagination
+from apps.common.constants import KeysetResultsSetPagination
 from apps.common.mixins import (
     APIHandleExceptionMixin,
     AtomicCreateMixin,
@@ -38,7 +40,8 @@ class TransactionViewSet(
     with JSON:API compliance.
 
     Features:
-      - Supports pagination via StandardResultsSetPagination.
+      - Supports pagination via KeysetResultsSetPagination: page numbers by default,
+        keyset pagination on (created_at, id) when "page[cursor]" is given.
       - Supports filtering through DjangoFilterBackend using TransactionFilter.
       - Supports ordering by 'txid', 'amount', and 'created_at' fields.
       - Defaults ordering by descending creation date.
@@ -54,7 +57,7 @@ class TransactionViewSet(
 
     queryset = Transaction.objects.select_related("wallet").all()
     serializer_class = TransactionSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetResultsSetPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = TransactionFilter
     ordering_fields = ["txid", "amount", "created_at"]
@@ -64,9 +67,9 @@ class TransactionViewSet(
     def get_cache_timeout(self):
         timeout = None
         if self.action == "list":
-            timeout = 40
+            timeout = settings.API_CACHE_LIST_TIMEOUT
         elif self.action == "retrieve":
-            timeout = 10
+            timeout = settings.API_CACHE_RETRIEVE_TIMEOUT
         else:
             timeout = super().get_cache_timeout()
 
@@ -1,8 +1,14 @@
+import hashlib
+import json
 import logging
 from decimal import Decimal
 
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
@@ -10,17 +16,30 @@ from rest_framework.response import Response
 from rest_framework_json_api.views import ModelViewSet
 
 from apps.account.api.v1.serializers import (
+    BulkDepositAttributesSerializer,
+    BulkDepositRequestSerializer,
+    BulkDepositResultSerializer,
     DepositRequestSerializer,
     TransactionSerializer,
+    TransferBatchAttributesSerializer,
+    TransferBatchRequestSerializer,
     TransferRequestSerializer,
     WalletCreateUpdateSerializer,
     WalletSerializer,
 )
 from apps.account.exceptions import WalletNotFoundError
-from apps.account.filters import WalletFilter
-from apps.account.models import Wallet
-from apps.account.services import WalletService
-from apps.common.constants import StandardResultsSetPagination
+from apps.account.filters import TransactionFilter, WalletFilter
+from apps.account.models import Transaction, Wallet
+from apps.account.services import (
+    IdempotencyService,
+    TransactionExportService,
+    WalletService,
+)
+from apps.common.constants import (
+    BULK_OPERATION_MAX_BODY_SIZE,
+    KeysetResultsSetPagination,
+)
+from apps.common.exceptions import ValidationError
 from apps.common.mixins import (
     APIHandleExceptionMixin,
     AtomicCreateMixin,
@@ -32,6 +51,19 @@ from apps.common.mixins import (
 
 logger = logging.getLogger(__name__)
 
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    name=IDEMPOTENCY_KEY_HEADER,
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description=(
+        "Unique key of the request. Retrying with the same key returns the stored "
+        "response instead of applying the operation again."
+    ),
+)
+
 
 class WalletViewSet(
     SoftDeleteSafeObjectMixin,
@@ -46,7 +78,8 @@ class WalletViewSet(
 
     Features:
       - Supports standard CRUD operations with pagination and filtering.
-      - Pagination uses StandardResultsSetPagination.
+      - Pagination uses KeysetResultsSetPagination: page numbers by default,
+        keyset pagination on (created_at, id) when "page[cursor]" is given.
       - Filtering via DjangoFilterBackend with WalletFilter.
       - Ordering available on 'label', 'created_at', and 'updated_at' fields.
       - Default ordering is by creation date ascending.
@@ -60,23 +93,39 @@ class WalletViewSet(
       - transfer: POST to transfer funds between two wallets by specifying
         "source_wallet", "destination_wallet", and "amount" in the request body.
         Uses WalletService.transfer and returns status message.
+      - deposit and transfer accept an optional "Idempotency-Key" header; a retried
+        request with the same key replays the stored response via IdempotencyService.
+      - transfer_batch: POST to /transfers/batch/ to apply many transfers atomically by
+        specifying "transfers" (source_wallet, destination_wallet, amount). Uses
+        WalletService.transfer_many and returns the updated wallets.
+      - export_transactions: GET to /{id}/transactions/export/ to stream the wallet's
+        transaction history as NDJSON or CSV ("export_format"), optionally limited by
+        "created_at_min" / "created_at_max". Uses TransactionExportService.
+      - bulk_deposit: POST to apply many deposits or withdrawals in one request by
+        specifying "items" (wallet, amount, optional txid) and a "mode" ("atomic" or
+        "best_effort"). Uses WalletService.apply_cash_flows_bulk and returns a
+        per-item result.
+      - Request bodies are limited to DATA_UPLOAD_MAX_MEMORY_SIZE, except for
+        bulk_deposit and transfer_batch, which accept BULK_OPERATION_MAX_BODY_SIZE.
     """
 
     queryset = Wallet.objects.all()
     serializer_class = WalletSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = KeysetResultsSetPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = WalletFilter
     ordering_fields = ["label", "created_at", "updated_at"]
     ordering = ["created_at"]
     not_found_exception_class = WalletNotFoundError
+    # Request body limit of SizeLimitedJSONParser; raised by the bulk actions.
+    max_body_size = None
 
     def get_cache_timeout(self):
         timeout = None
         if self.action == "list":
-            timeout = 40
+            timeout = settings.API_CACHE_LIST_TIMEOUT
         elif self.action == "retrieve":
-            timeout = 10
+            timeout = settings.API_CACHE_RETRIEVE_TIMEOUT
         else:
             timeout = super().get_cache_timeout()
 
@@ -105,11 +154,17 @@ class WalletViewSet(
         request=DepositRequestSerializer,
         responses={200: TransactionSerializer},
         description="Deposit or withdraw funds on a specific wallet by amount.",
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         methods=["POST"],
         tags=["account"],
     )
     @action(detail=True, methods=["post"])
     def deposit(self, request, pk=None):
+        return self._run_idempotent(
+            request, "wallets.deposit", lambda: self._apply_deposit(request, pk)
+        )
+
+    def _apply_deposit(self, request, pk):
         amount = Decimal(request.data.get("amount"))
         logger.info(f"Deposit request data: {request.data}")
         transaction = WalletService.apply_cash_flow(wallet_id=pk, amount=amount)
@@ -128,11 +183,17 @@ class WalletViewSet(
         request=TransferRequestSerializer,
         responses={200: WalletSerializer(many=True)},
         description="Transfer funds between two wallets atomically.",
+        parameters=[IDEMPOTENCY_KEY_PARAMETER],
         methods=["POST"],
         tags=["account"],
     )
     @action(detail=False, methods=["post"])
     def transfer(self, request):
+        return self._run_idempotent(
+            request, "wallets.transfer", lambda: self._apply_transfer(request)
+        )
+
+    def _apply_transfer(self, request):
         source_wallet_id = request.data.get("source_wallet")
         dest_wallet_id = request.data.get("destination_wallet")
         amount = Decimal(request.data.get("amount"))
@@ -158,3 +219,185 @@ class WalletViewSet(
             "message": "Transfer has been completed",
         }
         return Response(response_data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        request=TransferBatchRequestSerializer,
+        responses={200: WalletSerializer(many=True)},
+        description="Apply a batch of transfers between wallets atomically.",
+        methods=["POST"],
+        tags=["account"],
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="transfers/batch",
+        url_name="transfer-batch",
+        max_body_size=BULK_OPERATION_MAX_BODY_SIZE,
+    )
+    def transfer_batch(self, request):
+        serializer = TransferBatchAttributesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        transfers = [
+            {
+                "source_id": transfer["source_wallet"],
+                "dest_id": transfer["destination_wallet"],
+                "amount": transfer["amount"],
+            }
+            for transfer in serializer.validated_data["transfers"]
+        ]
+        logger.info(f"Transfer batch requested: transfers={len(transfers)}")
+
+        wallets = WalletService.transfer_many(transfers)
+        logger.info(f"Transfer batch completed: transfers={len(transfers)}, wallets={len(wallets)}")
+
+        serializer = WalletSerializer(wallets, many=True)
+        response_data = {
+            "data": serializer.data,
+            "message": "Transfer batch has been completed",
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        request=BulkDepositRequestSerializer,
+        responses={
+            200: BulkDepositResultSerializer(many=True),
+            400: BulkDepositResultSerializer(many=True),
+        },
+        description=(
+            "Apply many deposits or withdrawals in one request. In 'atomic' mode nothing is "
+            "written if any item fails; in 'best_effort' mode every valid item is applied."
+        ),
+        methods=["POST"],
+        tags=["account"],
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-deposit",
+        max_body_size=BULK_OPERATION_MAX_BODY_SIZE,
+    )
+    def bulk_deposit(self, request):
+        serializer = BulkDepositAttributesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        mode = serializer.validated_data["mode"]
+        items = [
+            {"wallet_id": item["wallet"], "amount": item["amount"], "txid": item.get("txid")}
+            for item in serializer.validated_data["items"]
+        ]
+        logger.info(f"Bulk deposit requested: items={len(items)}, mode={mode}")
+
+        atomic = mode == BulkDepositAttributesSerializer.MODE_ATOMIC
+        results = WalletService.apply_cash_flows_bulk(items, atomic=atomic)
+
+        applied = sum(1 for result in results if result["status"] == "applied")
+        failed = sum(1 for result in results if result["status"] == "failed")
+        logger.info(f"Bulk deposit completed: applied={applied}, failed={failed}")
+
+        rejected = atomic and failed > 0
+        response_data = {
+            "data": [{**result, "amount": str(result["amount"])} for result in results],
+            "message": (
+                "Bulk deposit has been rejected" if rejected else "Bulk deposit has been completed"
+            ),
+            "applied": applied,
+            "failed": failed,
+        }
+        return Response(
+            response_data,
+            status=status.HTTP_400_BAD_REQUEST if rejected else status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                type=OpenApiTypes.STR,
+                enum=list(TransactionExportService.CONTENT_TYPES),
+                default=TransactionExportService.FORMAT_NDJSON,
+                description="Export format.",
+            ),
+            OpenApiParameter(
+                name="created_at_min",
+                type=OpenApiTypes.DATETIME,
+                description="Export transactions created at or after this datetime.",
+            ),
+            OpenApiParameter(
+                name="created_at_max",
+                type=OpenApiTypes.DATETIME,
+                description="Export transactions created before this datetime.",
+            ),
+        ],
+        responses={
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
+        description="Stream the full transaction history of a wallet as NDJSON or CSV.",
+        methods=["GET"],
+        tags=["account"],
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="transactions/export",
+        url_name="transactions-export",
+    )
+    def export_transactions(self, request, pk=None):
+        export_format = request.query_params.get(
+            "export_format", TransactionExportService.FORMAT_NDJSON
+        )
+        content_type = TransactionExportService.get_content_type(export_format)
+        wallet = self.get_object()
+
+        filterset = TransactionFilter(
+            request.query_params, queryset=Transaction.objects.filter(wallet_id=wallet.pk)
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        logger.info(f"Transaction export requested: wallet_id={wallet.pk}, format={export_format}")
+        response = StreamingHttpResponse(
+            TransactionExportService.stream(filterset.qs, export_format),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="wallet-{wallet.pk}-transactions.{export_format}"'
+        )
+        return response
+
+    def _run_idempotent(self, request, scope, handler):
+        """
+        Runs the action handler at most once per `Idempotency-Key` header value.
+
+        Without the header the handler runs as usual. With it, the rendered response is
+        stored through IdempotencyService and replayed for retries with the same key;
+        the `Idempotent-Replayed` response header tells whether it was replayed.
+        """
+        key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if not key:
+            return handler()
+        if len(key) > 255:
+            raise ValidationError(f"{IDEMPOTENCY_KEY_HEADER} must be at most 255 characters.")
+
+        fingerprint = hashlib.sha256(
+            json.dumps(
+                [request.method, request.path, request.data], sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()
+
+        def render():
+            response = self.finalize_response(request, handler())
+            response.render()
+            return {
+                "status_code": response.status_code,
+                "content": response.content.decode(),
+                "content_type": response["Content-Type"],
+            }
+
+        outcome = IdempotencyService.execute(key, scope, fingerprint, render)
+        response = HttpResponse(
+            outcome["content"],
+            status=outcome["status_code"],
+            content_type=outcome["content_type"],
+        )
+        response["Idempotent-Replayed"] = "true" if outcome["replayed"] else "false"
+        return response
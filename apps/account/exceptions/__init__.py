@@ -1,2 +1,3 @@
+from apps.account.exceptions.idempotency import IdempotencyKeyConflictError
 from apps.account.exceptions.transaction import TransactionNotFoundError
 from apps.account.exceptions.wallet import SameWalletException, WalletNotFoundError
@@ -0,0 +1,21 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class IdempotencyKeyConflictError(APIException):
+    """
+    JSON:API-compliant exception raised when an idempotency key is reused
+    with a different request.
+
+    Returns HTTP 422 so the client can tell a key collision from a replayed response.
+    """
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_code = "idempotency_key_conflict"
+
+    def __init__(self, key=None, *args, **kwargs):
+        detail = {
+            "detail": f"Idempotency key was already used with a different request: {key}",
+        }
+
+        super().__init__(detail=detail, *args, **kwargs)
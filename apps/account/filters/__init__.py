@@ -1,2 +1,3 @@
+from apps.account.filters.archive import ArchivedTransactionFilter
 from apps.account.filters.transaction import TransactionFilter
 from apps.account.filters.wallet import WalletFilter
@@ -0,0 +1,28 @@
+from django_filters import rest_framework as filters
+
+from apps.account.models import ArchivedTransaction
+
+
+class ArchivedTransactionFilter(filters.FilterSet):
+    """
+    FilterSet for archived transactions, limited to filters served by the archive
+    table's indexes or its unique txid constraint.
+
+    Filters:
+      - wallet: Filters archived transactions by the UUID of the related wallet.
+      - txid_exact: Exact match on transaction ID.
+      - created_at_min: Filters transactions created at or after this datetime.
+      - created_at_max: Filters transactions created before this datetime.
+
+    Meta:
+      Specifies the model and exposed filter fields.
+    """
+
+    wallet = filters.UUIDFilter(field_name="wallet_id")
+    txid_exact = filters.CharFilter(field_name="txid", lookup_expr="exact")
+    created_at_min = filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+    created_at_max = filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
+
+    class Meta:
+        model = ArchivedTransaction
+        fields = ["wallet", "txid_exact", "created_at_min", "created_at_max"]
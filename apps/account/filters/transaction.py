@@ -6,13 +6,19 @@ from apps.account.models import Transaction
 class TransactionFilter(filters.FilterSet):
     """
     FilterSet for the Transaction model enabling filtering based on wallet,
-    transaction ID substring matching, and amount range.
+    transaction ID matching, and amount range.
 
     Filters:
       - wallet: Filters transactions by the UUID of the related wallet.
-      - txid: Case-insensitive partial match on transaction ID.
+      - txid: Case-insensitive partial match on transaction ID. Served by the optional
+        pg_trgm index on PostgreSQL, a full scan otherwise.
+      - txid_exact: Exact match on transaction ID, served by its unique index.
+      - txid_prefix: Case-sensitive prefix match on transaction ID, served by its
+        `varchar_pattern_ops` index on PostgreSQL.
       - amount_min: Filters transactions with amount greater than or equal to this value.
       - amount_max: Filters transactions with amount less than or equal to this value.
+      - created_at_min: Filters transactions created at or after this datetime.
+      - created_at_max: Filters transactions created before this datetime.
 
     Meta:
       Specifies the model and exposed filter fields.
@@ -20,9 +26,22 @@ class TransactionFilter(filters.FilterSet):
 
     wallet = filters.UUIDFilter(field_name="wallet__id")
     txid = filters.CharFilter(field_name="txid", lookup_expr="icontains")
+    txid_exact = filters.CharFilter(field_name="txid", lookup_expr="exact")
+    txid_prefix = filters.CharFilter(field_name="txid", lookup_expr="startswith")
     amount_min = filters.NumberFilter(field_name="amount", lookup_expr="gte")
     amount_max = filters.NumberFilter(field_name="amount", lookup_expr="lte")
+    created_at_min = filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+    created_at_max = filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
 
     class Meta:
         model = Transaction
-        fields = ["wallet", "txid", "amount_min", "amount_max"]
+        fields = [
+            "wallet",
+            "txid",
+            "txid_exact",
+            "txid_prefix",
+            "amount_min",
+            "amount_max",
+            "created_at_min",
+            "created_at_max",
+        ]
@@ -6,17 +6,23 @@ from apps.account.models import Wallet
 class WalletFilter(filters.FilterSet):
     """
     FilterSet for the Wallet model allowing filtering by label with case-insensitive
-    partial matching.
+    partial matching, exact matching or prefix matching.
 
     Filters:
-      - label: Case-insensitive containment search on the wallet label.
+      - label: Case-insensitive containment search on the wallet label. Served by the
+        optional pg_trgm index on PostgreSQL, a full scan otherwise.
+      - label_exact: Exact match on the wallet label, served by its index.
+      - label_prefix: Case-sensitive prefix match on the wallet label, served by its
+        `varchar_pattern_ops` index on PostgreSQL.
 
     Meta:
       Specifies the model and exposed filter fields.
     """
 
     label = filters.CharFilter(field_name="label", lookup_expr="icontains")
+    label_exact = filters.CharFilter(field_name="label", lookup_expr="exact")
+    label_prefix = filters.CharFilter(field_name="label", lookup_expr="startswith")
 
     class Meta:
         model = Wallet
-        fields = ["label"]
+        fields = ["label", "label_exact", "label_prefix"]
@@ -0,0 +1,52 @@
+from datetime import date, datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.account.services import TransactionArchiveService
+from apps.common.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """
+    Moves transactions created before a date into the archive table.
+
+    The archived transactions of every wallet are replaced by one carry-forward
+    transaction dated at the cutoff, so wallet balances and ledger sums are unchanged.
+    Archived transactions stay readable through the `/archived-transactions/` endpoint.
+    With a partitioned transaction table, archiving up to the first day of a month
+    empties the older partitions, which can then be dropped with
+    `detach_transaction_partitions`.
+
+    Usage:
+        python manage.py archive_transactions --before 2025-01-01
+        python manage.py archive_transactions --before 2025-01-01 --wallet <uuid>
+    """
+
+    help = "Archive transactions created before the given date (UTC) with a balance carry-forward."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            type=date.fromisoformat,
+            required=True,
+            help="Archive transactions created before this date, at 00:00 UTC (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--wallet",
+            action="append",
+            dest="wallet_ids",
+            help="Restrict archiving to the given wallet UUID (can be repeated).",
+        )
+
+    def handle(self, *args, **options):
+        before = datetime.combine(options["before"], datetime.min.time(), tzinfo=timezone.utc)
+        try:
+            result = TransactionArchiveService.archive(before, wallet_ids=options["wallet_ids"])
+        except ValidationError as e:
+            raise CommandError(str(e.detail))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {result['archived']} transaction(s) of {result['wallets']} wallet(s)."
+            )
+        )
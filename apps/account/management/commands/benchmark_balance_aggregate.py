@@ -0,0 +1,158 @@
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.account.models import Transaction, Wallet
+from apps.account.services import TransactionService
+from apps.common.constants import BULK_OPERATION_BATCH_SIZE
+
+
+COVERING_INDEX_FIELDS = ["wallet"]
+
+
+class Command(BaseCommand):
+    """
+    Benchmarks the ledger balance aggregate with and without the covering index.
+
+    For every size given in `--sizes`, a temporary wallet with that many transactions
+    is created. The aggregate issued by `Wallet.calculate_ledger_balance` (without
+    checkpoints) is then timed twice:
+      - "before": with the covering index `(wallet_id) INCLUDE (amount) WHERE NOT
+        is_deleted` dropped;
+      - "after": with it in place.
+
+    The median latency of each is printed. On PostgreSQL the tables are vacuumed
+    before measuring, so the visibility map allows index-only scans. The temporary
+    wallets are deleted and the index is restored afterwards.
+
+    Drops an index of the transaction table while running: do not run it against a
+    production database.
+
+    Usage:
+        python manage.py benchmark_balance_aggregate
+        python manage.py benchmark_balance_aggregate --sizes 1000 100000 1000000 --explain
+    """
+
+    help = "Benchmark the wallet ledger balance aggregate before and after the covering index."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[100, 1_000, 10_000, 100_000],
+            help="Transactions per wallet to benchmark (default: 100 1000 10000 100000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of timed aggregate queries per measurement (default: 20).",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print the query plan of the aggregate for the largest wallet.",
+        )
+
+    def handle(self, *args, **options):
+        index = self._get_covering_index()
+        repeat = max(options["repeat"], 1)
+        sizes = sorted(set(options["sizes"]))
+
+        wallets = [self._create_wallet(size) for size in sizes]
+        index_dropped = False
+        try:
+            self._vacuum()
+            after = [self._measure(wallet, repeat) for wallet in wallets]
+            if options["explain"]:
+                self._explain(wallets[-1], "after")
+
+            with connection.schema_editor() as schema_editor:
+                schema_editor.remove_index(Transaction, index)
+            index_dropped = True
+            self._vacuum()
+            before = [self._measure(wallet, repeat) for wallet in wallets]
+            if options["explain"]:
+                self._explain(wallets[-1], "before")
+        finally:
+            if index_dropped:
+                with connection.schema_editor() as schema_editor:
+                    schema_editor.add_index(Transaction, index)
+            Wallet.all_objects.filter(pk__in=[wallet.pk for wallet in wallets]).delete()
+
+        self.stdout.write(f"{'transactions':>12} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+        for size, before_ms, after_ms in zip(sizes, before, after):
+            speedup = before_ms / after_ms if after_ms else float("inf")
+            self.stdout.write(f"{size:>12} {before_ms:>10.3f} {after_ms:>10.3f} {speedup:>7.1f}x")
+
+    @staticmethod
+    def _get_covering_index():
+        """
+        Returns the covering balance index declared by Transaction.
+
+        Raises:
+            CommandError: If the model does not declare it.
+        """
+        for index in Transaction._meta.indexes:
+            if index.fields == COVERING_INDEX_FIELDS and index.include:
+                return index
+        raise CommandError("Transaction does not declare the covering balance index.")
+
+    @staticmethod
+    def _create_wallet(size: int) -> Wallet:
+        """
+        Creates a temporary wallet with `size` transactions of amount 1.
+        """
+        wallet = Wallet.objects.create(label=f"benchmark-{size}")
+        Transaction.objects.bulk_create(
+            (
+                Transaction(
+                    wallet=wallet, txid=TransactionService.generate_txid(), amount=Decimal("1")
+                )
+                for _ in range(size)
+            ),
+            batch_size=BULK_OPERATION_BATCH_SIZE,
+        )
+        Wallet.all_objects.filter(pk=wallet.pk).update(balance=Decimal(size))
+        return wallet
+
+    @staticmethod
+    def _measure(wallet: Wallet, repeat: int) -> float:
+        """
+        Returns the median latency in milliseconds of the full ledger aggregate.
+        """
+        wallet.calculate_ledger_balance(use_checkpoint=False)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            wallet.calculate_ledger_balance(use_checkpoint=False)
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    @staticmethod
+    def _vacuum():
+        """
+        Updates statistics and the visibility map so index-only scans can be used.
+        """
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'VACUUM ANALYZE "{Transaction._meta.db_table}"')
+
+    def _explain(self, wallet: Wallet, label: str):
+        """
+        Prints the query plan of the exact aggregate query issued for the wallet.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            wallet.calculate_ledger_balance(use_checkpoint=False)
+        sql = queries[-1]["sql"]
+        prefix = "EXPLAIN ANALYZE" if connection.vendor == "postgresql" else "EXPLAIN QUERY PLAN"
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}")
+            plan = "\n".join(" ".join(str(col) for col in row) for row in cursor.fetchall())
+        self.stdout.write(f"Query plan {label} ({wallet.label}):\n{sql}\n{plan}\n")
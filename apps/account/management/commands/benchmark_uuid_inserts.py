@@ -0,0 +1,150 @@
+import io
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from apps.account.models import Transaction
+from apps.common.identifiers import UUID_GENERATORS
+
+
+class Command(BaseCommand):
+    """
+    Benchmarks Transaction insert throughput and index size per UUID generator.
+
+    For every generator in `--generators`, a scratch table is created with the columns
+    and indexes of the transaction table (`LIKE ... INCLUDING DEFAULTS INCLUDING
+    INDEXES`, without foreign keys) and `--rows` rows are loaded into it with COPY in
+    batches of `--batch-size`. Ids and txids come from the generator, wallet ids from a
+    pool of `--wallets` ids. The overall and final batch insert rates are printed along
+    with the table, primary key and total index sizes. Random `uuid4` keys spread
+    inserts over the whole primary key btree, so their rate drops once it no longer
+    fits in shared buffers, while `uuid7` keys keep appending to its right edge.
+
+    The scratch tables are dropped afterwards. Requires PostgreSQL.
+
+    Usage:
+        python manage.py benchmark_uuid_inserts
+        python manage.py benchmark_uuid_inserts --rows 1000000 --generators uuid4 uuid7
+    """
+
+    help = "Benchmark transaction insert throughput and index size with uuid4 and uuid7 keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=10_000_000,
+            help="Rows to insert per generator (default: 10000000).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100_000,
+            help="Rows per COPY batch (default: 100000).",
+        )
+        parser.add_argument(
+            "--wallets",
+            type=int,
+            default=1_000,
+            help="Number of distinct wallet ids the rows are spread over (default: 1000).",
+        )
+        parser.add_argument(
+            "--generators",
+            nargs="+",
+            choices=list(UUID_GENERATORS),
+            default=list(UUID_GENERATORS),
+            help="UUID generators to benchmark (default: all).",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("benchmark_uuid_inserts requires PostgreSQL.")
+
+        rows = max(options["rows"], 1)
+        batch_size = max(options["batch_size"], 1)
+
+        self.stdout.write(
+            f"{'generator':>9} {'rows/s':>10} {'last rows/s':>12} "
+            f"{'table MB':>9} {'pkey MB':>8} {'indexes MB':>11}"
+        )
+        for name in options["generators"]:
+            result = self._benchmark(name, rows, batch_size, max(options["wallets"], 1))
+            self.stdout.write(
+                f"{name:>9} {result['rate']:>10.0f} {result['last_rate']:>12.0f} "
+                f"{result['table_mb']:>9.1f} {result['pkey_mb']:>8.1f} "
+                f"{result['indexes_mb']:>11.1f}"
+            )
+
+    def _benchmark(self, name: str, rows: int, batch_size: int, wallets: int) -> dict:
+        """
+        Loads `rows` rows keyed by the named generator into a scratch table.
+
+        Returns:
+            dict: Overall and final batch rows per second, and table, primary key and
+            total index sizes in megabytes.
+        """
+        generator = UUID_GENERATORS[name]
+        source = connection.ops.quote_name(Transaction._meta.db_table)
+        table = f"benchmark_uuid_{name}"
+        wallet_ids = [generator() for _ in range(wallets)]
+        started_at = timezone.now()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+            cursor.execute(
+                f'CREATE TABLE "{table}" (LIKE {source} INCLUDING DEFAULTS INCLUDING INDEXES)'
+            )
+            try:
+                elapsed, last_rate = 0.0, 0.0
+                for offset in range(0, rows, batch_size):
+                    count = min(batch_size, rows - offset)
+                    buffer = self._build_batch(generator, wallet_ids, started_at, offset, count)
+                    batch_started = time.perf_counter()
+                    cursor.cursor.copy_expert(
+                        f'COPY "{table}" (id, is_deleted, created_at, updated_at, '
+                        f"wallet_id, txid, amount) FROM STDIN WITH (FORMAT csv)",
+                        buffer,
+                    )
+                    batch_elapsed = time.perf_counter() - batch_started
+                    elapsed += batch_elapsed
+                    last_rate = count / batch_elapsed if batch_elapsed else 0.0
+                    self.stderr.write(f"{name}: {offset + count}/{rows} rows", ending="\r")
+                self.stderr.write("")
+
+                cursor.execute(
+                    "SELECT pg_relation_size(%s::regclass), pg_indexes_size(%s::regclass), "
+                    "pg_relation_size(%s::regclass)",
+                    [f'"{table}"', f'"{table}"', f'"{table}_pkey"'],
+                )
+                table_size, indexes_size, pkey_size = cursor.fetchone()
+            finally:
+                cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+
+        return {
+            "rate": rows / elapsed if elapsed else 0.0,
+            "last_rate": last_rate,
+            "table_mb": table_size / 2**20,
+            "pkey_mb": pkey_size / 2**20,
+            "indexes_mb": indexes_size / 2**20,
+        }
+
+    @staticmethod
+    def _build_batch(generator, wallet_ids: list, started_at, offset: int, count: int):
+        """
+        Returns a CSV buffer of `count` transaction rows for COPY.
+
+        Rows are one microsecond apart starting from `started_at`, so `created_at`
+        follows insertion order as it does in production.
+        """
+        buffer = io.StringIO()
+        for number in range(offset, offset + count):
+            created_at = (started_at + timedelta(microseconds=number)).isoformat()
+            buffer.write(
+                f"{generator()},f,{created_at},{created_at},"
+                f"{wallet_ids[number % len(wallet_ids)]},{generator().hex},1\n"
+            )
+        buffer.seek(0)
+        return buffer
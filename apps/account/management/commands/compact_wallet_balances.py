@@ -0,0 +1,154 @@
+import logging
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction as db_transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from apps.account.models import Wallet, WalletBalanceCheckpoint
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Writes wallet balance checkpoints so ledger balance reads only sum recent transactions.
+
+    For every wallet with at least `--min-transactions` transactions after its latest
+    checkpoint, a new checkpoint is written covering the transactions older than `--lag`
+    seconds. The lag keeps in-flight transactions, whose `created_at` is assigned before
+    they commit, out of the checkpoint. Meant to be run periodically (e.g. from cron).
+
+    With `--verify`, no checkpoints are written: the checkpoint + tail balance of every
+    wallet is compared with the full ledger sum and the command fails on mismatch.
+
+    Usage:
+        python manage.py compact_wallet_balances
+        python manage.py compact_wallet_balances --min-transactions 10000 --lag 300
+        python manage.py compact_wallet_balances --verify
+    """
+
+    help = "Write wallet balance checkpoints, or verify them against the full ledger."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lag",
+            type=int,
+            default=60,
+            help="Only checkpoint transactions older than this many seconds (default: 60).",
+        )
+        parser.add_argument(
+            "--min-transactions",
+            type=int,
+            default=1000,
+            help="Minimum number of new transactions to write a checkpoint (default: 1000).",
+        )
+        parser.add_argument(
+            "--wallet",
+            action="append",
+            dest="wallet_ids",
+            help="Restrict the run to the given wallet UUID (can be repeated).",
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Verify checkpoint + tail balances against the full ledger sum.",
+        )
+
+    def handle(self, *args, **options):
+        wallet_ids = Wallet.all_objects.order_by("id").values_list("id", flat=True)
+        if options["wallet_ids"]:
+            wallet_ids = wallet_ids.filter(id__in=options["wallet_ids"])
+
+        if options["verify"]:
+            self._verify(list(wallet_ids))
+            return
+
+        horizon = timezone.now() - timedelta(seconds=options["lag"])
+        min_transactions = max(options["min_transactions"], 1)
+
+        written = 0
+        for wallet_id in list(wallet_ids):
+            with db_transaction.atomic():
+                wallet = Wallet.all_objects.select_for_update().get(pk=wallet_id)
+                checkpoint = self._compact(wallet, horizon, min_transactions)
+            if checkpoint is not None:
+                written += 1
+                logger.info(
+                    f"Balance checkpoint written: wallet_id={wallet_id}, "
+                    f"balance={checkpoint.balance}, transactions={checkpoint.transaction_count}"
+                )
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} balance checkpoint(s)."))
+
+    @staticmethod
+    def _compact(wallet: Wallet, horizon, min_transactions: int):
+        """
+        Writes a checkpoint for the wallet covering its transactions up to `horizon`.
+
+        Returns:
+            WalletBalanceCheckpoint | None: The new checkpoint, or None if fewer than
+            `min_transactions` transactions were added since the latest one.
+        """
+        latest = WalletBalanceCheckpoint.get_latest(wallet.pk)
+        tail = wallet.transactions.filter(created_at__lte=horizon)
+        balance, count = Decimal("0"), 0
+        if latest is not None:
+            tail = tail.filter(latest.tail_filter())
+            balance, count = latest.balance, latest.transaction_count
+
+        last = tail.order_by("-created_at", "-id").values("created_at", "id").first()
+        if last is None:
+            return None
+
+        covered = tail.filter(
+            Q(created_at__lt=last["created_at"])
+            | Q(created_at=last["created_at"], id__lte=last["id"])
+        )
+        agg = covered.aggregate(total=Sum("amount"), count=Count("id"))
+        if agg["count"] < min_transactions:
+            return None
+
+        return WalletBalanceCheckpoint.objects.create(
+            wallet=wallet,
+            last_transaction_created_at=last["created_at"],
+            last_transaction_id=last["id"],
+            balance=balance + (agg["total"] or Decimal("0")),
+            transaction_count=count + agg["count"],
+        )
+
+    def _verify(self, wallet_ids):
+        """
+        Compares the checkpoint + tail balance with the full ledger sum for each wallet.
+
+        Raises:
+            CommandError: If any wallet balance does not match.
+        """
+        mismatched = 0
+        for wallet_id in wallet_ids:
+            with db_transaction.atomic():
+                wallet = Wallet.all_objects.select_for_update().get(pk=wallet_id)
+                checkpoint_balance = wallet.calculate_ledger_balance()
+                full_balance = wallet.calculate_ledger_balance(use_checkpoint=False)
+
+            if checkpoint_balance != full_balance:
+                mismatched += 1
+                logger.warning(
+                    f"Balance checkpoint mismatch: wallet_id={wallet_id}, "
+                    f"checkpoint={checkpoint_balance}, ledger={full_balance}"
+                )
+                self.stdout.write(
+                    f"{wallet_id}: checkpoint={checkpoint_balance} ledger={full_balance}"
+                )
+
+        if mismatched:
+            raise CommandError(
+                f"{mismatched} of {len(wallet_ids)} wallet(s) have a stale balance checkpoint."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Verified balance checkpoints of {len(wallet_ids)} wallet(s).")
+        )
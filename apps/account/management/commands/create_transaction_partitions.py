@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.account.services import TransactionPartitionService
+from apps.common.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """
+    Creates the monthly partitions of the transaction table for the coming months.
+
+    Inserts into a month without a partition go to the default partition, so this
+    should run well before the last existing partition runs out (e.g. daily from cron).
+    Transactions found in the default partition are moved to the created partitions
+    and reported as a warning. Creating a partition that already exists is a no-op.
+    Requires a partitioned transaction table (see `partition_transactions`).
+
+    Usage:
+        python manage.py create_transaction_partitions
+        python manage.py create_transaction_partitions --months-ahead 12
+    """
+
+    help = "Create monthly transaction partitions up to the given number of months ahead."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.TRANSACTION_PARTITION_MONTHS_AHEAD,
+            help="Future months to create partitions for "
+            "(default: TRANSACTION_PARTITION_MONTHS_AHEAD).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            misplaced = TransactionPartitionService.count_default_rows()
+            created = TransactionPartitionService.create_partitions(options["months_ahead"])
+        except ValidationError as e:
+            raise CommandError(str(e.detail))
+
+        if misplaced:
+            self.stderr.write(
+                self.style.WARNING(
+                    f"{misplaced} transaction(s) were in the default partition: "
+                    f"partitions were not created ahead of time."
+                )
+            )
+
+        for name in created:
+            self.stdout.write(name)
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} transaction partition(s)."))
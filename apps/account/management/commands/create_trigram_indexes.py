@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from apps.account.services import TrigramIndexService
+from apps.common.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """
+    Creates the pg_trgm GIN indexes serving substring search on transaction IDs and
+    wallet labels, or drops them.
+
+    Migration 0006 only creates them when DB_TRIGRAM_INDEXES is enabled while it is
+    applied; this command adds them to a database migrated without it. The indexes are
+    built concurrently, so writes are not blocked. Creating the pg_trgm extension
+    requires the CREATE privilege on the database. Requires PostgreSQL.
+
+    Usage:
+        python manage.py create_trigram_indexes
+        python manage.py create_trigram_indexes --drop
+    """
+
+    help = "Create the pg_trgm substring search indexes (--drop removes them)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the trigram indexes instead.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options["drop"]:
+                names = TrigramIndexService.drop_indexes()
+            else:
+                names = TrigramIndexService.create_indexes(concurrently=True)
+        except ValidationError as e:
+            raise CommandError(str(e.detail))
+        except DatabaseError as e:
+            raise CommandError(f"Could not update the trigram indexes: {e}")
+
+        for name in names:
+            self.stdout.write(name)
+        action = "Dropped" if options["drop"] else "Created"
+        self.stdout.write(self.style.SUCCESS(f"{action} {len(names)} trigram index(es)."))
@@ -0,0 +1,49 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.account.services import TransactionPartitionService
+from apps.common.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """
+    Detaches the transaction partitions of the months before `--before`.
+
+    Partitions are detached concurrently, so the current partitions stay readable and
+    writable, and are kept as standalone tables unless `--drop` is given. Partitions
+    still holding live (not soft-deleted) transactions are refused, as detaching them
+    would change wallet ledger balances.
+
+    Usage:
+        python manage.py detach_transaction_partitions --before 2025-01-01
+        python manage.py detach_transaction_partitions --before 2025-01-01 --drop
+    """
+
+    help = "Detach (and optionally drop) transaction partitions older than the given month."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            type=date.fromisoformat,
+            required=True,
+            help="Detach partitions ending on or before the first day of this month "
+            "(YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the detached partition tables.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            detached = TransactionPartitionService.detach_partitions(
+                options["before"], drop=options["drop"]
+            )
+        except ValidationError as e:
+            raise CommandError(str(e.detail))
+
+        for name in detached:
+            self.stdout.write(name)
+        self.stdout.write(self.style.SUCCESS(f"Detached {len(detached)} transaction partition(s)."))
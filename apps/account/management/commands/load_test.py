@@ -0,0 +1,174 @@
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from urllib.parse import urljoin, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+DEFAULT_PATHS = [
+    "/api/v1/healthcheck/healthz/",
+    "/api/v1/account/wallets/",
+    "/api/v1/account/transactions/?page[count]=false",
+]
+
+
+class Command(BaseCommand):
+    """
+    Load tests a running server with concurrent keep-alive HTTP clients.
+
+    Each of the `--concurrency` client threads keeps one persistent connection, as a
+    reverse proxy would, and reconnects when the server closes it (keepalive timeout or
+    worker recycling). The `--paths` are requested round-robin until `--requests`
+    requests are sent, or for `--duration` seconds. Prints the throughput, the latency
+    percentiles and the response status counts, so server profiles (see
+    `config/gunicorn.py`) can be compared against the same deployment.
+
+    Usage:
+        python manage.py load_test --url http://localhost:8000
+        python manage.py load_test --url http://localhost:8000 --concurrency 64 --duration 30
+    """
+
+    help = "Load test a running server and report throughput and latency percentiles."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url", default="http://localhost:8000", help="Base URL of the server."
+        )
+        parser.add_argument(
+            "--paths",
+            nargs="+",
+            default=DEFAULT_PATHS,
+            help="Paths requested round-robin (default: healthcheck, wallets, transactions).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="Number of concurrent clients (default: 16).",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=1000,
+            help="Total number of requests, ignored with --duration (default: 1000).",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=None,
+            help="Run for this many seconds instead of a fixed number of requests.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=10,
+            help="Timeout of a single request in seconds (default: 10).",
+        )
+
+    def handle(self, *args, **options):
+        base = urlsplit(options["url"])
+        if base.scheme not in ("http", "https") or not base.netloc:
+            raise CommandError(f"Invalid --url: {options['url']}")
+        concurrency = max(options["concurrency"], 1)
+        targets = [urljoin(options["url"], path) for path in options["paths"]]
+
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._limit = None if options["duration"] else max(options["requests"], 1)
+        self._deadline = None
+        self._latencies = []
+        self._statuses = Counter()
+        self._connects = 0
+
+        started = time.perf_counter()
+        if options["duration"]:
+            self._deadline = started + options["duration"]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(self._run_client, base, targets, options["timeout"])
+        elapsed = time.perf_counter() - started
+
+        self._report(elapsed, concurrency)
+
+    def _next_request(self):
+        """
+        Reserves the next request, returning its sequence number, or None when done.
+        """
+        with self._lock:
+            if self._limit is not None and self._sent >= self._limit:
+                return None
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                return None
+            self._sent += 1
+            return self._sent
+
+    def _run_client(self, base, targets: list, timeout: float):
+        """
+        Sends requests over one persistent connection until the run is over.
+        """
+        connection_class = HTTPSConnection if base.scheme == "https" else HTTPConnection
+        connection = None
+        while (sequence := self._next_request()) is not None:
+            target = urlsplit(targets[sequence % len(targets)])
+            path = target.path + (f"?{target.query}" if target.query else "")
+            if connection is None:
+                connection = connection_class(base.netloc, timeout=timeout)
+                with self._lock:
+                    self._connects += 1
+
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path, headers={"Accept": "application/vnd.api+json"})
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+                if response.will_close:
+                    connection.close()
+                    connection = None
+            except (OSError, HTTPException) as e:
+                status = type(e).__name__
+                connection.close()
+                connection = None
+            latency = (time.perf_counter() - started) * 1000
+
+            with self._lock:
+                self._latencies.append(latency)
+                self._statuses[status] += 1
+        if connection is not None:
+            connection.close()
+
+    def _report(self, elapsed: float, concurrency: int):
+        """
+        Prints the throughput, latency percentiles and status counts of the run.
+        """
+        total = len(self._latencies)
+        if not total:
+            raise CommandError("No request was sent.")
+        errors = sum(
+            count
+            for status, count in self._statuses.items()
+            if not isinstance(status, int) or status >= 500
+        )
+        if total > 1:
+            cuts = statistics.quantiles(self._latencies, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = self._latencies[0]
+
+        self.stdout.write(
+            f"requests={total} concurrency={concurrency} connections={self._connects} "
+            f"errors={errors} elapsed={elapsed:.2f}s throughput={total / elapsed:.1f} req/s"
+        )
+        self.stdout.write(
+            f"latency ms: p50={p50:.2f} p95={p95:.2f} p99={p99:.2f} max={max(self._latencies):.2f}"
+        )
+        self.stdout.write(
+            "statuses: "
+            + ", ".join(
+                f"{status}={count}" for status, count in sorted(self._statuses.items(), key=str)
+            )
+        )
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.account.services import TransactionPartitionService
+from apps.common.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """
+    Converts the transaction table into a table range-partitioned by month, or back.
+
+    Migration 0010 only partitions the table when DB_PARTITION_TRANSACTIONS is enabled
+    while it is applied; this command converts a database migrated without it. Every
+    row is copied under an exclusive lock, so plan a maintenance window on large
+    tables. Requires PostgreSQL.
+
+    Usage:
+        python manage.py partition_transactions
+        python manage.py partition_transactions --months-ahead 12
+        python manage.py partition_transactions --undo
+    """
+
+    help = "Partition the transaction table by month (--undo converts it back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.TRANSACTION_PARTITION_MONTHS_AHEAD,
+            help="Future months to create partitions for "
+            "(default: TRANSACTION_PARTITION_MONTHS_AHEAD).",
+        )
+        parser.add_argument(
+            "--undo",
+            action="store_true",
+            help="Convert the partitioned table back into a plain table.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options["undo"]:
+                TransactionPartitionService.unpartition_table()
+                self.stdout.write(self.style.SUCCESS("Transaction table unpartitioned."))
+                return
+            created = TransactionPartitionService.partition_table(options["months_ahead"])
+        except ValidationError as e:
+            raise CommandError(str(e.detail))
+
+        for name in created:
+            self.stdout.write(name)
+        self.stdout.write(
+            self.style.SUCCESS(f"Transaction table partitioned into {len(created)} partition(s).")
+        )
@@ -0,0 +1,40 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.account.models import IdempotencyRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Deletes idempotency records older than the idempotency key TTL.
+
+    Once a record is purged its key can be reused, so the retention should exceed the
+    longest period over which clients retry requests. Meant to be run periodically.
+
+    Usage:
+        python manage.py purge_idempotency_records
+        python manage.py purge_idempotency_records --older-than 604800
+    """
+
+    help = "Delete idempotency records older than the given number of seconds."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=settings.IDEMPOTENCY_KEY_TTL,
+            help="Delete records older than this many seconds (default: IDEMPOTENCY_KEY_TTL).",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(seconds=options["older_than"])
+        deleted, _ = IdempotencyRecord.objects.filter(created_at__lt=cutoff).delete()
+        logger.info(f"Idempotency records purged: count={deleted}, cutoff={cutoff}")
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} idempotency record(s)."))
@@ -0,0 +1,82 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction as db_transaction
+
+from apps.account.models import Wallet
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds and verifies the stored `Wallet.balance` against the transaction ledger.
+
+    Each wallet row is locked with `select_for_update` while its ledger sum is computed,
+    so the command is safe to run against a live database. The ledger sum starts from
+    the latest balance checkpoint unless `--full` is given. The stored balance of a
+    sharded wallet is the sum of its slots, and a rebuilt one is stored in its first slot.
+
+    Usage:
+        python manage.py rebuild_wallet_balances           # fix mismatching balances
+        python manage.py rebuild_wallet_balances --check   # only verify, fail on mismatch
+        python manage.py rebuild_wallet_balances --full    # ignore balance checkpoints
+    """
+
+    help = "Rebuild and verify stored wallet balances from the transaction ledger."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify stored balances and exit with an error on mismatch.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Sum the full ledger instead of starting from balance checkpoints.",
+        )
+        parser.add_argument(
+            "--wallet",
+            action="append",
+            dest="wallet_ids",
+            help="Restrict the run to the given wallet UUID (can be repeated).",
+        )
+
+    def handle(self, *args, **options):
+        check_only = options["check"]
+        use_checkpoint = not options["full"]
+
+        wallet_ids = Wallet.all_objects.order_by("id").values_list("id", flat=True)
+        if options["wallet_ids"]:
+            wallet_ids = wallet_ids.filter(id__in=options["wallet_ids"])
+
+        checked = 0
+        mismatched = 0
+        for wallet_id in list(wallet_ids):
+            with db_transaction.atomic():
+                wallet = Wallet.all_objects.select_for_update().get(pk=wallet_id)
+                ledger_balance = wallet.calculate_ledger_balance(use_checkpoint=use_checkpoint)
+                checked += 1
+                if wallet.balance == ledger_balance:
+                    continue
+
+                mismatched += 1
+                logger.warning(
+                    f"Wallet balance mismatch: wallet_id={wallet_id}, "
+                    f"stored={wallet.balance}, ledger={ledger_balance}"
+                )
+                self.stdout.write(f"{wallet_id}: stored={wallet.balance} ledger={ledger_balance}")
+                if not check_only:
+                    Wallet.set_stored_balance(wallet_id, ledger_balance)
+
+        if check_only and mismatched:
+            raise CommandError(
+                f"{mismatched} of {checked} wallet balance(s) do not match the ledger."
+            )
+
+        action = "Verified" if check_only else "Rebuilt"
+        self.stdout.write(
+            self.style.SUCCESS(f"{action} {checked} wallet(s), {mismatched} mismatch(es) found.")
+        )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.account.exceptions import WalletNotFoundError
+from apps.account.services import WalletService
+from apps.common.exceptions import ValidationError
+
+
+class Command(BaseCommand):
+    """
+    Shards a hot wallet into balance slots, or unshards it.
+
+    Concurrent deposits to a sharded wallet each lock one random slot instead of the
+    wallet row, so they no longer serialize; withdrawals and transfers lock as few
+    slots as cover their amount. The wallets to shard are the top entries of the
+    `wallet_contention` report. `--slots 0` moves the balance back to the wallet row.
+
+    Usage:
+        python manage.py shard_wallet --wallet <uuid> --slots 16
+        python manage.py shard_wallet --wallet <uuid> --slots 0
+    """
+
+    help = "Shard a wallet into balance slots for concurrent deposits (0 slots to unshard)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wallet", required=True, help="UUID of the wallet.")
+        parser.add_argument(
+            "--slots",
+            type=int,
+            required=True,
+            help="Number of balance slots, or 0 to unshard the wallet.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            wallet = WalletService.set_slot_count(options["wallet"], options["slots"])
+        except (ValidationError, WalletNotFoundError) as e:
+            raise CommandError(str(e.detail))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wallet {wallet.id} has {wallet.slot_count} slot(s), balance={wallet.balance}."
+            )
+        )
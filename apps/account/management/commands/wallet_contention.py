@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand
+
+from apps.account.services import WalletContentionService
+
+
+class Command(BaseCommand):
+    """
+    Prints the wallets whose locks were waited on most over the recent window.
+
+    Lock waits are recorded by `WalletService` (see `WalletContentionService`). The
+    wallets at the top of the report serialize the most requests and are the
+    candidates for batching or sharding. The same report is shown on the
+    `/admin/wallet-contention/` page.
+
+    Usage:
+        python manage.py wallet_contention
+        python manage.py wallet_contention --limit 10 --window 300
+        python manage.py wallet_contention --reset
+    """
+
+    help = "Report the wallets with the most lock contention over the recent window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Number of wallets to report (default: WALLET_LOCK_CONTENTION_TOP_N).",
+        )
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=None,
+            help="Seconds to report, at most WALLET_LOCK_CONTENTION_WINDOW (the default).",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Delete the recorded lock waits instead of reporting them.",
+        )
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            WalletContentionService.reset()
+            self.stdout.write(self.style.SUCCESS("Lock contention statistics reset."))
+            return
+
+        wallets = WalletContentionService.get_top_wallets(
+            limit=options["limit"], window=options["window"]
+        )
+        if not wallets:
+            self.stdout.write("No lock contention recorded.")
+            return
+
+        self.stdout.write(
+            f"{'wallet':<36}  {'label':<20}  {'locks':>7}  {'total ms':>10}  "
+            f"{'avg ms':>8}  {'max ms':>8}"
+        )
+        for wallet in wallets:
+            self.stdout.write(
+                f"{wallet['wallet_id']:<36}  {(wallet['label'] or '-')[:20]:<20}  "
+                f"{wallet['contended_locks']:>7}  {wallet['total_wait_ms']:>10.2f}  "
+                f"{wallet['avg_wait_ms']:>8.2f}  {wallet['max_wait_ms']:>8.2f}"
+            )
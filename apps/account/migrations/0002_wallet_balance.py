@@ -0,0 +1,55 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:07
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_wallet_balance(apps, schema_editor):
+    Wallet = apps.get_model("account", "Wallet")
+    Transaction = apps.get_model("account", "Transaction")
+
+    ledger_sum = (
+        Transaction.objects.filter(wallet_id=OuterRef("pk"), is_deleted=False)
+        .order_by()
+        .values("wallet_id")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    Wallet.objects.update(
+        balance=Coalesce(
+            Subquery(ledger_sum, output_field=models.DecimalField(max_digits=36, decimal_places=18)),
+            Value(Decimal("0")),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wallet",
+            name="balance",
+            field=models.DecimalField(
+                db_index=True,
+                decimal_places=18,
+                default=Decimal("0"),
+                editable=False,
+                max_digits=36,
+            ),
+        ),
+        migrations.RunPython(backfill_wallet_balance, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="wallet",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("balance__gte", 0)),
+                name="account_wallet_balance_non_negative",
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:09
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0002_wallet_balance"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WalletBalanceCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("last_transaction_created_at", models.DateTimeField()),
+                ("last_transaction_id", models.UUIDField()),
+                ("balance", models.DecimalField(decimal_places=18, max_digits=36)),
+                ("transaction_count", models.PositiveBigIntegerField(default=0)),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balance_checkpoints",
+                        to="account.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["wallet", "-last_transaction_created_at", "-last_transaction_id"],
+                        name="account_wal_wallet__0cedcd_idx",
+                    )
+                ],
+            },
+        ),
+    ]
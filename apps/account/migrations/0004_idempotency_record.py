@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:16
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0003_wallet_balance_checkpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyRecord",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("scope", models.CharField(max_length=100)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("status_code", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("content", models.TextField(blank=True, default="")),
+                ("content_type", models.CharField(blank=True, default="", max_length=255)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["created_at"], name="account_ide_created_f42f65_idx")
+                ],
+            },
+        ),
+    ]
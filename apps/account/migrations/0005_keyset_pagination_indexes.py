@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0004_idempotency_record"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["created_at", "id"], name="account_tra_created_5eee86_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["wallet", "created_at", "id"], name="account_tra_wallet__75f87e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wallet",
+            index=models.Index(fields=["created_at", "id"], name="account_wal_created_670c33_idx"),
+        ),
+    ]
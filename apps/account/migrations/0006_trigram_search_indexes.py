@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.db import migrations
+
+from apps.account.services.search import TrigramIndexService
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Creates the pg_trgm GIN indexes for substring search (see `TrigramIndexService`).
+    Skipped on other databases or when DB_TRIGRAM_INDEXES is disabled; they are added
+    later with the `create_trigram_indexes` command.
+    """
+    if schema_editor.connection.vendor != "postgresql" or not settings.DB_TRIGRAM_INDEXES:
+        return
+
+    TrigramIndexService.create_indexes()
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    TrigramIndexService.drop_indexes()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0005_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0006_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="account_tra_txid_716d90_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="account_tra_created_5eee86_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="account_tra_wallet__75f87e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="wallet",
+            name="account_wal_label_160427_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="wallet",
+            name="account_wal_created_670c33_idx",
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["txid"],
+                name="account_tra_txid_4f6bcf_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at", "id"],
+                name="account_tra_create_4ccea2_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["wallet", "created_at", "id"],
+                name="account_tra_wallet_a34124_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wallet",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["label"],
+                name="account_wal_label_b7f62f_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wallet",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at", "id"],
+                name="account_wal_create_a25fe4_live",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0007_soft_delete_live_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="account_tra_wallet__b3ed30_idx",
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["wallet"],
+                include=("amount",),
+                name="account_tra_wallet_385063_live",
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:28
+
+import uuid
+
+from django.db import migrations
+
+import apps.common.identifiers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0008_covering_balance_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="idempotencyrecord",
+            name="id",
+            field=apps.common.identifiers.ModelUUIDField(
+                default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="id",
+            field=apps.common.identifiers.ModelUUIDField(
+                default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="id",
+            field=apps.common.identifiers.ModelUUIDField(
+                default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="walletbalancecheckpoint",
+            name="id",
+            field=apps.common.identifiers.ModelUUIDField(
+                default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
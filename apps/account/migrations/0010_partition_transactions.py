@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.db import migrations
+
+from apps.account.services.partition import TransactionPartitionService
+
+
+def partition_transactions(apps, schema_editor):
+    """
+    Partitions the transaction table by month on created_at when
+    DB_PARTITION_TRANSACTIONS is enabled (see `TransactionPartitionService`).
+
+    Skipped on other databases or when the setting is disabled; databases migrated
+    without it are converted later with the `partition_transactions` command.
+    """
+    if schema_editor.connection.vendor != "postgresql" or not settings.DB_PARTITION_TRANSACTIONS:
+        return
+    if not TransactionPartitionService.is_partitioned():
+        TransactionPartitionService.partition_table(settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+
+
+def unpartition_transactions(apps, schema_editor):
+    """
+    Converts the partitioned transaction table back into a plain table.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    if TransactionPartitionService.is_partitioned():
+        TransactionPartitionService.unpartition_table()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0009_uuid_pk_generator"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_transactions, unpartition_transactions),
+    ]
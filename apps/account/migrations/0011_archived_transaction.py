@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-16 16:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0010_partition_transactions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTransaction",
+            fields=[
+                ("id", models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ("txid", models.CharField(max_length=255, unique=True)),
+                ("amount", models.DecimalField(decimal_places=18, max_digits=36)),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_transactions",
+                        to="account.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["wallet", "created_at", "id"], name="account_arc_wallet__472e7a_idx"
+                    ),
+                    models.Index(
+                        fields=["created_at", "id"], name="account_arc_created_2eaf1b_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.4 on 2026-10-16 17:07
+
+import uuid
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import apps.common.identifiers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0011_archived_transaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wallet",
+            name="slot_count",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name="WalletSlot",
+            fields=[
+                (
+                    "id",
+                    apps.common.identifiers.ModelUUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("index", models.PositiveSmallIntegerField()),
+                (
+                    "balance",
+                    models.DecimalField(decimal_places=18, default=Decimal("0"), max_digits=36),
+                ),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="slots",
+                        to="account.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("wallet", "index"), name="account_walletslot_wallet_index_unique"
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(("balance__gte", 0)),
+                        name="account_walletslot_balance_non_negative",
+                    ),
+                ],
+            },
+        ),
+    ]
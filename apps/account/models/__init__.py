@@ -1,2 +1,5 @@
+from apps.account.models.archive import ArchivedTransaction
+from apps.account.models.checkpoint import WalletBalanceCheckpoint
+from apps.account.models.idempotency import IdempotencyRecord
 from apps.account.models.transaction import Transaction
-from apps.account.models.wallet import Wallet
+from apps.account.models.wallet import Wallet, WalletSlot
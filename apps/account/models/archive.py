@@ -0,0 +1,50 @@
+from django.db import models
+
+from apps.account.models.wallet import Wallet
+
+
+class ArchivedTransaction(models.Model):
+    """
+    Read-only copy of a transaction moved out of the transaction table.
+
+    Rows are written by the `archive_transactions` management command, which replaces
+    the archived transactions of each wallet with a single carry-forward transaction,
+    so the hot transaction table only holds recent activity while wallet ledger sums
+    stay unchanged.
+
+    Attributes:
+      - id: UUID of the original transaction.
+      - wallet: ForeignKey to the Wallet the transaction belonged to.
+      - txid: Transaction identifier, unique among archived transactions.
+      - amount: Decimal amount of the transaction.
+      - is_deleted: Whether the transaction was soft-deleted when archived.
+      - created_at / updated_at: Timestamps of the original transaction.
+      - archived_at: When the transaction was archived.
+
+    Meta:
+      - Only indexes (wallet, created_at, id) and (created_at, id) for the keyset
+        paginated archive endpoint, keeping the table compact.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    wallet = models.ForeignKey(
+        Wallet, on_delete=models.CASCADE, related_name="archived_transactions", db_index=False
+    )
+    txid = models.CharField(max_length=255, unique=True)
+    amount = models.DecimalField(max_digits=36, decimal_places=18)
+    is_deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["wallet", "created_at", "id"]),
+            models.Index(fields=["created_at", "id"]),
+        ]
+
+    def __str__(self):
+        """
+        Returns the txid and amount of the archived transaction.
+        """
+        return f"Archived transaction {self.txid} ({self.amount})"
@@ -0,0 +1,82 @@
+from django.db import models
+from django.db.models import Q
+
+from apps.account.models.wallet import Wallet
+from apps.common.mixins import TimestampMixin, UUIDMixin
+
+
+class WalletBalanceCheckpoint(UUIDMixin, TimestampMixin):
+    """
+    Snapshot of a wallet's cumulative ledger balance up to a given transaction.
+
+    Transactions are ordered by (`created_at`, `id`). A checkpoint stores the position
+    of the last transaction it covers and the sum of all non-deleted transactions up to
+    and including that position, so the ledger balance can be computed as
+    `checkpoint.balance + SUM(amount of transactions after the checkpoint)`.
+
+    Attributes:
+      - wallet: ForeignKey to the Wallet the checkpoint belongs to.
+      - last_transaction_created_at: `created_at` of the last covered transaction.
+      - last_transaction_id: UUID of the last covered transaction.
+      - balance: Cumulative balance up to and including the last covered transaction.
+      - transaction_count: Number of non-deleted transactions covered by the checkpoint.
+
+    Behavior:
+      - Written by the `compact_wallet_balances` management command.
+      - Invalidated by `Transaction.save` when a covered transaction is changed.
+
+    Meta:
+      - Adds a composite index to fetch the latest checkpoint of a wallet.
+    """
+
+    wallet = models.ForeignKey(
+        Wallet, on_delete=models.CASCADE, related_name="balance_checkpoints", db_index=True
+    )
+    last_transaction_created_at = models.DateTimeField()
+    last_transaction_id = models.UUIDField()
+    balance = models.DecimalField(max_digits=36, decimal_places=18)
+    transaction_count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["wallet", "-last_transaction_created_at", "-last_transaction_id"]),
+        ]
+
+    def __str__(self):
+        """
+        Returns a human-readable representation of the checkpoint.
+        """
+        return f"Checkpoint {self.wallet_id} @ {self.last_transaction_created_at} ({self.balance})"
+
+    @classmethod
+    def get_latest(cls, wallet_id):
+        """
+        Returns the most recent checkpoint of the wallet, or None if there is none.
+        """
+        return (
+            cls.objects.filter(wallet_id=wallet_id)
+            .order_by("-last_transaction_created_at", "-last_transaction_id")
+            .first()
+        )
+
+    @classmethod
+    def invalidate(cls, wallet_ids, created_at):
+        """
+        Deletes checkpoints of the given wallets that cover a transaction created at
+        `created_at`, because a change to that transaction makes their balance stale.
+        """
+        cls.objects.filter(
+            wallet_id__in=wallet_ids, last_transaction_created_at__gte=created_at
+        ).delete()
+
+    def tail_filter(self) -> Q:
+        """
+        Returns a filter that selects transactions positioned after this checkpoint.
+
+        The redundant `created_at >= ...` bound lets PostgreSQL skip older partitions
+        of a partitioned transaction table and start the (created_at, id) index scan
+        at the checkpoint.
+        """
+        return Q(created_at__gte=self.last_transaction_created_at) & (
+            Q(created_at__gt=self.last_transaction_created_at) | Q(id__gt=self.last_transaction_id)
+        )
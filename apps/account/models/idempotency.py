@@ -0,0 +1,42 @@
+from django.db import models
+
+from apps.common.mixins import TimestampMixin, UUIDMixin
+
+
+class IdempotencyRecord(UUIDMixin, TimestampMixin):
+    """
+    Stores the outcome of a request made with an `Idempotency-Key` header.
+
+    The row is inserted and locked in the same database transaction as the operation
+    it guards, so concurrent requests with the same key are serialized on this row
+    and a retried request replays the stored response instead of repeating the write.
+
+    Attributes:
+      - key: Client-supplied idempotency key, unique.
+      - scope: Name of the guarded operation (e.g. "wallets.deposit").
+      - fingerprint: Hash of the request method, path and body the key was first used with.
+      - status_code: HTTP status of the stored response.
+      - content: Rendered body of the stored response.
+      - content_type: Content type of the stored response.
+
+    Meta:
+      - Adds an index on `created_at` to purge expired records efficiently.
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    scope = models.CharField(max_length=100)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    content = models.TextField(blank=True, default="")
+    content_type = models.CharField(max_length=255, blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
+
+    def __str__(self):
+        """
+        Returns the idempotency key and its scope.
+        """
+        return f"{self.scope}: {self.key}"
@@ -1,6 +1,12 @@
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import models, transaction
 
+from apps.account.models.archive import ArchivedTransaction
+from apps.account.models.checkpoint import WalletBalanceCheckpoint
 from apps.account.models.wallet import Wallet
+from apps.common.cache import invalidate_model_cache
 from apps.common.exceptions import ValidationError
 from apps.common.managers import SoftDeleteManager
 from apps.common.mixins import SafeSaveMixin, SoftDeleteMixin, TimestampMixin, UUIDMixin
@@ -19,11 +25,21 @@ class Transaction(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
       - Ensures the transaction belongs to a wallet.
       - Validates that applying the transaction amount does not cause the wallet's
         balance to become negative.
-      - On save, performs full validation and atomic database save to maintain consistency.
+      - On save, performs full validation and atomically updates the stored
+        `Wallet.balance` together with the row, including on soft deletion.
       - Supports soft deletion and UUID primary key via mixins.
 
     Meta:
-      - Adds database indexes on 'txid' and combined 'wallet' and 'amount' for performance.
+      - Declares `live_indexes` on 'txid' and on (created_at, id), globally and per wallet,
+        which SoftDeleteMixin turns into partial indexes WHERE NOT is_deleted for txid
+        lookups, keyset pagination and checkpoint tail sums.
+      - Declares the covering index (wallet) INCLUDE (amount) WHERE NOT is_deleted, so
+        the ledger balance SUM(amount) is an index-only scan on PostgreSQL.
+      - On PostgreSQL, an optional pg_trgm GIN index on UPPER(txid) serves substring
+        search (see `TrigramIndexService`).
+      - On PostgreSQL, the table can be range partitioned by month on created_at
+        (see `TransactionPartitionService`); its primary key becomes (id, created_at)
+        and txid uniqueness is enforced through the `account_transaction_txid` table.
     """
 
     objects = SoftDeleteManager()
@@ -35,11 +51,12 @@ class Transaction(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
     txid = models.CharField(max_length=255, unique=True, db_index=True)
     amount = models.DecimalField(max_digits=36, decimal_places=18)
 
-    class Meta:
-        indexes = [
-            models.Index(fields=["txid"]),
-            models.Index(fields=["wallet", "amount"]),
-        ]
+    live_indexes = [
+        ("txid",),
+        ("created_at", "id"),
+        ("wallet", "created_at", "id"),
+        {"fields": ("wallet",), "include": ("amount",)},
+    ]
 
     def __str__(self):
         """
@@ -48,14 +65,56 @@ class Transaction(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
         """
         return f"Transaction {self.txid} ({self.amount})"
 
+    def get_balance_deltas(self) -> dict:
+        """
+        Computes how saving this transaction changes the stored wallet balances.
+
+        Compares the instance with its persisted row (if any), taking amount changes,
+        soft deletion and wallet reassignment into account. The persisted row is locked
+        when called inside an atomic block so concurrent updates cannot race.
+
+        Returns:
+            dict: Mapping of wallet id to the Decimal amount to add to its balance.
+        """
+        deltas = {}
+        if not self._state.adding:
+            old_qs = Transaction.all_objects.filter(pk=self.pk)
+            if transaction.get_connection().in_atomic_block:
+                old_qs = old_qs.select_for_update()
+            old = old_qs.values("wallet_id", "amount", "is_deleted").first()
+            if old and not old["is_deleted"]:
+                deltas[old["wallet_id"]] = -old["amount"]
+        if not self.is_deleted:
+            deltas[self.wallet_id] = deltas.get(self.wallet_id, Decimal("0")) + self.amount
+        return deltas
+
+    def validate_unique(self, exclude=None):
+        """
+        Extends the txid uniqueness check to archived transactions, so a txid cannot be
+        reused once its transaction has been archived. Both tables are checked with a
+        single query.
+        """
+        exclude = set(exclude or ())
+        super().validate_unique(exclude=exclude | {"txid"})
+        if "txid" in exclude:
+            return
+
+        live = Transaction.all_objects.filter(txid=self.txid)
+        if not self._state.adding:
+            live = live.exclude(pk=self.pk)
+        archived = ArchivedTransaction.objects.filter(txid=self.txid)
+        if live.values("txid").union(archived.values("txid")).exists():
+            raise DjangoValidationError(
+                {"txid": [self.unique_error_message(Transaction, ("txid",))]}
+            )
+
     def clean(self):
         """
         Validates the transaction before saving.
 
         - Ensures the transaction is associated with a wallet.
-        - Calculates the difference in amount if updating an existing transaction.
-        - Checks that the wallet balance after applying this transaction
-          will not become negative.
+        - Calculates the balance change per wallet, including updates and soft deletion.
+        - Checks that no wallet balance will become negative after applying it.
 
         Raises:
             ValidationError: If wallet is not set or balance constraint is violated.
@@ -63,28 +122,74 @@ class Transaction(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
         if self.wallet_id is None:
             raise ValidationError("Transaction must belong to a wallet.")
 
-        current_balance = self.wallet.balance
-
-        diff = self.amount
-        if self.pk:
-            try:
-                old = Transaction.objects.get(pk=self.pk)
-                diff = self.amount - old.amount
-            except Transaction.DoesNotExist:
-                diff = self.amount
-        else:
-            diff = self.amount
-        new_balance = current_balance + diff
-        if new_balance < 0:
-            raise ValidationError("Wallet balance cannot become negative.")
-
-    def save(self, *args, **kwargs):
+        self._balance_deltas = self.get_balance_deltas()
+
+        debited = [wallet_id for wallet_id, delta in self._balance_deltas.items() if delta < 0]
+        if not debited:
+            return
+
+        balances = Wallet.get_balances(debited)
+        for wallet_id in debited:
+            current_balance = balances.get(wallet_id, Decimal("0"))
+            if current_balance + self._balance_deltas[wallet_id] < 0:
+                raise ValidationError("Wallet balance cannot become negative.")
+
+    def save(self, *args, trusted=False, **kwargs):
         """
         Overrides the default save method to enforce validation and atomicity.
 
         - Calls `full_clean` to perform all validations.
-        - Wraps the save operation in a database transaction to prevent partial writes.
+        - Saves the row and applies the balance change to the affected wallets
+          in one database transaction to prevent partial writes.
+        - Invalidates balance checkpoints that cover a changed existing transaction.
+        - Invalidates cached API responses of the transaction and affected wallets.
+        - Refreshes the stored balance of the cached wallet instance.
+
+        Args:
+            trusted (bool): Set by the service layer when the wallet row is locked with
+                `select_for_update` and the balance change has already been validated.
+                Applies only to new transactions saved inside an atomic block; see
+                `_save_trusted`. Defaults to False.
         """
-        self.full_clean()
+        if trusted and self._state.adding and transaction.get_connection().in_atomic_block:
+            self._save_trusted(*args, **kwargs)
+            return
+
+        adding = self._state.adding
         with transaction.atomic():
+            self.full_clean()
             super().save(*args, **kwargs)
+            Wallet.apply_balance_deltas(self._balance_deltas)
+
+            changed_wallet_ids = [w_id for w_id, delta in self._balance_deltas.items() if delta]
+            if not adding and changed_wallet_ids:
+                WalletBalanceCheckpoint.invalidate(changed_wallet_ids, self.created_at)
+            invalidate_model_cache(Transaction, [self.pk])
+
+        if self._balance_deltas and Transaction.wallet.is_cached(self):
+            self.wallet.refresh_from_db(fields=["balance"])
+
+    def _save_trusted(self, *args, **kwargs):
+        """
+        Saves a new transaction whose balance change was validated by the caller.
+
+        Skips the model-level balance check, the wallet existence and primary key
+        uniqueness queries and the nested savepoint, and updates the locked wallet
+        instance in memory instead of refreshing it from the database. Field validation
+        and the `txid` uniqueness check are still performed.
+        """
+        if self.wallet_id is None:
+            raise ValidationError("Transaction must belong to a wallet.")
+
+        self.clean_fields(exclude=["wallet"])
+        self.validate_unique(exclude=["id"])
+        self._balance_deltas = {self.wallet_id: self.amount}
+
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            Wallet.apply_balance_deltas(
+                self._balance_deltas, slot_counts={self.wallet_id: self.wallet.slot_count}
+            )
+            invalidate_model_cache(Transaction, [self.pk])
+
+        self.wallet.balance += self.amount
@@ -1,37 +1,85 @@
+import random
 from decimal import Decimal
 
 from django.db import models
-from django.db.models import Sum
+from django.db.models import F, Q, Sum
+from django.db.models.query import ModelIterable
 
+from apps.common.cache import invalidate_model_cache
 from apps.common.exceptions import ValidationError
 from apps.common.managers import SoftDeleteManager
 from apps.common.mixins import SafeSaveMixin, SoftDeleteMixin, TimestampMixin, UUIDMixin
 
 
+class WalletQuerySet(models.QuerySet):
+    """
+    QuerySet of wallets reporting the balance of sharded wallets with their slots.
+
+    Once the wallets are fetched, the slots of the sharded ones are summed into their
+    `balance` with one grouped query (see `Wallet.add_slot_balances`), so listing many
+    sharded wallets costs one more query, not one per wallet. Rows streamed with
+    `iterator()` and wallets loaded through `select_related` hold the stored column only.
+    """
+
+    def _fetch_all(self):
+        fetched = self._result_cache is None
+        super()._fetch_all()
+        if fetched and issubclass(self._iterable_class, ModelIterable):
+            Wallet.add_slot_balances(self._result_cache, using=self.db)
+
+
 class Wallet(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
     """
     Represents a Wallet entity that aggregates multiple Transactions.
 
     Attributes:
       - label: Human-readable name or label for the wallet, indexed for quick search.
+      - balance: Materialized sum of all non-deleted transaction amounts. It is maintained
+        by `Transaction.save` in the same database transaction as every ledger write,
+        so reading it is a single-row lookup instead of an aggregate.
+      - slot_count: Number of `WalletSlot` rows of a sharded wallet, 0 for a regular one.
+        The balance of a sharded wallet is held by its slots and its own `balance`
+        column stays 0; wallets fetched through `WalletQuerySet` report the sum of the
+        slots as `balance`.
 
     Behavior:
-      - Provides a computed `balance` property that sums all related transaction amounts.
+      - Provides `calculate_ledger_balance` to recompute the balance from the ledger,
+        starting from the latest `WalletBalanceCheckpoint` when one exists.
       - Validates that the balance is never negative via `update_balance` method.
+      - Sharded wallets (see `WalletService.set_slot_count`) spread deposits over their
+        slots, so concurrent deposits do not serialize on the wallet row lock.
+      - Invalidates cached API responses and the cached instance of the wallet whenever
+        it or its balance changes.
       - Supports UUID primary key, timestamps, safe saving, and soft deletion via mixins.
 
     Meta:
-      - Adds a database index on the `label` field for efficient querying.
+      - Declares `live_indexes` on `label` and on (created_at, id), which SoftDeleteMixin
+        turns into partial indexes WHERE NOT is_deleted for label search and keyset
+        pagination.
+      - On PostgreSQL, an optional pg_trgm GIN index on UPPER(label) serves substring
+        search (see `TrigramIndexService`).
+      - Enforces a non-negative `balance` with a check constraint.
     """
 
-    objects = SoftDeleteManager()
-    all_objects = models.Manager()
+    objects = SoftDeleteManager.from_queryset(WalletQuerySet)()
+    all_objects = models.Manager.from_queryset(WalletQuerySet)()
 
     label = models.CharField(max_length=255, db_index=True)
+    balance = models.DecimalField(
+        max_digits=36, decimal_places=18, default=Decimal("0"), db_index=True, editable=False
+    )
+    slot_count = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    live_indexes = [
+        ("label",),
+        ("created_at", "id"),
+    ]
 
     class Meta:
-        indexes = [
-            models.Index(fields=["label"]),
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(balance__gte=0), name="account_wallet_balance_non_negative"
+            ),
         ]
 
     def __str__(self):
@@ -40,16 +88,170 @@ class Wallet(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
         """
         return self.label
 
-    @property
-    def balance(self) -> Decimal:
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """
+        Reloads the wallet through a `WalletQuerySet`; `slot_count` is reloaded with
+        `balance`, so the balance of a sharded wallet includes its slots.
+        """
+        if fields is not None and "balance" in fields and "slot_count" not in fields:
+            fields = [*fields, "slot_count"]
+        if from_queryset is None:
+            from_queryset = type(self).all_objects.db_manager(using, hints={"instance": self})
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+    def save(self, *args, **kwargs):
         """
-        Computes the current wallet balance as the sum of all related transaction amounts.
+        Saves the wallet and invalidates its cached API responses and instance.
+
+        Updates of an existing wallet never write `balance` and `slot_count`: they are
+        only changed by `apply_balance_deltas` and `WalletService.set_slot_count`, so
+        saving an instance loaded earlier (e.g. from the object cache) cannot overwrite
+        a concurrently applied balance change.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in ("balance", "slot_count")
+            ]
+        super().save(*args, **kwargs)
+        invalidate_model_cache(Wallet, [self.pk])
+
+    def calculate_ledger_balance(self, use_checkpoint: bool = True) -> Decimal:
+        """
+        Computes the wallet balance from the ledger as the sum of all related
+        non-deleted transaction amounts.
+
+        When a balance checkpoint exists, only the transactions added after it are
+        summed and the result is added to the checkpoint balance. Used to rebuild
+        and verify the stored `balance` field.
+
+        Args:
+            use_checkpoint (bool): Start from the latest checkpoint instead of
+                summing the full ledger. Defaults to True.
 
         Returns:
             Decimal: The total balance, or 0 if no transactions exist.
         """
-        agg = self.transactions.aggregate(total=Sum("amount"))
-        return agg["total"] or Decimal("0")
+        transactions = self.transactions.all()
+        balance = Decimal("0")
+        if use_checkpoint:
+            checkpoint = self.balance_checkpoints.order_by(
+                "-last_transaction_created_at", "-last_transaction_id"
+            ).first()
+            if checkpoint is not None:
+                transactions = transactions.filter(checkpoint.tail_filter())
+                balance = checkpoint.balance
+
+        agg = transactions.aggregate(total=Sum("amount"))
+        return balance + (agg["total"] or Decimal("0"))
+
+    @classmethod
+    def add_slot_balances(cls, wallets, using=None):
+        """
+        Adds the balances of the slots of the sharded wallets to their `balance`.
+
+        The slots of all the given wallets are summed with one grouped query. Wallets
+        loaded without `balance` or `slot_count` are left unchanged.
+
+        Args:
+            wallets: Iterable of Wallet instances holding their stored balance.
+            using (str, optional): Database alias to read the slots from.
+        """
+        sharded = [
+            wallet
+            for wallet in wallets
+            if wallet.__dict__.get("slot_count") and "balance" in wallet.__dict__
+        ]
+        if not sharded:
+            return
+        slot_balances = WalletSlot.get_balances([wallet.pk for wallet in sharded], using=using)
+        for wallet in sharded:
+            wallet.balance += slot_balances.get(wallet.pk, Decimal("0"))
+
+    @classmethod
+    def get_balances(cls, wallet_ids) -> dict:
+        """
+        Returns the current balances of the wallets, slots of sharded wallets included.
+
+        Args:
+            wallet_ids: Iterable of wallet ids.
+
+        Returns:
+            dict: Mapping of wallet id to its Decimal balance; missing wallets are omitted.
+        """
+        rows = cls.all_objects.filter(pk__in=list(wallet_ids)).values_list(
+            "id", "balance", "slot_count"
+        )
+        balances = {wallet_id: balance for wallet_id, balance, _ in rows}
+        sharded = [wallet_id for wallet_id, _, slot_count in rows if slot_count]
+        if sharded:
+            for wallet_id, balance in WalletSlot.get_balances(sharded).items():
+                balances[wallet_id] += balance
+        return balances
+
+    @classmethod
+    def apply_balance_deltas(cls, deltas: dict, slot_counts: dict = None):
+        """
+        Atomically adds the given amounts to the stored balances of the wallets.
+
+        Must be called inside the database transaction that writes the
+        corresponding Transaction rows. Invalidates cached API responses and
+        instances of the changed wallets.
+
+        Amounts of sharded wallets go to their slots: a credit to one random slot, a
+        debit to as few slots as cover it (see `WalletSlot`). Regular wallets are
+        updated with one query each, as before; finding that a wallet is sharded costs
+        one more query, unless its slot count is given.
+
+        Args:
+            deltas (dict): Mapping of wallet id to the Decimal amount to add.
+            slot_counts (dict, optional): Mapping of wallet id to its known `slot_count`.
+        """
+        slot_counts = slot_counts or {}
+        changed = [wallet_id for wallet_id, delta in deltas.items() if delta]
+        for wallet_id in changed:
+            delta = deltas[wallet_id]
+            slot_count = slot_counts.get(wallet_id)
+            if not slot_count:
+                updated = cls.all_objects.filter(pk=wallet_id, slot_count=0).update(
+                    balance=F("balance") + delta
+                )
+                if updated:
+                    continue
+                slot_count = (
+                    cls.all_objects.filter(pk=wallet_id)
+                    .values_list("slot_count", flat=True)
+                    .first()
+                )
+                if not slot_count:
+                    continue
+
+            if delta < 0:
+                WalletSlot.debit(wallet_id, delta.copy_negate())
+            elif not WalletSlot.credit(wallet_id, slot_count, delta):
+                # The wallet was unsharded after its slot count was read.
+                cls.all_objects.filter(pk=wallet_id).update(balance=F("balance") + delta)
+        if changed:
+            invalidate_model_cache(cls, changed)
+
+    @classmethod
+    def set_stored_balance(cls, wallet_id, balance: Decimal):
+        """
+        Overwrites the stored balance of the wallet, e.g. with its ledger balance.
+
+        The balance of a sharded wallet is stored in its first slot and its other slots
+        are emptied. Must be called inside an atomic block.
+        """
+        slot_count = (
+            cls.all_objects.filter(pk=wallet_id).values_list("slot_count", flat=True).first()
+        )
+        if slot_count:
+            WalletSlot.objects.filter(wallet_id=wallet_id).update(balance=Decimal("0"))
+            WalletSlot.objects.filter(wallet_id=wallet_id, index=0).update(balance=balance)
+        else:
+            cls.all_objects.filter(pk=wallet_id).update(balance=balance)
+        invalidate_model_cache(cls, [wallet_id])
 
     def update_balance(self):
         """
@@ -65,3 +267,122 @@ class Wallet(UUIDMixin, TimestampMixin, SafeSaveMixin, SoftDeleteMixin):
         if balance < 0:
             raise ValidationError("Wallet balance cannot be negative.")
         return balance
+
+
+class WalletSlot(UUIDMixin):
+    """
+    One of the balance slots of a sharded wallet.
+
+    A wallet receiving many concurrent deposits serializes them on its row lock. A
+    sharded wallet holds its balance in `Wallet.slot_count` slot rows instead: every
+    deposit adds its amount to one random slot, locking that row only, and the wallet
+    balance is the sum of its slots. Transactions still reference the wallet, so the
+    ledger is the same for regular and sharded wallets.
+
+    Attributes:
+      - wallet: ForeignKey to the sharded Wallet.
+      - index: Position of the slot, from 0 to `slot_count - 1`.
+      - balance: Part of the wallet balance held by the slot.
+
+    Meta:
+      - Enforces one slot per (wallet, index), which also indexes the slots of a wallet.
+      - Enforces a non-negative `balance` with a check constraint.
+    """
+
+    wallet = models.ForeignKey(
+        Wallet, on_delete=models.CASCADE, related_name="slots", db_index=False
+    )
+    index = models.PositiveSmallIntegerField()
+    balance = models.DecimalField(max_digits=36, decimal_places=18, default=Decimal("0"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wallet", "index"], name="account_walletslot_wallet_index_unique"
+            ),
+            models.CheckConstraint(
+                condition=Q(balance__gte=0), name="account_walletslot_balance_non_negative"
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Returns a human-readable representation of the slot.
+        """
+        return f"Slot {self.index} of {self.wallet_id} ({self.balance})"
+
+    @classmethod
+    def get_balances(cls, wallet_ids, using=None) -> dict:
+        """
+        Returns the sum of the slot balances of each given wallet.
+        """
+        rows = (
+            cls.objects.using(using)
+            .filter(wallet_id__in=list(wallet_ids))
+            .values("wallet_id")
+            .annotate(total=Sum("balance"))
+            .values_list("wallet_id", "total")
+        )
+        return dict(rows)
+
+    @classmethod
+    def credit(cls, wallet_id, slot_count: int, amount: Decimal) -> bool:
+        """
+        Adds the amount to a random slot of the wallet.
+
+        Falls back to the first slot when the chosen one no longer exists because the
+        wallet was resharded to fewer slots after `slot_count` was read.
+
+        Returns:
+            bool: False if the wallet has no slots (it was unsharded).
+        """
+        slots = cls.objects.filter(wallet_id=wallet_id)
+        index = random.randrange(slot_count)
+        if slots.filter(index=index).update(balance=F("balance") + amount):
+            return True
+        return index != 0 and bool(slots.filter(index=0).update(balance=F("balance") + amount))
+
+    @classmethod
+    def debit(cls, wallet_id, amount: Decimal):
+        """
+        Subtracts the amount from as few slots of the wallet as cover it, largest first.
+
+        Debits of a wallet are serialized by a FOR NO KEY UPDATE lock on the wallet row,
+        which deposits to its slots never take. Slot balances read before locking the
+        chosen slots can therefore only grow until they are locked, in index order.
+
+        Raises:
+            ValidationError: If the slots do not hold the amount.
+        """
+        list(
+            Wallet.all_objects.select_for_update(no_key=True)
+            .filter(pk=wallet_id)
+            .values_list("pk", flat=True)
+        )
+        chosen, covered = [], Decimal("0")
+        balances = (
+            cls.objects.filter(wallet_id=wallet_id, balance__gt=0)
+            .order_by("-balance", "index")
+            .values_list("index", "balance")
+        )
+        for index, balance in balances:
+            if covered >= amount:
+                break
+            chosen.append(index)
+            covered += balance
+        if covered < amount:
+            raise ValidationError("Wallet balance cannot become negative.")
+
+        slots = list(
+            cls.objects.select_for_update(no_key=True)
+            .filter(wallet_id=wallet_id, index__in=chosen)
+            .order_by("index")
+        )
+        remaining = amount
+        for slot in sorted(slots, key=lambda slot: slot.balance, reverse=True):
+            taken = min(slot.balance, remaining)
+            slot.balance -= taken
+            remaining -= taken
+        if remaining > 0:
+            raise ValidationError("Wallet balance cannot become negative.")
+        cls.objects.bulk_update(slots, ["balance"])
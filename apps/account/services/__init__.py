@@ -1,2 +1,8 @@
+from apps.account.services.archive import TransactionArchiveService
+from apps.account.services.contention import WalletContentionService
+from apps.account.services.export import TransactionExportService
+from apps.account.services.idempotency import IdempotencyService
+from apps.account.services.partition import TransactionPartitionService
+from apps.account.services.search import TrigramIndexService
 from apps.account.services.transaction import TransactionService
 from apps.account.services.wallet import WalletService
@@ -0,0 +1,160 @@
+import logging
+from datetime import datetime
+from decimal import Decimal
+
+from django.db import transaction as db_transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.account.models import (
+    ArchivedTransaction,
+    Transaction,
+    Wallet,
+    WalletBalanceCheckpoint,
+)
+from apps.common.cache import invalidate_model_cache
+from apps.common.constants import BULK_OPERATION_BATCH_SIZE
+from apps.common.exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+class TransactionArchiveService:
+    """
+    Service moving old transactions into the `ArchivedTransaction` table.
+
+    Transactions created before the cutoff are archived wallet by wallet, each in its
+    own database transaction holding a `select_for_update` lock on the wallet. Their
+    rows, soft-deleted ones included, are copied to the archive and deleted, and a
+    single carry-forward transaction dated at the cutoff and holding the sum of the
+    archived live amounts is inserted. The ledger sum of the wallet, and therefore its
+    stored balance, does not change. Balance checkpoints positioned before the
+    carry-forward transaction are deleted, as their tail would count it again.
+    """
+
+    CARRY_FORWARD_TXID_PREFIX = "carry-forward"
+    ARCHIVED_FIELDS = (
+        "id",
+        "wallet_id",
+        "txid",
+        "amount",
+        "is_deleted",
+        "created_at",
+        "updated_at",
+    )
+
+    @classmethod
+    def get_carry_forward_txid(cls, wallet_id, before: datetime) -> str:
+        """
+        Returns the txid of the carry-forward transaction of a wallet at a cutoff, e.g.
+        "carry-forward-20250101T000000-<wallet uuid hex>".
+        """
+        return f"{cls.CARRY_FORWARD_TXID_PREFIX}-{before:%Y%m%dT%H%M%S}-{wallet_id.hex}"
+
+    @classmethod
+    def archive(cls, before: datetime, wallet_ids=None) -> dict:
+        """
+        Archives the transactions created before `before`.
+
+        Args:
+            before (datetime): Aware cutoff; transactions with `created_at` before it
+                are archived. Must be in the past.
+            wallet_ids (iterable, optional): Restrict archiving to these wallets.
+
+        Returns:
+            dict: Number of `wallets` processed and of `archived` transactions.
+
+        Raises:
+            ValidationError: If the cutoff is naive or not in the past.
+        """
+        if timezone.is_naive(before) or before > timezone.now():
+            raise ValidationError("Archive cutoff must be an aware datetime in the past.")
+
+        candidates = Transaction.all_objects.filter(created_at__lt=before)
+        if wallet_ids is not None:
+            candidates = candidates.filter(wallet_id__in=wallet_ids)
+        candidates = candidates.order_by("wallet_id").values_list("wallet_id", flat=True)
+
+        wallets, archived = 0, 0
+        for wallet_id in candidates.distinct():
+            archived += cls._archive_wallet(wallet_id, before)
+            wallets += 1
+
+        logger.info(
+            f"Transactions archived: before={before.isoformat()}, wallets={wallets}, "
+            f"transactions={archived}"
+        )
+        return {"wallets": wallets, "archived": archived}
+
+    @classmethod
+    def _archive_wallet(cls, wallet_id, before: datetime) -> int:
+        """
+        Archives the transactions of one wallet created before `before` and writes
+        its carry-forward transaction.
+
+        Returns:
+            int: Number of archived transactions.
+        """
+        with db_transaction.atomic():
+            Wallet.all_objects.select_for_update().get(pk=wallet_id)
+
+            old = Transaction.all_objects.filter(wallet_id=wallet_id, created_at__lt=before)
+            carried = old.filter(is_deleted=False).aggregate(total=Sum("amount"))["total"]
+
+            archived = 0
+            batch = []
+            for row in (
+                old.order_by("created_at", "id")
+                .values(*cls.ARCHIVED_FIELDS)
+                .iterator(chunk_size=BULK_OPERATION_BATCH_SIZE)
+            ):
+                batch.append(ArchivedTransaction(**row))
+                if len(batch) >= BULK_OPERATION_BATCH_SIZE:
+                    archived += cls._flush(batch)
+            archived += cls._flush(batch)
+            old.delete()
+
+            if carried:
+                cls._create_carry_forward(wallet_id, carried, before)
+            WalletBalanceCheckpoint.objects.filter(
+                wallet_id=wallet_id, last_transaction_created_at__lte=before
+            ).delete()
+
+            invalidate_model_cache(Transaction)
+            invalidate_model_cache(ArchivedTransaction)
+            invalidate_model_cache(Wallet, [wallet_id])
+
+        logger.info(
+            f"Wallet transactions archived: wallet_id={wallet_id}, count={archived}, "
+            f"carried={carried or Decimal('0')}"
+        )
+        return archived
+
+    @staticmethod
+    def _flush(batch: list) -> int:
+        """
+        Inserts and clears a batch of archived transactions, returning its size.
+        """
+        count = len(batch)
+        if count:
+            ArchivedTransaction.objects.bulk_create(batch)
+            batch.clear()
+        return count
+
+    @classmethod
+    def _create_carry_forward(cls, wallet_id, amount: Decimal, before: datetime):
+        """
+        Inserts the carry-forward transaction of a wallet dated at the cutoff.
+
+        `created_at` is set with an update after the insert, as it is assigned on
+        insert (`auto_now_add`). The wallet balance is left untouched, since the
+        carry-forward amount replaces the archived ones.
+        """
+        carry_forward = Transaction(
+            wallet_id=wallet_id, txid=cls.get_carry_forward_txid(wallet_id, before), amount=amount
+        )
+        Transaction.all_objects.bulk_create([carry_forward])
+        Transaction.all_objects.filter(pk=carry_forward.pk).update(
+            created_at=before, updated_at=before
+        )
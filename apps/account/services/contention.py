@@ -0,0 +1,221 @@
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.account.models import Wallet
+
+
+logger = logging.getLogger(__name__)
+
+
+class _RedisContentionStore:
+    """
+    Contention statistics in Redis sorted sets, shared by all processes.
+
+    Every bucket has three sorted sets of wallet ids: the total wait and the number of
+    contended acquisitions (summed), and the longest wait (maximum). Reports merge the
+    buckets of the window with ZUNIONSTORE.
+    """
+
+    def __init__(self, client, prefix: str):
+        self.client = client
+        self.prefix = prefix
+
+    def _keys(self, bucket: int) -> tuple:
+        return tuple(f"{self.prefix}:{bucket}:{stat}" for stat in ("wait", "count", "max"))
+
+    def record(self, bucket: int, wallet_ids: list, wait_ms: float, ttl: int):
+        wait_key, count_key, max_key = self._keys(bucket)
+        pipe = self.client.pipeline(transaction=False)
+        for wallet_id in wallet_ids:
+            member = str(wallet_id)
+            pipe.zincrby(wait_key, wait_ms, member)
+            pipe.zincrby(count_key, 1, member)
+            pipe.zadd(max_key, {member: wait_ms}, gt=True)
+        for key in (wait_key, count_key, max_key):
+            pipe.expire(key, ttl)
+        pipe.execute()
+
+    def top(self, buckets: list, limit: int) -> list:
+        report_prefix = f"{self.prefix}:report:{uuid.uuid4().hex}"
+        merged = [f"{report_prefix}:{stat}" for stat in ("wait", "count", "max")]
+        per_bucket = list(zip(*(self._keys(bucket) for bucket in buckets)))
+
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zunionstore(merged[0], per_bucket[0], aggregate="SUM")
+        pipe.zunionstore(merged[1], per_bucket[1], aggregate="SUM")
+        pipe.zunionstore(merged[2], per_bucket[2], aggregate="MAX")
+        pipe.zrevrange(merged[0], 0, limit - 1, withscores=True)
+        ranked = pipe.execute()[-1]
+
+        members = [member for member, _ in ranked]
+        pipe = self.client.pipeline(transaction=False)
+        if members:
+            pipe.zmscore(merged[1], members)
+            pipe.zmscore(merged[2], members)
+        pipe.delete(*merged)
+        results = pipe.execute()
+        counts, maxima = (results[0], results[1]) if members else ([], [])
+
+        return [
+            (member.decode() if isinstance(member, bytes) else member, wait, count, max_wait)
+            for (member, wait), count, max_wait in zip(ranked, counts, maxima)
+        ]
+
+    def reset(self):
+        keys = list(self.client.scan_iter(match=f"{self.prefix}:*", count=1000))
+        if keys:
+            self.client.delete(*keys)
+
+
+class _LocalContentionStore:
+    """
+    Contention statistics in the memory of the current process, used when the default
+    cache is not Redis (e.g. local development and tests).
+    """
+
+    def __init__(self, bucket_seconds: int):
+        self.bucket_seconds = bucket_seconds
+        self._lock = threading.Lock()
+        self._buckets = defaultdict(dict)
+
+    def record(self, bucket: int, wallet_ids: list, wait_ms: float, ttl: int):
+        with self._lock:
+            stats = self._buckets[bucket]
+            for wallet_id in wallet_ids:
+                total, count, max_wait = stats.get(str(wallet_id), (0.0, 0, 0.0))
+                stats[str(wallet_id)] = (total + wait_ms, count + 1, max(max_wait, wait_ms))
+            oldest = bucket - ttl // self.bucket_seconds
+            for expired in [b for b in self._buckets if b < oldest]:
+                del self._buckets[expired]
+
+    def top(self, buckets: list, limit: int) -> list:
+        merged = {}
+        with self._lock:
+            for bucket in buckets:
+                for wallet_id, (wait, count, max_wait) in self._buckets.get(bucket, {}).items():
+                    total, total_count, total_max = merged.get(wallet_id, (0.0, 0, 0.0))
+                    merged[wallet_id] = (
+                        total + wait,
+                        total_count + count,
+                        max(total_max, max_wait),
+                    )
+        ranked = sorted(merged.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        return [(wallet_id, wait, count, max_wait) for wallet_id, (wait, count, max_wait) in ranked]
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class WalletContentionService:
+    """
+    Rolling report of the wallets whose `select_for_update` locks are waited on most.
+
+    `WalletService` times every lock acquisition and records waits of at least
+    WALLET_LOCK_CONTENTION_MIN_WAIT_MS milliseconds right away, also when the
+    acquisition fails or the transaction rolls back. When several wallets are locked by
+    one query, its wait is counted for each of them. Waits are aggregated per wallet in
+    one-minute buckets kept for WALLET_LOCK_CONTENTION_WINDOW seconds, in Redis sorted
+    sets when the default cache is Redis, so all workers share the report, and in the
+    memory of the process otherwise.
+
+    The report ranks wallets by total wait; its top entries are the candidates for
+    batching or sharding.
+    """
+
+    BUCKET_SECONDS = 60
+    KEY_PREFIX = "wallet-lock-contention"
+
+    _local_store = _LocalContentionStore(BUCKET_SECONDS)
+
+    @classmethod
+    def record(cls, wallet_ids, wait: float):
+        """
+        Records a lock wait on the given wallets, if it reaches the minimum wait.
+
+        Failures of the store are logged and ignored.
+
+        Args:
+            wallet_ids: Iterable of the locked wallet ids.
+            wait (float): Time spent acquiring the locks, in seconds.
+        """
+        wait_ms = wait * 1000
+        wallet_ids = list(wallet_ids)
+        if not wallet_ids or wait_ms < settings.WALLET_LOCK_CONTENTION_MIN_WAIT_MS:
+            return
+        try:
+            cls._get_store().record(
+                cls._current_bucket(), wallet_ids, wait_ms, cls._window() + cls.BUCKET_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Lock contention record failed: {str(e)}")
+
+    @classmethod
+    def get_top_wallets(cls, limit: int = None, window: int = None) -> list:
+        """
+        Returns the most contended wallets over the window, by total wait.
+
+        Args:
+            limit (int, optional): Number of wallets; WALLET_LOCK_CONTENTION_TOP_N by default.
+            window (int, optional): Seconds to report; WALLET_LOCK_CONTENTION_WINDOW by
+                default, and never more.
+
+        Returns:
+            list[dict]: `wallet_id`, `label` (None for deleted wallets),
+                `contended_locks`, `total_wait_ms`, `avg_wait_ms` and `max_wait_ms`
+                of every wallet, most contended first.
+        """
+        limit = limit or settings.WALLET_LOCK_CONTENTION_TOP_N
+        window = min(window or cls._window(), cls._window())
+        current = cls._current_bucket()
+        buckets = list(range(current - math.ceil(window / cls.BUCKET_SECONDS) + 1, current + 1))
+
+        ranked = cls._get_store().top(buckets, limit)
+        labels = dict(
+            Wallet.all_objects.filter(id__in=[wallet_id for wallet_id, *_ in ranked]).values_list(
+                "id", "label"
+            )
+        )
+        return [
+            {
+                "wallet_id": wallet_id,
+                "label": labels.get(uuid.UUID(wallet_id)),
+                "contended_locks": int(count),
+                "total_wait_ms": round(wait, 3),
+                "avg_wait_ms": round(wait / count, 3) if count else 0.0,
+                "max_wait_ms": round(max_wait, 3),
+            }
+            for wallet_id, wait, count, max_wait in ranked
+        ]
+
+    @classmethod
+    def reset(cls):
+        """
+        Deletes all recorded lock waits.
+        """
+        cls._get_store().reset()
+
+    @classmethod
+    def _get_store(cls):
+        """
+        Returns the Redis store if the default cache is Redis, the local store otherwise.
+        """
+        get_client = getattr(getattr(cache, "client", None), "get_client", None)
+        if get_client is None:
+            return cls._local_store
+        return _RedisContentionStore(get_client(write=True), cls.KEY_PREFIX)
+
+    @classmethod
+    def _current_bucket(cls) -> int:
+        return int(time.time()) // cls.BUCKET_SECONDS
+
+    @staticmethod
+    def _window() -> int:
+        return max(settings.WALLET_LOCK_CONTENTION_WINDOW, 1)
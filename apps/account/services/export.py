@@ -0,0 +1,89 @@
+import csv
+import json
+import logging
+
+from apps.common.constants import EXPORT_CHUNK_SIZE
+from apps.common.exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Echo:
+    """
+    File-like object whose `write` returns the value, used to stream `csv.writer` rows.
+    """
+
+    def write(self, value):
+        return value
+
+
+class TransactionExportService:
+    """
+    Service that streams transactions as NDJSON or CSV.
+
+    Rows are read with `QuerySet.iterator(chunk_size=EXPORT_CHUNK_SIZE)`, which uses a
+    server-side cursor on PostgreSQL, and only the exported columns are fetched, so
+    memory usage stays constant regardless of the number of exported transactions.
+    """
+
+    FORMAT_NDJSON = "ndjson"
+    FORMAT_CSV = "csv"
+    CONTENT_TYPES = {
+        FORMAT_NDJSON: "application/x-ndjson",
+        FORMAT_CSV: "text/csv",
+    }
+    FIELDS = ("id", "txid", "amount", "created_at")
+
+    @classmethod
+    def get_content_type(cls, export_format: str) -> str:
+        """
+        Returns the content type of the export format.
+
+        Raises:
+            ValidationError: If the export format is not supported.
+        """
+        if export_format not in cls.CONTENT_TYPES:
+            raise ValidationError(
+                f"Unsupported export format '{export_format}'. "
+                f"Use one of: {', '.join(cls.CONTENT_TYPES)}."
+            )
+        return cls.CONTENT_TYPES[export_format]
+
+    @classmethod
+    def stream(cls, queryset, export_format: str):
+        """
+        Yields the transactions of the queryset encoded in the export format,
+        ordered by (`created_at`, `id`).
+
+        Args:
+            queryset (QuerySet): Transactions to export.
+            export_format (str): "ndjson" or "csv".
+
+        Yields:
+            str: Encoded lines.
+        """
+        cls.get_content_type(export_format)
+        rows = (
+            queryset.order_by("created_at", "id")
+            .values_list(*cls.FIELDS)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+
+        if export_format == cls.FORMAT_CSV:
+            writer = csv.writer(_Echo())
+            yield writer.writerow(cls.FIELDS)
+            for tx_id, txid, amount, created_at in rows:
+                yield writer.writerow([tx_id, txid, amount, created_at.isoformat()])
+        else:
+            for tx_id, txid, amount, created_at in rows:
+                yield json.dumps(
+                    {
+                        "id": str(tx_id),
+                        "txid": txid,
+                        "amount": str(amount),
+                        "created_at": created_at.isoformat(),
+                    }
+                ) + "\n"
+
+        logger.info(f"Transaction export finished: format={export_format}")
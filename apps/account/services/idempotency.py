@@ -0,0 +1,118 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction as db_transaction
+
+from apps.account.exceptions import IdempotencyKeyConflictError
+from apps.account.models import IdempotencyRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyService:
+    """
+    Service that executes an operation at most once per client-supplied idempotency key.
+
+    Stored responses are looked up in the Django cache (Redis) first and fall back to
+    the `IdempotencyRecord` table, so a retried request is answered without touching
+    the wallet rows. The record row is inserted and locked in the same database
+    transaction as the operation, which serializes concurrent duplicates on the key
+    and guarantees the stored response and the ledger write commit together.
+    """
+
+    CACHE_KEY_PREFIX = "idempotency"
+
+    @classmethod
+    def execute(cls, key: str, scope: str, fingerprint: str, handler) -> dict:
+        """
+        Runs `handler` once for the given key and returns its stored outcome on retries.
+
+        Args:
+            key (str): Client-supplied idempotency key.
+            scope (str): Name of the guarded operation, e.g. "wallets.deposit".
+            fingerprint (str): Hash identifying the request the key is used with.
+            handler (callable): Performs the operation and returns a dict with
+                `status_code`, `content` and `content_type` of the rendered response.
+
+        Returns:
+            dict: `status_code`, `content`, `content_type` and `replayed` (True if the
+            outcome was stored by an earlier request).
+
+        Raises:
+            IdempotencyKeyConflictError: If the key was used with a different request.
+        """
+        cached = cls._get_cached(key)
+        if cached is not None:
+            cls._check_fingerprint(key, cached["fingerprint"], fingerprint)
+            logger.info(f"Idempotent response replayed from cache: scope={scope}, key={key}")
+            return {**cached, "replayed": True}
+
+        with db_transaction.atomic():
+            record, created = IdempotencyRecord.objects.select_for_update().get_or_create(
+                key=key, defaults={"scope": scope, "fingerprint": fingerprint}
+            )
+            if not created:
+                cls._check_fingerprint(key, record.fingerprint, fingerprint)
+                if record.status_code is not None:
+                    stored = cls._to_stored(record)
+                    cls._set_cached(key, stored)
+                    logger.info(f"Idempotent response replayed: scope={scope}, key={key}")
+                    return {**stored, "replayed": True}
+
+            outcome = handler()
+            record.status_code = outcome["status_code"]
+            record.content = outcome["content"]
+            record.content_type = outcome["content_type"]
+            record.save(update_fields=["status_code", "content", "content_type", "updated_at"])
+
+            stored = cls._to_stored(record)
+            db_transaction.on_commit(lambda: cls._set_cached(key, stored))
+
+        logger.info(f"Idempotent response stored: scope={scope}, key={key}")
+        return {**stored, "replayed": False}
+
+    @staticmethod
+    def _check_fingerprint(key: str, stored_fingerprint: str, fingerprint: str):
+        """
+        Raises IdempotencyKeyConflictError if the key was used with another request.
+        """
+        if stored_fingerprint != fingerprint:
+            logger.error(f"Idempotency key reused with a different request: key={key}")
+            raise IdempotencyKeyConflictError(key)
+
+    @staticmethod
+    def _to_stored(record: IdempotencyRecord) -> dict:
+        """
+        Returns the cacheable representation of a completed record.
+        """
+        return {
+            "fingerprint": record.fingerprint,
+            "status_code": record.status_code,
+            "content": record.content,
+            "content_type": record.content_type,
+        }
+
+    @classmethod
+    def _get_cached(cls, key: str):
+        """
+        Returns the stored outcome for the key from the cache, or None.
+
+        Cache failures are logged and treated as a miss so the database is used instead.
+        """
+        try:
+            return cache.get(f"{cls.CACHE_KEY_PREFIX}:{key}")
+        except Exception as e:
+            logger.warning(f"Idempotency cache read failed, using database: {str(e)}")
+            return None
+
+    @classmethod
+    def _set_cached(cls, key: str, stored: dict):
+        """
+        Stores the outcome for the key in the cache for IDEMPOTENCY_KEY_TTL seconds.
+        """
+        try:
+            cache.set(f"{cls.CACHE_KEY_PREFIX}:{key}", stored, timeout=settings.IDEMPOTENCY_KEY_TTL)
+        except Exception as e:
+            logger.warning(f"Idempotency cache write failed: {str(e)}")
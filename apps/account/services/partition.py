@@ -0,0 +1,442 @@
+import logging
+import re
+from datetime import date, datetime, timezone
+
+from django.db import connection
+from django.db import transaction as db_transaction
+
+from apps.account.models import Transaction
+from apps.common.exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+class TransactionPartitionService:
+    """
+    Service managing the monthly range partitions of the transaction table.
+
+    `partition_table` turns the transaction table into a table partitioned by RANGE
+    (created_at) with one partition per calendar month (UTC), named `<table>_pYYYY_MM`,
+    and a DEFAULT partition, `<table>_default`. It is run by migration 0010 when
+    DB_PARTITION_TRANSACTIONS is enabled, or later by the `partition_transactions`
+    command. Queries filtering or paginating on `created_at` only scan the matching
+    partitions. Rows of a month without a partition land in the default partition, so
+    future partitions should be created ahead of time with `create_partitions`, which
+    moves such rows to their monthly partition. Old, fully archived partitions can be
+    detached with `detach_partitions` without locking out writes to the current ones.
+    """
+
+    BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+    # Globally unique txids are kept in the txid table: unique constraints of a
+    # partitioned table must include the partition key, so "txid" alone cannot be
+    # unique on it. The trigger reserves the txid of every inserted or updated row.
+    RESERVE_TXID_FUNCTION = """
+CREATE OR REPLACE FUNCTION {trigger}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF TG_OP = 'UPDATE' AND NEW.txid IS NOT DISTINCT FROM OLD.txid THEN
+            RETURN NEW;
+        END IF;
+        DELETE FROM "{txid_table}" WHERE txid = OLD.txid;
+        IF TG_OP = 'DELETE' THEN
+            RETURN OLD;
+        END IF;
+    END IF;
+    INSERT INTO "{txid_table}" (txid) VALUES (NEW.txid);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+    @classmethod
+    def get_table(cls) -> str:
+        return Transaction._meta.db_table
+
+    @classmethod
+    def get_txid_table(cls) -> str:
+        return f"{cls.get_table()}_txid"
+
+    @classmethod
+    def get_txid_trigger(cls) -> str:
+        return f"{cls.get_table()}_reserve_txid"
+
+    @classmethod
+    def get_default_partition_name(cls) -> str:
+        return f"{cls.get_table()}_default"
+
+    @classmethod
+    def get_partition_name(cls, month: date) -> str:
+        """
+        Returns the name of the partition holding the given month, e.g.
+        "account_transaction_p2026_10".
+        """
+        return f"{cls.get_table()}_p{month:%Y_%m}"
+
+    @staticmethod
+    def get_month_start(value) -> date:
+        """
+        Returns the first day of the (UTC) month of a date or datetime.
+        """
+        if isinstance(value, datetime):
+            value = value.astimezone(timezone.utc).date()
+        return value.replace(day=1)
+
+    @staticmethod
+    def add_months(month: date, months: int) -> date:
+        """
+        Returns the first day of the month `months` after the month of `month`.
+        """
+        index = month.year * 12 + month.month - 1 + months
+        return date(index // 12, index % 12 + 1, 1)
+
+    @classmethod
+    def is_partitioned(cls) -> bool:
+        """
+        Returns whether the transaction table is partitioned in the default database.
+        """
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass",
+                [cls.get_table()],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def list_partitions(cls) -> list:
+        """
+        Returns the partitions of the transaction table ordered by range.
+
+        Returns:
+            list[dict]: `name`, `start` and `end` (exclusive) datetimes of each partition.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+                "FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = %s::regclass",
+                [cls.get_table()],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            match = cls.BOUND_PATTERN.search(bound or "")
+            if match is None:
+                continue
+            partitions.append(
+                {
+                    "name": name,
+                    "start": datetime.fromisoformat(match.group(1)),
+                    "end": datetime.fromisoformat(match.group(2)),
+                }
+            )
+        return sorted(partitions, key=lambda partition: partition["start"])
+
+    @classmethod
+    def partition_table(cls, months_ahead: int) -> list:
+        """
+        Converts the transaction table into a table range-partitioned by month on
+        created_at, with partitions from the month of the oldest transaction up to
+        `months_ahead` months ahead and a default partition. Rows, secondary indexes
+        and foreign keys are carried over; the primary key becomes (id, created_at) and
+        txid uniqueness moves to the txid table.
+
+        Copies every row under an exclusive lock in one database transaction, so plan a
+        maintenance window on large tables.
+
+        Args:
+            months_ahead (int): Number of future months to create partitions for.
+
+        Returns:
+            list[str]: Names of the created partitions.
+
+        Raises:
+            ValidationError: If the database is not PostgreSQL or the table is already
+                partitioned.
+        """
+        if connection.vendor != "postgresql":
+            raise ValidationError("Partitioning the transaction table requires PostgreSQL.")
+        if cls.is_partitioned():
+            raise ValidationError("The transaction table is already partitioned.")
+
+        table, unpartitioned = cls.get_table(), f"{cls.get_table()}_unpartitioned"
+        txid_table, trigger = cls.get_txid_table(), cls.get_txid_trigger()
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            indexes = cls._get_secondary_indexes(cursor, table)
+            foreign_keys = cls._get_foreign_keys(cursor, table)
+            cursor.execute(f'SELECT MIN(created_at) FROM "{table}"')
+            oldest = cursor.fetchone()[0]
+
+            cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{unpartitioned}"')
+            cursor.execute(
+                f'CREATE TABLE "{table}" (LIKE "{unpartitioned}" INCLUDING DEFAULTS) '
+                f"PARTITION BY RANGE (created_at)"
+            )
+            created = cls._create_default_partition(cursor)
+            now = datetime.now(timezone.utc)
+            month = cls.get_month_start(min(oldest or now, now))
+            last = cls.add_months(cls.get_month_start(now), max(months_ahead, 0))
+            while month <= last:
+                created.append(cls._create_partition(cursor, month))
+                month = cls.add_months(month, 1)
+
+            cls._move_rows(cursor, unpartitioned, indexes, foreign_keys)
+            cursor.execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY (id, created_at)')
+
+            cursor.execute(f'CREATE TABLE "{txid_table}" (txid varchar(255) PRIMARY KEY)')
+            cursor.execute(f'INSERT INTO "{txid_table}" (txid) SELECT txid FROM "{table}"')
+            cursor.execute(cls.RESERVE_TXID_FUNCTION.format(trigger=trigger, txid_table=txid_table))
+            cursor.execute(
+                f'CREATE TRIGGER "{trigger}" BEFORE INSERT OR UPDATE OF txid OR DELETE '
+                f'ON "{table}" FOR EACH ROW EXECUTE FUNCTION {trigger}()'
+            )
+        logger.info(f"Transaction table partitioned: {len(created)} partition(s)")
+        return created
+
+    @classmethod
+    def unpartition_table(cls):
+        """
+        Converts the partitioned transaction table back into a plain table with the
+        primary key on id and the unique constraint on txid, in one database
+        transaction.
+
+        Raises:
+            ValidationError: If the transaction table is not partitioned.
+        """
+        cls._check_partitioned()
+
+        table, unpartitioned = cls.get_table(), f"{cls.get_table()}_unpartitioned"
+        trigger = cls.get_txid_trigger()
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            indexes = cls._get_secondary_indexes(cursor, table)
+            foreign_keys = cls._get_foreign_keys(cursor, table)
+
+            cursor.execute(f'DROP TRIGGER "{trigger}" ON "{table}"')
+            cursor.execute(f"DROP FUNCTION {trigger}()")
+            cursor.execute(f'DROP TABLE "{cls.get_txid_table()}"')
+            cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{unpartitioned}"')
+            cursor.execute(f'CREATE TABLE "{table}" (LIKE "{unpartitioned}" INCLUDING DEFAULTS)')
+
+            cls._move_rows(cursor, unpartitioned, indexes, foreign_keys)
+            cursor.execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY (id)')
+            unique_name = connection.schema_editor()._create_index_name(
+                table, ["txid"], suffix="_uniq"
+            )
+            cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{unique_name}" UNIQUE (txid)')
+        logger.info("Transaction table unpartitioned")
+
+    @classmethod
+    def create_partitions(cls, months_ahead: int, start: date = None) -> list:
+        """
+        Creates the missing monthly partitions from `start` (default: the current
+        month) up to `months_ahead` months after the current month, and the default
+        partition if it is missing.
+
+        Transactions of a new partition's month already inserted into the default
+        partition are moved to it, and a warning is logged: partitions were not
+        created ahead of time.
+
+        Args:
+            months_ahead (int): Number of future months to cover.
+            start (date, optional): First month to cover.
+
+        Returns:
+            list[str]: Names of the created partitions.
+
+        Raises:
+            ValidationError: If the transaction table is not partitioned.
+        """
+        cls._check_partitioned()
+
+        current = cls.get_month_start(datetime.now(timezone.utc))
+        month = cls.get_month_start(start) if start else current
+        last = cls.add_months(current, max(months_ahead, 0))
+        existing = {partition["name"] for partition in cls.list_partitions()}
+
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            created = []
+            if not cls._has_default_partition(cursor):
+                created = cls._create_default_partition(cursor)
+            while month <= last:
+                if cls.get_partition_name(month) not in existing:
+                    created.append(cls._create_partition(cursor, month))
+                month = cls.add_months(month, 1)
+        return created
+
+    @classmethod
+    def count_default_rows(cls) -> int:
+        """
+        Returns the number of transactions held by the default partition, i.e.
+        inserted for a month without a partition.
+
+        Raises:
+            ValidationError: If the transaction table is not partitioned.
+        """
+        cls._check_partitioned()
+        with connection.cursor() as cursor:
+            if not cls._has_default_partition(cursor):
+                return 0
+            cursor.execute(f'SELECT COUNT(*) FROM "{cls.get_default_partition_name()}"')
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def detach_partitions(cls, before: date, drop: bool = False) -> list:
+        """
+        Detaches the partitions whose whole range lies before the month of `before`.
+
+        Partitions are detached with DETACH PARTITION CONCURRENTLY, so reads and writes
+        of the remaining partitions are not blocked; the detached tables are kept as
+        standalone tables unless `drop` is set. Only partitions that hold no live
+        (not soft-deleted) transactions are detached, as their amounts are part of the
+        wallet ledger balances. Must not be called inside an atomic block.
+
+        Args:
+            before (date): Partitions ending on or before the first day of this month
+                are detached. Must not be later than the current month.
+            drop (bool): Drop the detached tables. Defaults to False.
+
+        Returns:
+            list[str]: Names of the detached partitions.
+
+        Raises:
+            ValidationError: If the table is not partitioned, `before` is in the future
+                or a partition to detach still holds live transactions.
+        """
+        cls._check_partitioned()
+
+        cutoff = cls.get_month_start(before)
+        if cutoff > cls.get_month_start(datetime.now(timezone.utc)):
+            raise ValidationError("Cannot detach partitions of the current or future months.")
+
+        bound = cls._to_bound(cutoff)
+        partitions = [p["name"] for p in cls.list_partitions() if p["end"] <= bound]
+        with connection.cursor() as cursor:
+            for name in partitions:
+                cursor.execute(f'SELECT EXISTS (SELECT 1 FROM "{name}" WHERE NOT is_deleted)')
+                if cursor.fetchone()[0]:
+                    raise ValidationError(
+                        f"Partition {name} still holds live transactions; archive them first."
+                    )
+
+            for name in partitions:
+                cursor.execute(
+                    f'ALTER TABLE "{cls.get_table()}" DETACH PARTITION "{name}" CONCURRENTLY'
+                )
+                if drop:
+                    cursor.execute(f'DROP TABLE "{name}"')
+                logger.info(f"Transaction partition detached: {name}, dropped={drop}")
+        return partitions
+
+    @classmethod
+    def _create_partition(cls, cursor, month: date) -> str:
+        """
+        Creates the partition of the month, first moving its transactions out of the
+        default partition through the parent table, so the txid trigger releases and
+        reserves their txids again.
+        """
+        table, name = cls.get_table(), cls.get_partition_name(month)
+        bounds = [cls._to_bound(month), cls._to_bound(cls.add_months(month, 1))]
+        range_filter = "created_at >= %s AND created_at < %s"
+        moved = 0
+        if cls._has_default_partition(cursor):
+            default = cls.get_default_partition_name()
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {range_filter})', bounds
+            )
+            moved = cursor.fetchone()[0]
+        if moved:
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE "{name}_moved" ON COMMIT DROP AS '
+                f'SELECT * FROM "{default}" WHERE {range_filter}',
+                bounds,
+            )
+            cursor.execute(f'DELETE FROM "{table}" WHERE {range_filter}', bounds)
+            moved = cursor.rowcount
+
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{table}" FOR VALUES FROM (%s) TO (%s)', bounds
+        )
+        if moved:
+            cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{name}_moved"')
+            logger.warning(
+                f"Moved {moved} transaction(s) from the default partition to {name}; "
+                f"create partitions ahead of time with create_transaction_partitions"
+            )
+        logger.info(f"Transaction partition created: {name}")
+        return name
+
+    @classmethod
+    def _create_default_partition(cls, cursor) -> list:
+        name = cls.get_default_partition_name()
+        cursor.execute(f'CREATE TABLE "{name}" PARTITION OF "{cls.get_table()}" DEFAULT')
+        logger.info(f"Transaction partition created: {name}")
+        return [name]
+
+    @classmethod
+    def _has_default_partition(cls, cursor) -> bool:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass "
+            "AND partdefid <> 0",
+            [cls.get_table()],
+        )
+        return cursor.fetchone() is not None
+
+    @staticmethod
+    def _get_secondary_indexes(cursor, table: str) -> list:
+        """
+        Returns the definitions of the table's indexes not backing a constraint.
+        """
+        cursor.execute(
+            """
+            SELECT indexdef FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = %s
+              AND indexname NOT IN (
+                  SELECT conindid::regclass::text FROM pg_constraint
+                  WHERE conrelid = %s::regclass AND conindid <> 0
+              )
+            ORDER BY indexname
+            """,
+            [table, table],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _get_foreign_keys(cursor, table: str) -> list:
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f' ORDER BY conname",
+            [table],
+        )
+        return cursor.fetchall()
+
+    @classmethod
+    def _move_rows(cls, cursor, source: str, indexes: list, foreign_keys: list):
+        """
+        Copies the rows of the renamed `source` table to the new transaction table,
+        drops it and recreates the secondary indexes and foreign keys read from it
+        before it was renamed.
+        """
+        table = cls.get_table()
+        cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{source}"')
+        cursor.execute(f'DROP TABLE "{source}" CASCADE')
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+        for definition in indexes:
+            # Indexes of a partitioned table are reported as "ON ONLY <table>".
+            cursor.execute(definition.replace(" ON ONLY ", " ON ", 1))
+
+    @classmethod
+    def _check_partitioned(cls):
+        if not cls.is_partitioned():
+            raise ValidationError(
+                "The transaction table is not partitioned; run partition_transactions "
+                "on PostgreSQL."
+            )
+
+    @staticmethod
+    def _to_bound(month: date) -> datetime:
+        return datetime(month.year, month.month, 1, tzinfo=timezone.utc)
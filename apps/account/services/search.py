@@ -0,0 +1,93 @@
+import logging
+
+from django.db import connection
+
+from apps.account.models import Transaction, Wallet
+from apps.common.exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+class TrigramIndexService:
+    """
+    Service managing the pg_trgm GIN indexes serving substring search on transaction
+    IDs and wallet labels.
+
+    The indexes are built on UPPER(column::text), the expression Django uses for
+    icontains/istartswith/iexact lookups on PostgreSQL. They need the pg_trgm
+    extension, which requires the CREATE privilege on the database, so they are
+    optional: migration 0006 creates them only when DB_TRIGRAM_INDEXES is enabled
+    while it is applied, and `create_indexes` adds them later.
+    """
+
+    INDEXED_FIELDS = [
+        (Transaction, "txid"),
+        (Wallet, "label"),
+    ]
+
+    @classmethod
+    def get_indexes(cls) -> list:
+        """
+        Returns the (name, table, column) of every trigram index.
+        """
+        indexes = []
+        for model, field_name in cls.INDEXED_FIELDS:
+            table, column = model._meta.db_table, model._meta.get_field(field_name).column
+            indexes.append((f"{table}_{column}_trgm", table, column))
+        return indexes
+
+    @classmethod
+    def create_indexes(cls, concurrently: bool = False) -> list:
+        """
+        Creates the pg_trgm extension and the missing trigram indexes.
+
+        Args:
+            concurrently (bool): Build the indexes with CREATE INDEX CONCURRENTLY, which
+                does not block writes (except on a partitioned table); must not be
+                called inside an atomic block. Defaults to False.
+
+        Returns:
+            list[str]: Names of the indexes.
+
+        Raises:
+            ValidationError: If the database is not PostgreSQL.
+        """
+        cls._check_postgresql()
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for name, table, column in cls.get_indexes():
+                # Indexes of partitioned tables cannot be built concurrently.
+                cursor.execute(
+                    "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [table]
+                )
+                option = " CONCURRENTLY" if concurrently and not cursor.fetchone() else ""
+                cursor.execute(
+                    f'CREATE INDEX{option} IF NOT EXISTS "{name}" ON "{table}" '
+                    f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+                )
+                logger.info(f"Trigram index created: {name}")
+        return [name for name, _, _ in cls.get_indexes()]
+
+    @classmethod
+    def drop_indexes(cls) -> list:
+        """
+        Drops the trigram indexes; the pg_trgm extension is kept.
+
+        Returns:
+            list[str]: Names of the indexes.
+
+        Raises:
+            ValidationError: If the database is not PostgreSQL.
+        """
+        cls._check_postgresql()
+        with connection.cursor() as cursor:
+            for name, _, _ in cls.get_indexes():
+                cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+                logger.info(f"Trigram index dropped: {name}")
+        return [name for name, _, _ in cls.get_indexes()]
+
+    @staticmethod
+    def _check_postgresql():
+        if connection.vendor != "postgresql":
+            raise ValidationError("Trigram indexes require PostgreSQL.")
@@ -1,8 +1,11 @@
 import logging
+from collections import defaultdict
 from decimal import Decimal
-from uuid import uuid4
 
 from apps.account.models import Transaction, Wallet
+from apps.common.cache import invalidate_model_cache
+from apps.common.constants import BULK_OPERATION_BATCH_SIZE
+from apps.common.identifiers import get_uuid_generator
 
 
 logger = logging.getLogger(__name__)
@@ -17,8 +20,22 @@ class TransactionService:
     maintain data consistency.
     """
 
+    @staticmethod
+    def generate_txid() -> str:
+        """
+        Generates a txid as the hex string of a UUID from the generator configured for
+        Transaction primary keys, so generated txids are time-ordered under `uuid7` and
+        the txid index grows at its right edge like the primary key.
+
+        Returns:
+            str: A 32-character hex txid.
+        """
+        return get_uuid_generator(Transaction)().hex
+
     @classmethod
-    def create(cls, wallet: Wallet, amount: Decimal, txid: str = None) -> Transaction:
+    def create(
+        cls, wallet: Wallet, amount: Decimal, txid: str = None, trusted: bool = False
+    ) -> Transaction:
         """
         Creates and persists a new Transaction linked to the specified wallet,
         generating a unique txid if none is provided.
@@ -26,8 +43,11 @@ class TransactionService:
         Args:
             wallet (Wallet): The Wallet instance to associate with the transaction.
             amount (Decimal): The monetary amount of the transaction (can be positive or negative).
-            txid (str, optional): A unique transaction identifier. If omitted, a UUID-based
-                hex string will be generated automatically.
+            txid (str, optional): A unique transaction identifier. If omitted, one is generated
+                by `generate_txid`.
+            trusted (bool, optional): Set when the caller holds a `select_for_update` lock on
+                the wallet and has already validated the resulting balance. Skips the duplicate
+                model-level balance check. Defaults to False.
 
         Returns:
             Transaction: The newly created Transaction instance.
@@ -36,19 +56,69 @@ class TransactionService:
             ValidationError: If the transaction violates business constraints such as
                 wallet balance becoming negative (handled by model validation).
         """
-        generated_txid = txid or uuid4().hex
+        generated_txid = txid or cls.generate_txid()
 
         logger.info(
             f"Creating transaction: wallet_id={wallet.id}, amount={amount}, txid={generated_txid}"
         )
         logger.debug(f"Wallet before transaction: {wallet.__dict__}")
 
-        tx = Transaction.objects.create(
+        tx = Transaction(
             wallet=wallet,
             txid=generated_txid,
             amount=amount,
         )
+        tx.save(force_insert=True, trusted=trusted)
 
         logger.info(f"Transaction created: id={tx.id}")
         logger.debug(f"Transaction data: {tx.__dict__}")
         return tx
+
+    @classmethod
+    def create_many(cls, entries: list) -> list:
+        """
+        Creates Transactions for many (wallet, amount, txid) entries with `bulk_create`
+        and applies their amounts to the stored wallet balances, or to the slots of sharded
+        wallets. Cached API responses of the transaction collection and the affected
+        wallets are invalidated.
+
+        The caller must hold `select_for_update` locks on all wallets inside an atomic
+        block, except sharded wallets that are only credited, and must have validated
+        the resulting balances and txid uniqueness, as the per-row model validation of
+        `Transaction.save` is bypassed.
+
+        Args:
+            entries (list): Tuples of (Wallet, Decimal amount, txid or None). Missing
+                txids are generated automatically.
+
+        Returns:
+            list[Transaction]: The created Transaction instances, in input order.
+        """
+        transactions = [
+            Transaction(wallet=wallet, amount=amount, txid=txid or cls.generate_txid())
+            for wallet, amount, txid in entries
+        ]
+        logger.info(f"Creating {len(transactions)} transactions in bulk")
+        Transaction.objects.bulk_create(transactions, batch_size=BULK_OPERATION_BATCH_SIZE)
+
+        wallets = {}
+        sharded_deltas = defaultdict(Decimal)
+        for wallet, amount, _ in entries:
+            wallet.balance += amount
+            wallets[wallet.pk] = wallet
+            if wallet.slot_count:
+                sharded_deltas[wallet.pk] += amount
+        Wallet.all_objects.bulk_update(
+            [wallet for wallet in wallets.values() if not wallet.slot_count],
+            ["balance"],
+            batch_size=BULK_OPERATION_BATCH_SIZE,
+        )
+        Wallet.apply_balance_deltas(
+            sharded_deltas,
+            slot_counts={wallet_id: wallets[wallet_id].slot_count for wallet_id in sharded_deltas},
+        )
+        invalidate_model_cache(Transaction)
+        invalidate_model_cache(Wallet, wallets.keys())
+
+        logger.info(f"Bulk transactions created for {len(wallets)} wallet(s)")
+        return transactions
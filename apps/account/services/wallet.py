@@ -1,13 +1,24 @@
 import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from decimal import Decimal
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from django.db import transaction as db_transaction
 
 from apps.account.exceptions import SameWalletException, WalletNotFoundError
-from apps.account.models import Wallet
+from apps.account.models import ArchivedTransaction, Transaction, Wallet, WalletSlot
+from apps.account.services.contention import WalletContentionService
 from apps.account.services.transaction import TransactionService
-from apps.common.exceptions import BalanceNegativeError
+from apps.common.cache import invalidate_model_cache
+from apps.common.constants import BULK_OPERATION_BATCH_SIZE, WALLET_MAX_SLOTS
+from apps.common.exceptions import BalanceNegativeError, ValidationError
+from apps.common.metrics import (
+    BALANCE_REJECTIONS,
+    WALLET_LOCK_WAIT_SECONDS,
+    WALLET_OPERATION_SECONDS,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -20,16 +31,22 @@ class WalletService:
     like preventing negative balances.
 
     All operations are performed atomically to maintain data consistency.
+    The stored `Wallet.balance` is updated by `Transaction.save` inside the same
+    database transaction, so the locked wallet row always reflects the ledger.
+    Wallet rows are locked with FOR NO KEY UPDATE, which does not block the ledger
+    inserts of concurrent deposits to sharded wallets (see `set_slot_count`).
     """
 
     @classmethod
+    @WALLET_OPERATION_SECONDS.labels(operation="apply_cash_flow").time()
     def apply_cash_flow(cls, wallet_id: str, amount: Decimal, txid: str = None):
         """
         Applies a cash flow operation to a wallet (e.g., deposit or withdrawal).
 
         This method locks the wallet row for update to prevent race conditions,
         validates that the wallet balance will not become negative,
-        and creates a corresponding Transaction record.
+        and creates a corresponding Transaction record. Deposits to a sharded wallet
+        do not lock the wallet row: they only lock the slot they are added to.
 
         Args:
             wallet_id (str): UUID of the wallet.
@@ -46,10 +63,17 @@ class WalletService:
         logger.info(f"Applying cash flow: amount={amount}")
         logger.debug(f"Cash flow txid={txid}")
         with db_transaction.atomic():
-            try:
-                wallet = Wallet.objects.select_for_update().get(id=wallet_id)
+            locked = Wallet.objects.select_for_update(no_key=True).filter(id=wallet_id)
+            if amount > 0:
+                locked = locked.filter(slot_count=0)
+            with cls._record_lock_wait("apply_cash_flow", [wallet_id]) as waited_ids:
+                wallet = locked.first()
+                waited_ids[:] = [wallet.id] if wallet is not None else []
+            if wallet is not None:
                 logger.debug(f"Locked wallet: {wallet}")
-            except Wallet.DoesNotExist:
+            elif amount > 0:
+                wallet = Wallet.objects.filter(id=wallet_id).first()
+            if wallet is None:
                 logger.error(f"Wallet not found: {wallet_id}")
                 raise WalletNotFoundError(wallet_id)
             cls._validate_balance(wallet, amount)
@@ -57,18 +81,105 @@ class WalletService:
             transaction = TransactionService.create(
                 wallet=wallet,
                 amount=amount,
-                txid=txid or uuid4().hex,
+                txid=txid or TransactionService.generate_txid(),
+                trusted=True,
             )
 
             logger.info(f"Deposit transaction created: id={transaction.id}")
             return transaction
 
     @classmethod
+    def apply_cash_flows_bulk(cls, items: list, atomic: bool = True) -> list:
+        """
+        Applies many cash flow operations (deposits or withdrawals) in one database transaction.
+
+        The affected wallets are locked with `select_for_update` in ascending id order,
+        so concurrent bulk requests cannot deadlock each other; sharded wallets that only
+        receive deposits are not locked. Items are validated in input order against an
+        in-memory running balance per wallet, and all accepted Transaction rows are
+        inserted with a single `bulk_create`.
+
+        Args:
+            items (list): Dicts with keys `wallet_id`, `amount` (Decimal) and optional `txid`.
+            atomic (bool, optional): If True (all-or-nothing), nothing is written when any
+                item fails. If False (best-effort), valid items are applied and failed ones
+                are reported. Defaults to True.
+
+        Returns:
+            list[dict]: One result per item, in input order, with keys `index`, `wallet_id`,
+            `txid`, `amount`, `status` ("applied", "failed" or "skipped"), `transaction_id`
+            and `error`.
+        """
+        logger.info(f"Applying {len(items)} cash flows in bulk: atomic={atomic}")
+        results = [
+            {
+                "index": index,
+                "wallet_id": str(item["wallet_id"]),
+                "txid": item.get("txid") or TransactionService.generate_txid(),
+                "amount": item["amount"],
+                "status": None,
+                "transaction_id": None,
+                "error": None,
+            }
+            for index, item in enumerate(items)
+        ]
+
+        wallet_ids = {cls._parse_uuid(result["wallet_id"]) for result in results}
+        debited = {
+            cls._parse_uuid(result["wallet_id"]) for result in results if result["amount"] < 0
+        }
+        with db_transaction.atomic():
+            wallets = cls._lock_wallets(
+                wallet_ids - {None},
+                "apply_cash_flows_bulk",
+                credit_only_ids=wallet_ids - debited - {None},
+            )
+            existing_txids = cls._find_existing_txids(result["txid"] for result in results)
+
+            balances = {wallet_id: wallet.balance for wallet_id, wallet in wallets.items()}
+            seen_txids = set()
+            accepted = []
+            for result in results:
+                wallet = wallets.get(cls._parse_uuid(result["wallet_id"]))
+                if wallet is None:
+                    result["error"] = "Wallet not found"
+                elif result["txid"] in existing_txids or result["txid"] in seen_txids:
+                    result["error"] = "Duplicate txid"
+                elif balances[wallet.id] + result["amount"] < 0:
+                    result["error"] = "Insufficient wallet funds"
+                else:
+                    balances[wallet.id] += result["amount"]
+                    seen_txids.add(result["txid"])
+                    accepted.append((result, wallet))
+                    continue
+                result["status"] = "failed"
+
+            failed = len(results) - len(accepted)
+            if atomic and failed:
+                logger.error(f"Bulk cash flow rejected: {failed} of {len(results)} item(s) failed")
+                for result, _ in accepted:
+                    result["status"] = "skipped"
+                return results
+
+            transactions = TransactionService.create_many(
+                [(wallet, result["amount"], result["txid"]) for result, wallet in accepted]
+            )
+            for (result, _), transaction in zip(accepted, transactions):
+                result["status"] = "applied"
+                result["transaction_id"] = str(transaction.id)
+
+        logger.info(f"Bulk cash flow applied: applied={len(accepted)}, failed={failed}")
+        return results
+
+    @classmethod
+    @WALLET_OPERATION_SECONDS.labels(operation="transfer").time()
     def transfer(cls, source_id: str, dest_id: str, amount: Decimal):
         """
         Transfers funds between two wallets by creating offsetting transactions.
 
-        Locks both wallets for update to prevent concurrent modifications.
+        Locks both wallets for update in ascending id order to prevent concurrent
+        modifications and deadlocks between opposite transfers. A sharded destination
+        wallet is not locked: the amount is added to one of its slots.
         Validates that the source wallet has sufficient funds before proceeding.
 
         Args:
@@ -86,6 +197,7 @@ class WalletService:
         logger.info(f"Initiating transfer: from={source_id} to={dest_id}, amount={amount}")
         if amount <= 0:
             logger.error("Transfer amount must be positive")
+            BALANCE_REJECTIONS.labels(reason="non_positive_amount").inc()
             raise BalanceNegativeError("Transfer amount must be positive")
         if source_id == dest_id:
             logger.error("Source and destination wallets are the same")
@@ -94,7 +206,9 @@ class WalletService:
         source_uuid = UUID(source_id)
         dest_uuid = UUID(dest_id)
         with db_transaction.atomic():
-            found_wallets = Wallet.objects.select_for_update().in_bulk([source_id, dest_id])
+            found_wallets = cls._lock_wallets(
+                [source_uuid, dest_uuid], "transfer", credit_only_ids=[dest_uuid]
+            )
             source = found_wallets.get(source_uuid)
             dest = found_wallets.get(dest_uuid)
 
@@ -109,39 +223,281 @@ class WalletService:
             dest = found_wallets[dest_uuid]
 
             logger.debug(f"Locked wallets: source={source}, dest={dest}")
-            cls._validate_balance(source, amount)
+            cls._validate_balance(source, amount.copy_negate())
 
             out_tx = TransactionService.create(
                 wallet=source,
                 amount=amount.copy_negate(),
-                txid=uuid4().hex,
+                txid=TransactionService.generate_txid(),
+                trusted=True,
             )
             in_tx = TransactionService.create(
                 wallet=dest,
                 amount=amount,
-                txid=uuid4().hex,
+                txid=TransactionService.generate_txid(),
+                trusted=True,
             )
             logger.info(f"Transfer complete: out_tx={out_tx.id}, in_tx={in_tx.id}")
             return source, dest
 
+    @classmethod
+    def transfer_many(cls, transfers: list) -> list:
+        """
+        Applies many transfers between wallets atomically in one database transaction.
+
+        Locks the union of all involved wallets with `select_for_update` in ascending id
+        order, so concurrent batches (including opposite A->B / B->A transfers) cannot
+        deadlock; sharded wallets with a non-negative netted balance change are not
+        locked. The balance deltas are netted per wallet in memory, every wallet's
+        resulting balance is validated once, and all transfer legs are written with a
+        single `bulk_create`.
+
+        Args:
+            transfers (list): Dicts with keys `source_id`, `dest_id` and positive `amount`.
+
+        Returns:
+            list[Wallet]: Updated instances of all involved wallets, ordered by id.
+
+        Raises:
+            BalanceNegativeError: If an amount is not positive or a wallet's netted
+                balance would become negative.
+            SameWalletException: If a transfer has the same source and destination.
+            WalletNotFoundError: If one or more wallets are not found.
+        """
+        logger.info(f"Initiating batch of {len(transfers)} transfers")
+        legs = []
+        for transfer in transfers:
+            if transfer["amount"] <= 0:
+                logger.error("Transfer amount must be positive")
+                BALANCE_REJECTIONS.labels(reason="non_positive_amount").inc()
+                raise BalanceNegativeError("Transfer amount must be positive")
+            source_uuid = cls._parse_uuid(transfer["source_id"])
+            dest_uuid = cls._parse_uuid(transfer["dest_id"])
+            if source_uuid is None or dest_uuid is None:
+                invalid = [
+                    str(w_id)
+                    for w_id, uuid in [
+                        (transfer["source_id"], source_uuid),
+                        (transfer["dest_id"], dest_uuid),
+                    ]
+                    if uuid is None
+                ]
+                raise WalletNotFoundError(invalid)
+            if source_uuid == dest_uuid:
+                logger.error("Source and destination wallets are the same")
+                raise SameWalletException
+            legs.append((source_uuid, dest_uuid, transfer["amount"]))
+
+        deltas = defaultdict(Decimal)
+        for source, dest, amount in legs:
+            deltas[source] -= amount
+            deltas[dest] += amount
+
+        wallet_ids = set(deltas)
+        with db_transaction.atomic():
+            wallets = cls._lock_wallets(
+                wallet_ids,
+                "transfer_many",
+                credit_only_ids=[wallet_id for wallet_id, delta in deltas.items() if delta >= 0],
+            )
+            missing = sorted(str(wallet_id) for wallet_id in wallet_ids - wallets.keys())
+            if missing:
+                logger.error(f"Missing wallet(s): {missing}")
+                raise WalletNotFoundError(missing)
+
+            for wallet_id, delta in deltas.items():
+                if delta < 0:
+                    cls._validate_balance(wallets[wallet_id], delta)
+
+            entries = []
+            for source, dest, amount in legs:
+                entries.append((wallets[source], amount.copy_negate(), None))
+                entries.append((wallets[dest], amount, None))
+            TransactionService.create_many(entries)
+
+            logger.info(f"Transfer batch complete: transfers={len(legs)}, wallets={len(wallets)}")
+            return list(wallets.values())
+
+    @classmethod
+    def set_slot_count(cls, wallet_id: str, slot_count: int) -> Wallet:
+        """
+        Shards a wallet into `slot_count` balance slots, or unshards it with 0.
+
+        Sharding lets concurrent deposits to a hot wallet proceed in parallel, each
+        locking one random slot instead of the wallet row; withdrawals and transfers
+        lock as few slots as cover their amount. The wallet row is locked with a full
+        FOR UPDATE lock, which waits for the deposits in progress and blocks new ones
+        (their ledger inserts share-lock the wallet row), and the whole balance is moved
+        to the first slot, or back to the wallet row when unsharding.
+
+        Args:
+            wallet_id (str): UUID of the wallet.
+            slot_count (int): Number of slots, from 0 to WALLET_MAX_SLOTS.
+
+        Returns:
+            Wallet: The updated wallet instance.
+
+        Raises:
+            ValidationError: If the slot count is out of range.
+            WalletNotFoundError: If the wallet does not exist.
+        """
+        if not 0 <= slot_count <= WALLET_MAX_SLOTS:
+            raise ValidationError(f"Slot count must be between 0 and {WALLET_MAX_SLOTS}.")
+
+        logger.info(f"Setting wallet slot count: wallet_id={wallet_id}, slot_count={slot_count}")
+        with db_transaction.atomic():
+            try:
+                wallet = Wallet.objects.select_for_update().get(id=wallet_id)
+            except Wallet.DoesNotExist:
+                logger.error(f"Wallet not found: {wallet_id}")
+                raise WalletNotFoundError(wallet_id)
+
+            balance = wallet.balance
+            WalletSlot.objects.filter(wallet=wallet).delete()
+            WalletSlot.objects.bulk_create(
+                WalletSlot(wallet=wallet, index=index, balance=balance if index == 0 else 0)
+                for index in range(slot_count)
+            )
+            Wallet.all_objects.filter(pk=wallet.pk).update(
+                slot_count=slot_count, balance=Decimal("0") if slot_count else balance
+            )
+            invalidate_model_cache(Wallet, [wallet.pk])
+
+        wallet.refresh_from_db()
+        logger.info(f"Wallet slot count set: wallet_id={wallet.id}, balance={wallet.balance}")
+        return wallet
+
     @staticmethod
     def _validate_balance(wallet: Wallet, delta: Decimal):
         """
         Validates that the wallet balance will not become negative after applying delta.
 
+        The balance is read once from the wallet instance, which must be locked with
+        `select_for_update` by the caller; this check is what allows the subsequent
+        `TransactionService.create(..., trusted=True)` to skip the model-level check.
+
         Args:
-            wallet (Wallet): The wallet instance to check.
+            wallet (Wallet): The locked wallet instance to check.
             delta (Decimal): The amount to apply (positive or negative).
 
         Raises:
             BalanceNegativeError: If the resulting balance would be negative.
         """
-        new_balance = wallet.balance + delta
+        current_balance = wallet.balance
+        new_balance = current_balance + delta
         logger.info(
-            f"Validating wallet balance: current={wallet.balance}, delta={delta}, new={new_balance}"
+            f"Validating wallet balance: current={current_balance}, delta={delta}, new={new_balance}"
         )
         if new_balance < 0:
             logger.error(
-                f"Balance would become negative for wallet_id={wallet.id}: {wallet.balance} + ({delta})"
+                f"Balance would become negative for wallet_id={wallet.id}: {current_balance} + ({delta})"
             )
+            BALANCE_REJECTIONS.labels(reason="insufficient_funds").inc()
             raise BalanceNegativeError("Insufficient wallet funds")
+
+    @staticmethod
+    def _parse_uuid(value):
+        """
+        Returns the value as a UUID, or None if it is not a valid UUID.
+        """
+        try:
+            return value if isinstance(value, UUID) else UUID(str(value))
+        except ValueError:
+            return None
+
+    @classmethod
+    def _lock_wallets(cls, wallet_ids, operation: str, credit_only_ids=()) -> dict:
+        """
+        Locks the given wallets with `select_for_update` in ascending id order.
+
+        A deterministic lock order prevents deadlocks between concurrent operations
+        that touch overlapping sets of wallets. Invalid and soft-deleted ids are ignored.
+        The lock wait of every batch is recorded for the wallets of the batch.
+
+        Sharded wallets among `credit_only_ids` are read without locking, as credits
+        to a sharded wallet only lock one of its slots. Those found unsharded by then
+        are locked after the batch, in id order.
+
+        Args:
+            wallet_ids: Iterable of wallet UUIDs or UUID strings.
+            operation (str): Name of the calling operation, for the lock wait metrics.
+            credit_only_ids: Iterable of the wallet ids that are only credited.
+
+        Returns:
+            dict: Mapping of wallet UUID to the Wallet instance.
+        """
+        ordered_ids = sorted({uuid for uuid in map(cls._parse_uuid, wallet_ids) if uuid})
+        credit_only = {uuid for uuid in map(cls._parse_uuid, credit_only_ids) if uuid}
+        wallets = {}
+        for start in range(0, len(ordered_ids), BULK_OPERATION_BATCH_SIZE):
+            end = start + BULK_OPERATION_BATCH_SIZE
+            batch = ordered_ids[start:end]
+            batch_credit_only = credit_only.intersection(batch)
+            locked = Wallet.objects.select_for_update(no_key=True).filter(id__in=batch)
+            if batch_credit_only:
+                locked = locked.exclude(id__in=batch_credit_only, slot_count__gt=0)
+            with cls._record_lock_wait(operation, batch) as waited_ids:
+                locked = list(locked.order_by("id"))
+                waited_ids[:] = [wallet.id for wallet in locked]
+            for wallet in locked:
+                wallets[wallet.id] = wallet
+
+            unlocked = batch_credit_only - wallets.keys()
+            unsharded = []
+            if unlocked:
+                for wallet in Wallet.objects.filter(id__in=unlocked):
+                    if wallet.slot_count:
+                        wallets[wallet.id] = wallet
+                    else:
+                        unsharded.append(wallet.id)
+            if unsharded:
+                # Unsharded after the locked query, which skipped them as sharded.
+                locked = Wallet.objects.select_for_update(no_key=True).filter(id__in=unsharded)
+                with cls._record_lock_wait(operation, unsharded) as waited_ids:
+                    locked = list(locked.order_by("id"))
+                    waited_ids[:] = [wallet.id for wallet in locked]
+                for wallet in locked:
+                    wallets[wallet.id] = wallet
+        logger.debug(f"Locked {len(wallets)} wallet(s)")
+        return wallets
+
+    @staticmethod
+    @contextmanager
+    def _record_lock_wait(operation: str, wallet_ids: list):
+        """
+        Records the time spent in the block acquiring the locks of the given wallets.
+
+        Yields the list of wallet ids to record, which the block narrows down to the
+        wallets it actually locked. The wait is observed in the
+        `wallet_lock_wait_seconds` histogram and added to the contention report right
+        away, also when acquiring the locks fails (lock timeout, deadlock) or the
+        transaction later rolls back: those are the most contended cases, and the
+        report lives in the cache, not in the database.
+        """
+        waited_ids = list(wallet_ids)
+        started = time.perf_counter()
+        try:
+            yield waited_ids
+        finally:
+            wait = time.perf_counter() - started
+            WALLET_LOCK_WAIT_SECONDS.labels(operation=operation).observe(wait)
+            WalletContentionService.record(waited_ids, wait)
+
+    @staticmethod
+    def _find_existing_txids(txids) -> set:
+        """
+        Returns the subset of the given txids that are already used by a transaction,
+        archived transactions included.
+        """
+        txids = list(set(txids))
+        existing = set()
+        for start in range(0, len(txids), BULK_OPERATION_BATCH_SIZE):
+            end = start + BULK_OPERATION_BATCH_SIZE
+            batch = txids[start:end]
+            existing.update(
+                Transaction.all_objects.filter(txid__in=batch).values_list("txid", flat=True)
+            )
+            existing.update(
+                ArchivedTransaction.objects.filter(txid__in=batch).values_list("txid", flat=True)
+            )
+        return existing
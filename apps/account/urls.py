@@ -1,6 +1,14 @@
+from django.urls import path
+
 from rest_framework.routers import DefaultRouter
 
-from apps.account.api.v1.views import TransactionViewSet, WalletViewSet
+from apps.account.api.v1.views import (
+    ArchivedTransactionViewSet,
+    AsyncTransactionView,
+    AsyncWalletView,
+    TransactionViewSet,
+    WalletViewSet,
+)
 
 
 router = DefaultRouter()
@@ -10,8 +18,25 @@ Registers API routes for Wallet and Transaction resources using DRF's DefaultRou
 Endpoints:
 - /wallets/ for WalletViewSet
 - /transactions/ for TransactionViewSet
+- /archived-transactions/ for ArchivedTransactionViewSet (read-only)
 
 This router automatically generates standard RESTful routes for the registered viewsets.
 """
 router.register(r"wallets", WalletViewSet)
 router.register(r"transactions", TransactionViewSet)
+router.register(r"archived-transactions", ArchivedTransactionViewSet)
+
+async_urlpatterns = [
+    path("wallets/", AsyncWalletView.as_view(), name="async-wallet-list"),
+    path("wallets/<uuid:pk>/", AsyncWalletView.as_view(), name="async-wallet-detail"),
+    path("transactions/", AsyncTransactionView.as_view(), name="async-transaction-list"),
+    path(
+        "transactions/<uuid:pk>/",
+        AsyncTransactionView.as_view(),
+        name="async-transaction-detail",
+    ),
+]
+"""
+Async read-only variants of the wallet and transaction list and retrieve endpoints,
+served without blocking a worker when the application runs under ASGI.
+"""
@@ -0,0 +1,209 @@
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from apps.common.metrics import CACHE_REQUESTS
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION_KEY_PREFIX = "cache-version"
+
+
+def get_cache_namespace(model) -> str:
+    """
+    Returns the cache namespace of a model, e.g. "account.wallet".
+    """
+    return model._meta.label_lower
+
+
+def get_object_version_name(model, pk) -> str:
+    """
+    Returns the cache version name of a model instance, e.g. "account.wallet:<uuid>".
+
+    The primary key is converted to its canonical form first, so every spelling of it
+    (e.g. an uppercase or hyphenless UUID in a URL) shares one version. Invalid values
+    are used as they are.
+    """
+    try:
+        pk = model._meta.pk.to_python(pk)
+    except DjangoValidationError:
+        pass
+    return f"{get_cache_namespace(model)}:{pk}"
+
+
+def get_cache_versions(names: list) -> list:
+    """
+    Returns the current version of each named cache entry group.
+
+    Missing versions are initialized with the current time in nanoseconds rather than
+    zero, so a version evicted from the cache never comes back to an old value and
+    cannot resurrect responses cached under it.
+
+    Args:
+        names (list): Version names, e.g. ["account.wallet", "account.wallet:<uuid>"].
+
+    Returns:
+        list[int]: Versions in the order of `names`.
+    """
+    keys = [f"{CACHE_VERSION_KEY_PREFIX}:{name}" for name in names]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = time.time_ns()
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def build_versioned_cache_key(prefix: str, names: list, *parts) -> str:
+    """
+    Builds a cache key that changes whenever one of the named versions is bumped.
+
+    Args:
+        prefix (str): Key prefix, e.g. "response:account.wallet:retrieve".
+        names (list): Version names the cached value depends on.
+        *parts: Values identifying the cached value, e.g. the request path.
+
+    Returns:
+        str: The cache key.
+    """
+    versions = ".".join(str(version) for version in get_cache_versions(names))
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f"{prefix}:{versions}:{digest}"
+
+
+def invalidate_model_cache(model, pks=()):
+    """
+    Invalidates cached responses of a model's collection and of the given objects,
+    together with the given objects in the `ObjectCache`.
+
+    Bumps the collection version `<namespace>` and the object versions
+    `<namespace>:<pk>`. The bump is applied immediately and, when called inside an
+    atomic block, once more after commit: a response cached by a concurrent reader
+    between the write and the commit still holds the old data and is discarded by
+    the second bump.
+
+    Args:
+        model: Model class whose cached responses are invalidated.
+        pks (iterable): Primary keys of the changed objects.
+    """
+    names = [get_cache_namespace(model), *(get_object_version_name(model, pk) for pk in pks)]
+
+    _bump_cache_versions(names)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump_cache_versions(names))
+
+
+def _bump_cache_versions(names: list):
+    """
+    Increments the named versions. Cache failures are logged and ignored.
+    """
+    for name in names:
+        key = f"{CACHE_VERSION_KEY_PREFIX}:{name}"
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+        except Exception as e:
+            logger.warning(f"Cache version bump failed: key={key}, error={str(e)}")
+
+
+class ObjectCache:
+    """
+    Read-through cache of model instances looked up by primary key.
+
+    Instances are stored in the "objects" cache alias, configured by the
+    OBJECT_CACHE_BACKEND setting (Redis, bounded local memory or disabled). Their keys
+    embed the object version kept in the shared default cache, so an instance cached
+    in the local memory of one process is invalidated by `invalidate_model_cache`
+    called in any other process.
+
+    Hit and miss counters are kept per process and returned by `get_stats`, and are
+    exported for all processes by the `cache_requests_total` metric.
+    """
+
+    CACHE_ALIAS = "objects"
+    KEY_PREFIX = "object"
+
+    _stats = {"hits": 0, "misses": 0}
+    _stats_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, model, pk):
+        """
+        Returns the instance of the model with the given primary key, including
+        soft-deleted ones, from the cache or from the database on a miss.
+
+        Args:
+            model: Model class of the instance.
+            pk: Primary key of the instance, in any form accepted by the pk field.
+
+        Returns:
+            Model: The instance.
+
+        Raises:
+            model.DoesNotExist: If no instance with the primary key exists.
+        """
+        namespace = get_cache_namespace(model)
+        version_name = get_object_version_name(model, pk)
+        try:
+            key = build_versioned_cache_key(
+                f"{cls.KEY_PREFIX}:{namespace}", [version_name], version_name
+            )
+            instance = caches[cls.CACHE_ALIAS].get(key)
+        except Exception as e:
+            logger.warning(f"Object cache read failed: {str(e)}")
+            key, instance = None, None
+
+        if instance is not None:
+            cls._record("hits", namespace)
+            return instance
+
+        cls._record("misses", namespace)
+        # Misses are read from the primary, so a lagging replica never refills the
+        # cache with an instance older than its current version.
+        instance = model.all_objects.using(DEFAULT_DB_ALIAS).get(pk=pk)
+        if key is not None:
+            try:
+                caches[cls.CACHE_ALIAS].set(key, instance, timeout=settings.OBJECT_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Object cache write failed: {str(e)}")
+        return instance
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Returns the hit and miss counters of the current process and the hit ratio.
+        """
+        with cls._stats_lock:
+            hits, misses = cls._stats["hits"], cls._stats["misses"]
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    @classmethod
+    def reset_stats(cls):
+        """
+        Resets the hit and miss counters of the current process.
+        """
+        with cls._stats_lock:
+            cls._stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def _record(cls, counter: str, namespace: str):
+        with cls._stats_lock:
+            cls._stats[counter] += 1
+        result = "hit" if counter == "hits" else "miss"
+        CACHE_REQUESTS.labels(cache="object", model=namespace, result=result).inc()
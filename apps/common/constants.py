@@ -1,6 +1,218 @@
+import base64
+import binascii
+import json
+import uuid
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import Response
 from rest_framework_json_api.pagination import JsonApiPageNumberPagination
 
 
 class StandardResultsSetPagination(JsonApiPageNumberPagination):
     page_size = 10
     max_page_size = 100
+
+
+class KeysetResultsSetPagination(StandardResultsSetPagination):
+    """
+    JSON:API pagination that switches to keyset (cursor) pagination on request.
+
+    Without the `page[cursor]` query parameter it behaves like
+    StandardResultsSetPagination. With it (an empty value starts at the first page),
+    results are ordered by (`created_at`, `id`) in the direction of the view's default
+    ordering and each page is fetched with `WHERE (created_at, id) > cursor LIMIT n`,
+    so deep pages cost the same as the first one and no OFFSET is used.
+
+    In keyset mode:
+      - `page[size]` sets the page size as usual.
+      - `page[count]=false` omits the total count and its COUNT(*) query.
+      - `links.next` / `links.prev` carry opaque cursors; there is no `last` link.
+      - The `ordering` query parameter is ignored; keyset order is always used.
+    """
+
+    cursor_query_param = "page[cursor]"
+    count_query_param = "page[count]"
+    keyset_fields = ("created_at", "id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        page_queryset = self._start_keyset_page(queryset, request, view)
+        self.count = queryset.count() if self.count_requested else None
+        return self._end_keyset_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async variant of `paginate_queryset` for async views, using the async ORM.
+
+        Always paginates in keyset mode; a missing `page[cursor]` means the first page.
+        """
+        self.keyset = True
+        page_queryset = self._start_keyset_page(queryset, request, view)
+        self.count = await queryset.acount() if self.count_requested else None
+        return self._end_keyset_page([row async for row in page_queryset])
+
+    def _start_keyset_page(self, queryset, request, view):
+        """
+        Reads the keyset parameters of the request and returns the queryset of the
+        page, ordered by (`created_at`, `id`) and limited to one row past the page
+        size.
+        """
+        self.request = request
+        self.keyset_page_size = self.get_page_size(request)
+        self.descending = self._is_descending(view)
+        self.position, self.reverse = self._decode_cursor(
+            request.query_params.get(self.cursor_query_param, "")
+        )
+
+        self.count_requested = request.query_params.get(self.count_query_param, "").lower() not in (
+            "false",
+            "0",
+        )
+
+        # Walking backwards is a forward walk in the opposite direction.
+        descending = self.descending != self.reverse
+        if self.position is not None:
+            queryset = queryset.filter(self._after(self.position, descending))
+        order = [f"-{field}" if descending else field for field in self.keyset_fields]
+        return queryset.order_by(*order)[: self.keyset_page_size + 1]
+
+    def _end_keyset_page(self, rows):
+        """
+        Trims the extra row fetched by `_start_keyset_page`, restores the display
+        order and computes the positions of the next and previous links.
+        """
+        has_more = len(rows) > self.keyset_page_size
+        rows = rows[: self.keyset_page_size]
+        if self.reverse:
+            rows.reverse()
+
+        self.next_position = self.prev_position = None
+        if rows:
+            first, last = self._position(rows[0]), self._position(rows[-1])
+            if self.reverse:
+                self.next_position = last
+                self.prev_position = first if has_more else None
+            else:
+                self.next_position = last if has_more else None
+                self.prev_position = first if self.position is not None else None
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+
+        pagination = {"size": self.keyset_page_size}
+        if self.count is not None:
+            pagination["count"] = self.count
+        return Response(
+            {
+                "results": data,
+                "meta": {"pagination": pagination},
+                "links": {
+                    "first": replace_query_param(
+                        self.request.build_absolute_uri(), self.cursor_query_param, ""
+                    ),
+                    "next": self._build_cursor_link(self.next_position, reverse=False),
+                    "prev": self._build_cursor_link(self.prev_position, reverse=True),
+                },
+            }
+        )
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters += [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Keyset pagination cursor; send an empty value for the first page.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to false to omit the total count in keyset mode.",
+                "schema": {"type": "boolean"},
+            },
+        ]
+        return parameters
+
+    def _is_descending(self, view) -> bool:
+        ordering = getattr(view, "ordering", None) or self.keyset_fields
+        if isinstance(ordering, str):
+            ordering = [ordering]
+        return ordering[0].startswith("-")
+
+    def _after(self, position, descending) -> Q:
+        """
+        Returns a filter selecting rows after `position` in keyset order.
+
+        Written as `created_at >= c AND (created_at > c OR id > i)` so the leading
+        conjunct is an index range condition on `created_at`.
+        """
+        created_at, pk = position
+        op = "lt" if descending else "gt"
+        bound = "lte" if descending else "gte"
+        return Q(**{f"created_at__{bound}": created_at}) & (
+            Q(**{f"created_at__{op}": created_at}) | Q(**{f"id__{op}": pk})
+        )
+
+    @staticmethod
+    def _position(row):
+        return row.created_at, row.id
+
+    def _decode_cursor(self, value):
+        """
+        Returns the (position, reverse) encoded in the cursor; position is None for
+        the first page.
+
+        Raises:
+            NotFound: If the cursor is malformed.
+        """
+        if not value:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(value.encode()))
+            created_at = parse_datetime(payload["c"])
+            if created_at is None:
+                raise ValueError(payload["c"])
+            return (created_at, uuid.UUID(str(payload["i"]))), bool(payload.get("r"))
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound("Invalid cursor.")
+
+    def _build_cursor_link(self, position, reverse):
+        if position is None:
+            return None
+        created_at, pk = position
+        payload = {"c": created_at.isoformat(), "i": str(pk), "r": reverse}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+
+BULK_OPERATION_MAX_ITEMS = 50_000
+"""Maximum number of items accepted by a single bulk wallet operation request."""
+
+BULK_OPERATION_MAX_ITEM_BYTES = 512
+"""Upper bound of the JSON size of one bulk operation item (ids, amount and a 255-char txid)."""
+
+BULK_OPERATION_MAX_BODY_SIZE = BULK_OPERATION_MAX_ITEMS * BULK_OPERATION_MAX_ITEM_BYTES
+"""Maximum request body size of bulk wallet operations, in bytes."""
+
+BULK_OPERATION_BATCH_SIZE = 1_000
+"""Number of rows locked, inserted or updated per query by bulk wallet operations."""
+
+EXPORT_CHUNK_SIZE = 2_000
+"""Number of rows fetched per server-side cursor round trip by streaming exports."""
+
+WALLET_MAX_SLOTS = 256
+"""Maximum number of balance slots of a sharded wallet."""
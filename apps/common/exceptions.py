@@ -2,10 +2,23 @@ from rest_framework import status
 from rest_framework.exceptions import APIException
 
 
-class BalanceNegativeError(APIException):
+class ValidationError(APIException):
+    """
+    Generic validation error for invalid input or business rule violations.
+
+    Returns HTTP 400 Bad Request with a default validation error message.
+    """
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = "Validation error occurred."
+    default_code = "validation_error"
+
+
+class BalanceNegativeError(ValidationError):
     """
     Exception raised when an operation would cause a wallet's balance to become negative.
 
+    Subclasses ValidationError so callers handling business rule violations catch it too.
     Returns HTTP 400 Bad Request with a descriptive error message.
     """
 
@@ -14,13 +27,23 @@ class BalanceNegativeError(APIException):
     default_code = "wallet_balance_negative"
 
 
-class ValidationError(APIException):
+class RequestBodyTooLargeError(APIException):
     """
-    Generic validation error for invalid input or business rule violations.
+    Exception raised when a request body exceeds the size accepted by its endpoint.
 
-    Returns HTTP 400 Bad Request with a default validation error message.
+    Returns HTTP 413 Content Too Large.
     """
 
-    status_code = status.HTTP_400_BAD_REQUEST
-    default_detail = "Validation error occurred."
-    default_code = "validation_error"
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "Request body is too large."
+    default_code = "request_body_too_large"
+
+
+class QueryBudgetExceededError(Exception):
+    """
+    Raised by QueryProfilingMiddleware when a request executes more SQL statements than
+    its query budget and QUERY_BUDGET_ACTION is "raise".
+
+    Not an API error: it is meant to fail tests, and results in HTTP 500 if raised in
+    production.
+    """
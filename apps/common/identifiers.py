@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+
+UUID_GENERATOR_UUID4 = "uuid4"
+UUID_GENERATOR_UUID7 = "uuid7"
+
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Returns a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits hold the Unix timestamp in milliseconds and the following 12 bits
+    a counter that starts at a random value every millisecond, so UUIDs generated by
+    one process are strictly increasing. The remaining 62 bits are random.
+    """
+    global _uuid7_last_ms, _uuid7_counter
+
+    with _uuid7_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _uuid7_last_ms:
+            _uuid7_last_ms = now_ms
+            _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                # Counter exhausted within one millisecond: borrow the next one.
+                _uuid7_last_ms += 1
+                _uuid7_counter = 0
+        timestamp_ms, counter = _uuid7_last_ms, _uuid7_counter
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
+
+
+UUID_GENERATORS = {
+    UUID_GENERATOR_UUID4: uuid.uuid4,
+    UUID_GENERATOR_UUID7: uuid7,
+}
+
+
+def get_uuid_generator(model):
+    """
+    Returns the UUID generator configured for the model.
+
+    The generator is looked up by model label (e.g. "account.transaction") in the
+    UUID_PK_GENERATORS setting and falls back to UUID_PK_GENERATOR.
+
+    Args:
+        model: Model class or model label.
+
+    Returns:
+        callable: Function returning a new `uuid.UUID`.
+
+    Raises:
+        ImproperlyConfigured: If the configured generator is unknown.
+    """
+    label = model if isinstance(model, str) else model._meta.label_lower
+    name = settings.UUID_PK_GENERATORS.get(label.lower(), settings.UUID_PK_GENERATOR)
+    if name not in UUID_GENERATORS:
+        raise ImproperlyConfigured(
+            f"Unknown UUID generator '{name}' for {label}. "
+            f"Use one of: {', '.join(UUID_GENERATORS)}."
+        )
+    return UUID_GENERATORS[name]
+
+
+class ModelUUIDField(models.UUIDField):
+    """
+    UUIDField whose default is produced by the generator configured for its model.
+
+    The `default` passed to the field is kept for migrations and forms; instances get
+    their value from `get_uuid_generator(model)` instead, so the generator can be
+    switched per model through settings without a schema migration.
+    """
+
+    def get_default(self):
+        if getattr(self, "model", None) is None:
+            return super().get_default()
+        return get_uuid_generator(self.model)()
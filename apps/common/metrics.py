@@ -0,0 +1,78 @@
+"""
+Prometheus metrics of the application, exposed by the `/metrics/` endpoint.
+
+Under gunicorn every worker process records its own values. When the
+PROMETHEUS_MULTIPROC_DIR environment variable is set (see `entrypoint.sh`),
+`prometheus_client` keeps them in memory-mapped files of that directory, and the
+endpoint aggregates the files of all workers, so a scrape reports the whole server
+whichever worker answers it.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests by view, viewset action, method and status.",
+    ["view", "action", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+WALLET_OPERATION_SECONDS = Histogram(
+    "wallet_operation_duration_seconds",
+    "Duration of wallet service operations, lock waits included.",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+WALLET_LOCK_WAIT_SECONDS = Histogram(
+    "wallet_lock_wait_seconds",
+    "Time spent acquiring select_for_update locks on wallets.",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "Lookups of the response and object caches by model and result (hit or miss).",
+    ["cache", "model", "result"],
+)
+BALANCE_REJECTIONS = Counter(
+    "balance_validation_rejections",
+    "Wallet operations rejected by balance validation.",
+    ["reason"],
+)
+
+
+def render_metrics() -> tuple:
+    """
+    Renders the current metrics in the Prometheus text format, aggregated over all
+    worker processes in multiprocess mode.
+
+    Returns:
+        tuple: The encoded metrics and their content type.
+    """
+    registry = REGISTRY
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int):
+    """
+    Removes the live values of a stopped worker process in multiprocess mode.
+    """
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(pid)
@@ -1,26 +1,272 @@
 import logging
 import time
 
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from rest_framework.permissions import SAFE_METHODS
+
+from apps.common import routers
+from apps.common.exceptions import QueryBudgetExceededError
+from apps.common.metrics import HTTP_REQUEST_SECONDS
+from apps.common.profiling import (
+    get_current_profile,
+    install_query_recorder,
+    profile_queries,
+)
+
 
 logger = logging.getLogger(__name__)
 
 
 class LoggingMiddleware:
+    """
+    Logs the method, path, client IP, status and duration of every request.
+
+    Supports both sync and async request handling, so async views served under ASGI
+    are not switched to a worker thread for this middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         start_time = time.time()
+        response = self.get_response(request)
+        self._log(request, response, start_time)
+        return response
 
+    async def __acall__(self, request):
+        start_time = time.time()
+        response = await self.get_response(request)
+        self._log(request, response, start_time)
+        return response
+
+    @staticmethod
+    def _log(request, response, start_time):
         ip = request.META.get("REMOTE_ADDR", "")
         method = request.method
         path = request.get_full_path()
-
-        response = self.get_response(request)
-
         duration = time.time() - start_time
         status_code = response.status_code
 
         logger.info(f"[{method}] {path} | IP: {ip} | Status: {status_code} | Time: {duration:.3f}s")
 
+
+class ReadYourWritesMiddleware:
+    """
+    Pins requests to the primary database so clients read their own writes.
+
+    Reads of a request are sent to the primary by `ReplicaRouter` when:
+      - the request uses an unsafe method (POST, PUT, PATCH, DELETE);
+      - it carries the `read_your_writes` cookie, set for DB_REPLICA_MAX_LAG seconds
+        on the response of every request that wrote to the database;
+      - it sends a truthy `X-Read-Your-Writes` header, for clients without cookies.
+
+    The routing state is reset for every request. Without read replicas the
+    middleware does nothing.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    COOKIE_NAME = "read_your_writes"
+    HEADER_NAME = "X-Read-Your-Writes"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        tokens = routers.start_request(pinned=self._must_read_primary(request))
+        try:
+            response = self.get_response(request)
+            self._set_cookie(response)
+        finally:
+            routers.end_request(tokens)
+        return response
+
+    async def __acall__(self, request):
+        tokens = routers.start_request(pinned=self._must_read_primary(request))
+        try:
+            response = await self.get_response(request)
+            self._set_cookie(response)
+        finally:
+            routers.end_request(tokens)
+        return response
+
+    @classmethod
+    def _must_read_primary(cls, request) -> bool:
+        return (
+            request.method not in SAFE_METHODS
+            or cls.COOKIE_NAME in request.COOKIES
+            or request.headers.get(cls.HEADER_NAME, "").lower() in ("true", "1", "yes")
+        )
+
+    @classmethod
+    def _set_cookie(cls, response):
+        if (
+            routers.get_replica_aliases()
+            and routers.has_written_to_primary()
+            and settings.DB_REPLICA_MAX_LAG > 0
+        ):
+            response.set_cookie(
+                cls.COOKIE_NAME,
+                "1",
+                max_age=settings.DB_REPLICA_MAX_LAG,
+                httponly=True,
+                samesite="Lax",
+            )
+
+
+class QueryProfilingMiddleware:
+    """
+    Profiles the SQL statements of every request, when QUERY_PROFILING is enabled.
+
+    The number of statements and the database time are added to the `Server-Timing`
+    response header (`db;dur=<ms>;desc="<n> queries"` next to `app;dur=<ms>`) and logged
+    with the slowest statements as the `db_queries`, `db_time_ms` and `db_slowest` log
+    record fields.
+
+    The query budget of a request is the `query_budget` attribute of its view class, or
+    the QUERY_BUDGET setting (0 disables it). A request going over it is logged as a
+    warning, or raises QueryBudgetExceededError when QUERY_BUDGET_ACTION is "raise", as
+    in the test settings.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_PROFILING:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start_time = time.perf_counter()
+        with profile_queries(**self._profile_options()) as profile:
+            response = self.get_response(request)
+        return self._finish(request, response, profile, start_time)
+
+    async def __acall__(self, request):
+        start_time = time.perf_counter()
+        with profile_queries(**self._profile_options()) as profile:
+            # Async views run their queries in a worker thread with its own connections.
+            await sync_to_async(install_query_recorder)()
+            response = await self.get_response(request)
+        return self._finish(request, response, profile, start_time)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        budget = getattr(getattr(view_func, "cls", None), "query_budget", None)
+        profile = get_current_profile()
+        if budget is not None and profile is not None:
+            profile.budget = budget
+        return None
+
+    @staticmethod
+    def _profile_options() -> dict:
+        return {
+            "slowest": settings.QUERY_PROFILING_SLOWEST,
+            "budget": settings.QUERY_BUDGET or None,
+        }
+
+    @staticmethod
+    def _finish(request, response, profile, start_time):
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        db_time_ms = profile.duration * 1000
+        server_timing = (
+            f'db;dur={db_time_ms:.3f};desc="{profile.count} queries", app;dur={duration_ms:.3f}'
+        )
+        if response.has_header("Server-Timing"):
+            server_timing = f"{response['Server-Timing']}, {server_timing}"
+        response["Server-Timing"] = server_timing
+
+        method = request.method
+        path = request.get_full_path()
+        extra = {
+            "db_queries": profile.count,
+            "db_time_ms": round(db_time_ms, 3),
+            "db_slowest": profile.slowest,
+        }
+        logger.info(
+            f"[{method}] {path} | Queries: {profile.count} | DB time: {db_time_ms:.3f}ms",
+            extra=extra,
+        )
+
+        if profile.over_budget:
+            message = (
+                f"Query budget exceeded: [{method}] {path} executed {profile.count} "
+                f"queries, budget is {profile.budget}"
+            )
+            if settings.QUERY_BUDGET_ACTION == "raise":
+                raise QueryBudgetExceededError(message)
+            logger.warning(message, extra=extra)
         return response
+
+
+class MetricsMiddleware:
+    """
+    Records the duration of every request in the `http_request_duration_seconds`
+    histogram, labelled with the view class, the viewset action (the lowercased method
+    for other views), the method and the response status.
+
+    Requests not resolved to a view are labelled `unmatched`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start_time = time.perf_counter()
+        response = self.get_response(request)
+        self._observe(request, response, start_time)
+        return response
+
+    async def __acall__(self, request):
+        start_time = time.perf_counter()
+        response = await self.get_response(request)
+        self._observe(request, response, start_time)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        method = request.method.lower()
+        view = getattr(view_func, "cls", view_func)
+        actions = getattr(view_func, "actions", None) or {}
+        request._metrics_labels = (
+            getattr(view, "__name__", "unknown"),
+            actions.get(method, method),
+        )
+        return None
+
+    @staticmethod
+    def _observe(request, response, start_time):
+        view, action = getattr(request, "_metrics_labels", ("unmatched", "unmatched"))
+        HTTP_REQUEST_SECONDS.labels(
+            view=view, action=action, method=request.method, status=response.status_code
+        ).observe(time.perf_counter() - start_time)
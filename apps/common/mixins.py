@@ -3,18 +3,32 @@ import traceback
 import uuid
 
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import IntegrityError, models, transaction
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.db.backends.utils import names_digest
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
+from django.http import HttpResponse
 
 from rest_framework import status
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework_json_api.exceptions import (
     exception_handler as json_api_exception_handler,
 )
 
+from apps.common.cache import (
+    ObjectCache,
+    build_versioned_cache_key,
+    get_cache_namespace,
+    get_object_version_name,
+)
 from apps.common.exceptions import ValidationError
+from apps.common.identifiers import ModelUUIDField
 from apps.common.managers import SoftDeleteManager
+from apps.common.metrics import CACHE_REQUESTS
+from apps.common.routers import has_read_from_replica
 
 
 class AtomicCreateMixin:
@@ -61,9 +75,15 @@ class UUIDMixin(models.Model):
     Abstract model mixin that replaces the default integer `id` with a UUID.
 
     This is useful for systems where exposing sequential IDs is discouraged for security or UX reasons.
+
+    New ids are produced by the generator configured for the model (UUID_PK_GENERATOR,
+    overridable per model in UUID_PK_GENERATORS): random `uuid4` by default, or
+    time-ordered `uuid7` for models opting in, which keeps inserts at the right edge of
+    the primary key and foreign key btrees instead of scattering them over random pages,
+    but exposes the creation time of every object through its id.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = ModelUUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     class Meta:
         abstract = True
@@ -82,16 +102,23 @@ class SoftDeleteSafeObjectMixin:
     def get_object(self):
         """
         Override DRF's get_object to exclude soft-deleted instances.
+
+        Safe (read-only) requests looking objects up by primary key are served from
+        the `ObjectCache`; writes always load the current row from the database.
         """
-        queryset = self.get_queryset().model.all_objects.all()
+        model = self.get_queryset().model
+        queryset = model.all_objects.all()
 
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
         filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
 
         try:
-            obj = queryset.get(**filter_kwargs)
-        except queryset.model.DoesNotExist:
-            raise self.not_found_exception_class(detail=f"{queryset.model.__name__} not found.")
+            if self.request.method in SAFE_METHODS and self.lookup_field in ("pk", "id"):
+                obj = ObjectCache.get(model, self.kwargs[lookup_url_kwarg])
+            else:
+                obj = queryset.get(**filter_kwargs)
+        except (model.DoesNotExist, DjangoValidationError):
+            raise self.not_found_exception_class(detail=f"{model.__name__} not found.")
 
         if getattr(obj, "is_deleted", False):
             raise self.not_found_exception_class(detail=f"{queryset.model.__name__} not found.")
@@ -107,8 +134,23 @@ class SoftDeleteMixin(models.Model):
     Instead of removing the object from the database, it sets `is_deleted=True`.
 
     Use this in combination with a custom manager that filters out deleted entries by default.
+
+    Subclasses list the field combinations their default (non-deleted) queries filter
+    or order by in `live_indexes`. A partial index `WHERE NOT is_deleted` is generated
+    for each of them when the model class is prepared, so these queries never read
+    soft-deleted rows and the indexes do not grow with deleted data. An entry can also
+    be a dict of `build_live_index` arguments to declare a covering index:
+
+        class Transaction(SoftDeleteMixin):
+            live_indexes = [
+                ("wallet", "created_at", "id"),
+                ("txid",),
+                {"fields": ("wallet",), "include": ("amount",)},
+            ]
     """
 
+    live_indexes = ()
+
     is_deleted = models.BooleanField(default=False)
 
     objects = SoftDeleteManager()
@@ -128,6 +170,50 @@ class SoftDeleteMixin(models.Model):
         self.save(using=using)
 
 
+def build_live_index(model, fields, include=()) -> models.Index:
+    """
+    Returns the partial index `WHERE NOT is_deleted` on the given fields of the model,
+    optionally covering the `include` fields (PostgreSQL `INCLUDE`).
+
+    The name follows Django's generated index names, with a "live" suffix so it never
+    collides with a regular index on the same fields.
+    """
+    columns = [model._meta.get_field(field).column for field in fields]
+    included = [model._meta.get_field(field).column for field in include]
+    digest = names_digest(model._meta.db_table, *columns, *included, "live", length=6)
+    return models.Index(
+        fields=list(fields),
+        include=list(include),
+        condition=models.Q(is_deleted=False),
+        name=f"{model._meta.db_table[:11]}_{columns[0][:6]}_{digest}_live",
+    )
+
+
+@receiver(class_prepared)
+def add_live_indexes(sender, **kwargs):
+    """
+    Adds the partial indexes declared in `live_indexes` to soft-deletable models.
+    """
+    if not issubclass(sender, SoftDeleteMixin) or sender._meta.abstract:
+        return
+
+    names = {index.name for index in sender._meta.indexes}
+    live = [
+        (
+            build_live_index(sender, **spec)
+            if isinstance(spec, dict)
+            else build_live_index(sender, spec)
+        )
+        for spec in sender.live_indexes
+    ]
+    sender._meta.indexes = [
+        *sender._meta.indexes,
+        *(index for index in live if index.name not in names),
+    ]
+    # Migrations only read options declared in Meta; register the indexes there too.
+    sender._meta.original_attrs["indexes"] = sender._meta.indexes
+
+
 class TimestampMixin(models.Model):
     """
     Abstract model mixin that adds automatic timestamp fields.
@@ -228,8 +314,11 @@ class CacheResponseMixin:
     """
     Mixin to cache the responses of GET requests for ViewSets.
 
-    Applies caching to the `list` and `retrieve` actions by wrapping them with
-    Django's `cache_page` decorator.
+    Applies caching to the `list` and `retrieve` actions. Rendered responses are stored
+    in the Django cache under versioned keys: `list` depends on the collection version
+    of the model and `retrieve` on the version of the requested object. Writes bump
+    these versions via `apps.common.cache.invalidate_model_cache`, so cached
+    responses are never served stale and long timeouts can be used safely.
 
     The cache timeout duration can be customized per ViewSet by overriding
     the `cache_timeout` attribute or by implementing the `get_cache_timeout` method.
@@ -250,9 +339,10 @@ class CacheResponseMixin:
                 return 300
 
     Notes:
-        - This mixin caches only the GET methods `list` and `retrieve`.
-        - Cache keys are generated automatically based on request path and query params.
-        - Be sure to invalidate or clear cache appropriately when data changes.
+        - This mixin caches only successful responses of `list` and `retrieve`.
+        - Cache keys are built from the request path, query params and Accept header.
+        - Every write to the model must call `invalidate_model_cache`.
+        - Responses read from a replica are cached for DB_REPLICA_MAX_LAG seconds at most.
     """
 
     cache_timeout = 60  # seconds
@@ -260,12 +350,68 @@ class CacheResponseMixin:
     def get_cache_timeout(self):
         return self.cache_timeout
 
+    def get_cache_version_names(self):
+        """
+        Returns the names of the cache versions the current action depends on.
+        """
+        model = self.get_queryset().model
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            return [get_object_version_name(model, self.kwargs[lookup_url_kwarg])]
+        return [get_cache_namespace(model)]
+
     def list(self, request, *args, **kwargs):
-        view = super().list
-        cached_view = cache_page(self.get_cache_timeout())(view)
-        return cached_view(request, *args, **kwargs)
+        return self._cached_response(super().list, request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
-        view = super().retrieve
-        cached_view = cache_page(self.get_cache_timeout())(view)
-        return cached_view(request, *args, **kwargs)
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, view, request, *args, **kwargs):
+        """
+        Returns the cached rendered response of the view, rendering and storing it on a miss.
+
+        Cache failures are logged and the view is served uncached.
+        """
+        namespace = get_cache_namespace(self.get_queryset().model)
+        try:
+            key = build_versioned_cache_key(
+                f"response:{namespace}:{self.action}",
+                self.get_cache_version_names(),
+                request.get_full_path(),
+                request.headers.get("Accept", ""),
+            )
+            cached = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return view(request, *args, **kwargs)
+
+        if cached is not None:
+            CACHE_REQUESTS.labels(cache="response", model=namespace, result="hit").inc()
+            return HttpResponse(
+                cached["content"], status=cached["status_code"], content_type=cached["content_type"]
+            )
+
+        CACHE_REQUESTS.labels(cache="response", model=namespace, result="miss").inc()
+        response = self.finalize_response(request, view(request, *args, **kwargs), *args, **kwargs)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+        response.render()
+        timeout = self.get_cache_timeout()
+        if has_read_from_replica():
+            # A lagging replica may have served data older than the current cache
+            # versions; keep it at most as long as the replica lag.
+            timeout = min(timeout, settings.DB_REPLICA_MAX_LAG)
+        try:
+            cache.set(
+                key,
+                {
+                    "status_code": response.status_code,
+                    "content": response.content,
+                    "content_type": response["Content-Type"],
+                },
+                timeout=timeout,
+            )
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {str(e)}")
+        return response
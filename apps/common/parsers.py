@@ -0,0 +1,34 @@
+from django.conf import settings
+
+from rest_framework_json_api.parsers import JSONParser
+
+from apps.common.exceptions import RequestBodyTooLargeError
+
+
+class SizeLimitedJSONParser(JSONParser):
+    """
+    JSON:API parser refusing request bodies larger than the endpoint accepts.
+
+    DRF parsers read the request stream directly, so DATA_UPLOAD_MAX_MEMORY_SIZE, which
+    Django only checks when `request.body` is read, does not limit API requests on its
+    own. The limit is the `max_body_size` attribute of the view, which actions of views
+    declaring it override with `@action(max_body_size=...)`, or DATA_UPLOAD_MAX_MEMORY_SIZE
+    when it is not set.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        limit = (
+            getattr(parser_context.get("view"), "max_body_size", None)
+            or settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        )
+        request = parser_context.get("request")
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0) if request else 0
+        except ValueError:
+            content_length = 0
+        if content_length > limit:
+            raise RequestBodyTooLargeError(
+                f"Request body is too large: {content_length} bytes, at most {limit} accepted."
+            )
+        return super().parse(stream, media_type=media_type, parser_context=parser_context)
@@ -0,0 +1,112 @@
+import heapq
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+
+_current_profile = ContextVar("query_profile", default=None)
+
+
+class QueryProfile:
+    """
+    SQL statements executed while profiling a request or a block of code.
+
+    Attributes:
+        count (int): Number of executed statements.
+        duration (float): Total database time in seconds.
+        budget (int | None): Maximum number of statements allowed, if any.
+    """
+
+    def __init__(self, slowest: int = 5, budget=None):
+        self.count = 0
+        self.duration = 0.0
+        self.budget = budget
+        self._slowest_size = slowest
+        self._slowest = []
+
+    def record(self, alias: str, sql: str, duration: float):
+        """
+        Counts an executed statement and keeps it if it is one of the slowest.
+        """
+        self.count += 1
+        self.duration += duration
+        if self._slowest_size <= 0:
+            return
+        entry = (duration, self.count, alias, sql)
+        if len(self._slowest) < self._slowest_size:
+            heapq.heappush(self._slowest, entry)
+        elif duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest(self) -> list:
+        """
+        Returns the slowest statements, slowest first, as dicts with the `alias`, `sql`
+        and `duration_ms` keys.
+        """
+        return [
+            {"alias": alias, "sql": sql, "duration_ms": round(duration * 1000, 3)}
+            for duration, _, alias, sql in sorted(self._slowest, reverse=True)
+        ]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.budget > 0 and self.count > self.budget
+
+
+def get_current_profile():
+    """
+    Returns the active `QueryProfile`, or None outside `profile_queries`.
+    """
+    return _current_profile.get()
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper timing statements into the active `QueryProfile`.
+
+    Installed once on every connection by `install_query_recorder`; statements run
+    without an active profile are executed untouched.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record(context["connection"].alias, sql, time.perf_counter() - started)
+
+
+def install_query_recorder():
+    """
+    Adds `record_query` to the execute wrappers of the connections of the current
+    thread, unless already installed.
+    """
+    for connection in connections.all():
+        if record_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def profile_queries(slowest: int = 5, budget=None):
+    """
+    Profiles the SQL statements executed in the enclosed block.
+
+    Args:
+        slowest (int): Number of slowest statements to keep.
+        budget (int, optional): Maximum number of statements allowed.
+
+    Yields:
+        QueryProfile: The profile, filled as statements execute.
+    """
+    install_query_recorder()
+    profile = QueryProfile(slowest=slowest, budget=budget)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
@@ -0,0 +1,123 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+_pinned_to_primary = ContextVar("pinned_to_primary", default=False)
+_wrote_to_primary = ContextVar("wrote_to_primary", default=False)
+_read_from_replica = ContextVar("read_from_replica", default=False)
+
+
+def get_replica_aliases() -> list:
+    """
+    Returns the database aliases of the read replicas (the DATABASE_REPLICAS setting).
+    """
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def is_pinned_to_primary() -> bool:
+    """
+    Returns whether reads of the current request or context go to the primary.
+    """
+    return _pinned_to_primary.get()
+
+
+def has_written_to_primary() -> bool:
+    """
+    Returns whether a write was routed in the current request or context.
+    """
+    return _wrote_to_primary.get()
+
+
+def has_read_from_replica() -> bool:
+    """
+    Returns whether a read of the current request or context was sent to a replica.
+    """
+    return _read_from_replica.get()
+
+
+def start_request(pinned: bool = False) -> tuple:
+    """
+    Resets the routing state at the start of a request.
+
+    Args:
+        pinned (bool): Send every read of the request to the primary.
+
+    Returns:
+        tuple: Tokens to pass to `end_request`.
+    """
+    return (
+        _pinned_to_primary.set(pinned),
+        _wrote_to_primary.set(False),
+        _read_from_replica.set(False),
+    )
+
+
+def end_request(tokens: tuple):
+    """
+    Restores the routing state saved by `start_request`.
+    """
+    pinned, wrote, read = tokens
+    _pinned_to_primary.reset(pinned)
+    _wrote_to_primary.reset(wrote)
+    _read_from_replica.reset(read)
+
+
+@contextmanager
+def pinned_to_primary():
+    """
+    Sends the reads of the enclosed block to the primary database.
+    """
+    token = _pinned_to_primary.set(True)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads to the read replicas and writes to the primary.
+
+    Replicas are the aliases listed in the DATABASE_REPLICAS setting; without any, every
+    query goes to the default database. Reads go to a random replica unless:
+      - the current request or context is pinned to the primary: the request wrote to
+        the database, used an unsafe method or asked for read-your-writes (see
+        `ReadYourWritesMiddleware`);
+      - a transaction is open on the primary, whose reads must see its own writes and
+        locks.
+
+    Routing a write pins the rest of the request to the primary. Migrations only run on
+    the primary, replicas receive the schema by replication.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replica_aliases()
+        if (
+            not replicas
+            or _pinned_to_primary.get()
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+
+        _read_from_replica.set(True)
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        _pinned_to_primary.set(True)
+        _wrote_to_primary.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *get_replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replica_aliases():
+            return False
+        return None
@@ -0,0 +1,97 @@
+import inspect
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import NotFound
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.cache import ObjectCache
+from apps.common.constants import KeysetResultsSetPagination
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines, served natively by an ASGI server.
+
+    Django runs async views on the event loop, so a request waiting on the database
+    or the cache does not hold a worker process. DRF's request initialization
+    (authentication, permissions, throttling) may query the database and runs in a
+    worker thread; rendering is done the same way by Django's async handler.
+    Synchronous handlers inherited from APIView, such as `options`, still work.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncReadOnlyModelView(AsyncAPIView, GenericAPIView):
+    """
+    Async read-only JSON:API endpoint of a model: the list when the URL has no lookup
+    argument, a single instance otherwise.
+
+    Lists are filtered by `filter_backends` and always paginated in keyset mode on
+    (`created_at`, `id`) with the async ORM (see
+    `KeysetResultsSetPagination.apaginate_queryset`). Instances are read through the
+    `ObjectCache` like in the synchronous viewsets, and soft-deleted ones are reported
+    as not found. Serializers must not trigger lazy queries, so related objects they
+    render have to be selected in `queryset`.
+    """
+
+    pagination_class = KeysetResultsSetPagination
+    not_found_exception_class = NotFound
+
+    async def get(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in kwargs:
+            return await self.aretrieve(kwargs[lookup_url_kwarg])
+        return await self.alist()
+
+    async def alist(self):
+        """
+        Returns a keyset page of the filtered queryset.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    async def aretrieve(self, pk):
+        """
+        Returns the instance with the given primary key.
+
+        Raises:
+            not_found_exception_class: If it does not exist or is soft-deleted.
+        """
+        model = self.get_queryset().model
+        try:
+            instance = await sync_to_async(ObjectCache.get)(model, pk)
+        except (model.DoesNotExist, DjangoValidationError):
+            instance = None
+
+        if instance is None or getattr(instance, "is_deleted", False):
+            raise self.not_found_exception_class(detail=f"{model.__name__} not found.")
+        return Response(self.get_serializer(instance).data)
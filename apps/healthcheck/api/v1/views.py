@@ -3,17 +3,54 @@ import logging
 from django.core.cache import cache
 from django.db import connection
 
+from asgiref.sync import sync_to_async
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common.views import AsyncAPIView
 from apps.healthcheck.api.v1.serializers import HealthCheckSerializer
 
 
 logger = logging.getLogger(__name__)
 
 
+def check_database():
+    """
+    Runs `SELECT 1` on the default database.
+
+    Raises:
+        Exception: If the query fails or returns an unexpected value.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        result = cursor.fetchone()
+        if result is None or result[0] != 1:
+            raise Exception("DB did not return 1")
+
+
+def build_health_response(health: dict) -> Response:
+    """
+    Returns the JSON:API healthcheck document, with status 200 if every service is
+    "ok" and 503 otherwise.
+    """
+    status_code = (
+        status.HTTP_200_OK
+        if all(v == "ok" for v in health.values())
+        else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+    return Response(
+        data={
+            "type": "healthcheck",
+            "id": "singleton",
+            "attributes": health,
+        },
+        status=status_code,
+    )
+
+
 class HealthCheckView(APIView):
     """
     Healthcheck endpoint for monitoring application status.
@@ -36,29 +73,44 @@ class HealthCheckView(APIView):
                 raise Exception("Redis did not return expected value")
         except Exception as e:
             logger.error(f"error: {str(e)}")
-            health["redis"] = "error: Postgres isn't healthy}"
+            health["redis"] = "error: Redis isn't healthy"
+
+        try:
+            check_database()
+        except Exception as e:
+            logger.error(f"error: {str(e)}")
+            health["postgres"] = "error: Postgres isn't healthy"
+
+        return build_health_response(health)
+
+
+class AsyncHealthCheckView(AsyncAPIView):
+    """
+    Async variant of the healthcheck endpoint for ASGI deployments.
+
+    Performs the same checks as HealthCheckView with the async cache API; the
+    database query runs in a worker thread, as Django has no async cursor.
+    """
+
+    @extend_schema(responses=HealthCheckSerializer)
+    async def get(self, request):
+        health = {
+            "redis": "ok",
+            "postgres": "ok",
+        }
+
+        try:
+            await cache.aset("healthcheck", "ok", timeout=5)
+            if await cache.aget("healthcheck") != "ok":
+                raise Exception("Redis did not return expected value")
+        except Exception as e:
+            logger.error(f"error: {str(e)}")
+            health["redis"] = "error: Redis isn't healthy"
 
         try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                if result is None or result[0] != 1:
-                    raise Exception("DB did not return 1")
+            await sync_to_async(check_database)()
         except Exception as e:
             logger.error(f"error: {str(e)}")
-            health["postgres"] = "error: Redis isn't healthy"
-
-        status_code = (
-            status.HTTP_200_OK
-            if all(v == "ok" for v in health.values())
-            else status.HTTP_503_SERVICE_UNAVAILABLE
-        )
-
-        return Response(
-            data={
-                "type": "healthcheck",
-                "id": "singleton",
-                "attributes": health,
-            },
-            status=status_code,
-        )
+            health["postgres"] = "error: Postgres isn't healthy"
+
+        return build_health_response(health)
@@ -1,10 +1,11 @@
 from django.urls import path
 
-from apps.healthcheck.api.v1.views import HealthCheckView
+from apps.healthcheck.api.v1.views import AsyncHealthCheckView, HealthCheckView
 
 
 app_name = "healthcheck-v1"
 
 urlpatterns = [
     path("healthz/", HealthCheckView.as_view(), name="healthz"),
+    path("healthz/async/", AsyncHealthCheckView.as_view(), name="healthz-async"),
 ]
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from apps.metrics.views import MetricsView
+
+
+app_name = "metrics"
+
+urlpatterns = [
+    path("", MetricsView.as_view(), name="metrics"),
+]
@@ -0,0 +1,18 @@
+from django.http import HttpResponse
+from django.views import View
+
+from apps.common.metrics import render_metrics
+
+
+class MetricsView(View):
+    """
+    Prometheus scrape endpoint.
+
+    Returns the application metrics (see `apps.common.metrics`) in the Prometheus text
+    exposition format, aggregated over all gunicorn workers in multiprocess mode. It is
+    not a JSON:API resource, so it is a plain Django view outside the versioned API.
+    """
+
+    def get(self, request):
+        content, content_type = render_metrics()
+        return HttpResponse(content, content_type=content_type)
@@ -0,0 +1,93 @@
+"""
+Gunicorn configuration driven by environment variables.
+
+Loaded by `entrypoint.sh` with `gunicorn -c config/gunicorn.py`. `SERVER_PROFILE`
+selects the defaults:
+
+  - production (default): `2 * CPU + 1` workers, gthread workers for WSGI (threads
+    share a worker's memory and database connections), worker recycling after
+    `GUNICORN_MAX_REQUESTS` requests with jitter, and `--preload`, so the application
+    is imported once in the master and shared copy-on-write by the forked workers.
+  - dev: a single worker reloaded on code changes, without preloading.
+
+`SERVER_INTERFACE=asgi` serves `config.asgi` with uvicorn workers instead of
+`config.wsgi`. Every default can be overridden:
+
+    GUNICORN_WORKERS, GUNICORN_THREADS, GUNICORN_WORKER_CLASS, GUNICORN_MAX_REQUESTS,
+    GUNICORN_MAX_REQUESTS_JITTER, GUNICORN_KEEPALIVE, GUNICORN_TIMEOUT,
+    GUNICORN_PRELOAD
+"""
+
+import multiprocessing
+
+from django.core.exceptions import ImproperlyConfigured
+
+from utils.env_config import get_env
+
+
+SERVER_PROFILES = ("production", "dev")
+SERVER_INTERFACES = {
+    "wsgi": ("config.wsgi:application", "gthread"),
+    "asgi": ("config.asgi:application", "uvicorn_worker.UvicornWorker"),
+}
+
+
+def get_server_config() -> dict:
+    """
+    Builds the gunicorn settings of the configured server profile.
+
+    Returns:
+        dict: Gunicorn setting names mapped to their values.
+
+    Raises:
+        ImproperlyConfigured: If `SERVER_PROFILE` or `SERVER_INTERFACE` is unknown.
+    """
+    env = get_env()
+    profile = env.get_str("SERVER_PROFILE", default="production", required=False).lower()
+    interface = env.get_str("SERVER_INTERFACE", default="wsgi", required=False).lower()
+    if profile not in SERVER_PROFILES:
+        raise ImproperlyConfigured(
+            f"SERVER_PROFILE must be one of {', '.join(SERVER_PROFILES)}, got {profile!r}"
+        )
+    if interface not in SERVER_INTERFACES:
+        raise ImproperlyConfigured(
+            f"SERVER_INTERFACE must be one of {', '.join(SERVER_INTERFACES)}, got {interface!r}"
+        )
+
+    production = profile == "production"
+    app, worker_class = SERVER_INTERFACES[interface]
+    max_requests = env.get_int("GUNICORN_MAX_REQUESTS", default=1000, required=False)
+
+    return {
+        "wsgi_app": app,
+        "bind": f"0.0.0.0:{env.get_int('APPLICATION_PORT', default=8000, required=False)}",
+        "worker_class": env.get_str("GUNICORN_WORKER_CLASS", default=worker_class, required=False),
+        "workers": env.get_int(
+            "GUNICORN_WORKERS",
+            default=multiprocessing.cpu_count() * 2 + 1 if production else 1,
+            required=False,
+        ),
+        "threads": env.get_int("GUNICORN_THREADS", default=4, required=False),
+        "max_requests": max_requests if production else 0,
+        "max_requests_jitter": env.get_int(
+            "GUNICORN_MAX_REQUESTS_JITTER", default=max_requests // 10, required=False
+        ),
+        "keepalive": env.get_int("GUNICORN_KEEPALIVE", default=5, required=False),
+        "timeout": env.get_int("GUNICORN_TIMEOUT", default=30, required=False),
+        "preload_app": production and env.get_bool("GUNICORN_PRELOAD", default=True),
+        "reload": not production,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def child_exit(server, worker):
+    """
+    Gunicorn hook removing the metrics of an exited worker in multiprocess mode.
+    """
+    from apps.common.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
+
+
+globals().update(get_server_config())
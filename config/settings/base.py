@@ -1,6 +1,9 @@
+import importlib.util
 import secrets
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 from utils.env_config import get_env
 
 
@@ -50,7 +53,7 @@ REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "rest_framework_json_api.exceptions.exception_handler",
     "DEFAULT_PAGINATION_CLASS": "rest_framework_json_api.pagination.JsonApiPageNumberPagination",
     "DEFAULT_PARSER_CLASSES": (
-        "rest_framework_json_api.parsers.JSONParser",
+        "apps.common.parsers.SizeLimitedJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ),
@@ -72,6 +75,9 @@ REST_FRAMEWORK = {
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apps.common.middlewares.MetricsMiddleware",
+    "apps.common.middlewares.QueryProfilingMiddleware",
+    "apps.common.middlewares.ReadYourWritesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -81,6 +87,98 @@ MIDDLEWARE = [
     "apps.common.middlewares.LoggingMiddleware",
 ]
 
+# Per-request SQL profiling by QueryProfilingMiddleware: query count and database time in
+# the Server-Timing header, logged with the QUERY_PROFILING_SLOWEST slowest statements.
+# Requests over QUERY_BUDGET queries (0 disables it; views may set `query_budget`) are
+# logged as warnings, or fail with QUERY_BUDGET_ACTION="raise".
+QUERY_PROFILING = env.get_bool("QUERY_PROFILING", default=False)
+QUERY_PROFILING_SLOWEST = env.get_int("QUERY_PROFILING_SLOWEST", default=3, required=False)
+QUERY_BUDGET = env.get_int("QUERY_BUDGET", default=0, required=False)
+QUERY_BUDGET_ACTION = env.get_str("QUERY_BUDGET_ACTION", default="warn", required=False)
+
+# Seconds a stored response is replayed for a repeated Idempotency-Key header.
+IDEMPOTENCY_KEY_TTL = env.get_int("IDEMPOTENCY_KEY_TTL", default=24 * 60 * 60, required=False)
+
+# Seconds GET list/retrieve responses are cached. Cached responses are invalidated
+# on every write via versioned cache keys, so the timeouts only bound memory usage.
+API_CACHE_LIST_TIMEOUT = env.get_int("API_CACHE_LIST_TIMEOUT", default=5 * 60, required=False)
+API_CACHE_RETRIEVE_TIMEOUT = env.get_int(
+    "API_CACHE_RETRIEVE_TIMEOUT", default=60 * 60, required=False
+)
+
+# Seconds a model instance stays in the read-through object cache.
+OBJECT_CACHE_TIMEOUT = env.get_int("OBJECT_CACHE_TIMEOUT", default=5 * 60, required=False)
+
+# Create pg_trgm GIN indexes for substring search on transaction IDs and wallet labels
+# when migration 0006 is applied (PostgreSQL only; requires permission to create the
+# pg_trgm extension). Once 0006 is applied, add them with `create_trigram_indexes`.
+DB_TRIGRAM_INDEXES = env.get_bool("DB_TRIGRAM_INDEXES", default=False)
+
+# Range-partition the transaction table by month on created_at when migration 0010 is
+# applied (PostgreSQL only). Once 0010 is applied, convert with `partition_transactions`.
+# Future partitions are created by `create_transaction_partitions`.
+DB_PARTITION_TRANSACTIONS = env.get_bool("DB_PARTITION_TRANSACTIONS", default=False)
+TRANSACTION_PARTITION_MONTHS_AHEAD = env.get_int(
+    "TRANSACTION_PARTITION_MONTHS_AHEAD", default=3, required=False
+)
+
+# Primary key generator of UUIDMixin models: "uuid4" (random) or "uuid7" (time-ordered,
+# but reveals the creation time through the id). UUID_PK_GENERATORS opts single models
+# into another generator, e.g. "account.transaction=uuid7".
+UUID_PK_GENERATOR = env.get_str("UUID_PK_GENERATOR", default="uuid4", required=False) or "uuid4"
+UUID_PK_GENERATORS = {
+    label.strip().lower(): generator.strip()
+    for label, _, generator in (
+        item.partition("=")
+        for item in env.get_list("UUID_PK_GENERATORS", default="", required=False)
+    )
+}
+
+# Persistent database connections: a connection is reused by the requests of a worker
+# thread for DB_CONN_MAX_AGE seconds (0 closes it after every request) and checked
+# before reuse when DB_CONN_HEALTH_CHECKS is set. Under ASGI (SERVER_INTERFACE=asgi)
+# every request runs sync code in a new thread, so persistent connections would never be
+# reused nor closed; they are disabled there, use DB_POOL instead.
+SERVER_INTERFACE = env.get_str("SERVER_INTERFACE", default="wsgi", required=False).lower()
+DB_CONN_MAX_AGE = env.get_int("DB_CONN_MAX_AGE", default=60, required=False)
+if SERVER_INTERFACE == "asgi":
+    DB_CONN_MAX_AGE = 0
+DB_CONN_HEALTH_CHECKS = env.get_bool("DB_CONN_HEALTH_CHECKS", default=True)
+
+# Connection pool of the PostgreSQL backend instead of persistent connections (requires
+# psycopg 3 with psycopg_pool). Each worker process holds DB_POOL_MIN_SIZE to
+# DB_POOL_MAX_SIZE connections, and a request waits DB_POOL_TIMEOUT seconds at most.
+DB_POOL = env.get_bool("DB_POOL", default=False)
+DB_POOL_OPTIONS = {
+    "min_size": env.get_int("DB_POOL_MIN_SIZE", default=2, required=False),
+    "max_size": env.get_int("DB_POOL_MAX_SIZE", default=10, required=False),
+    "timeout": env.get_int("DB_POOL_TIMEOUT", default=10, required=False),
+}
+if DB_POOL and importlib.util.find_spec("psycopg_pool") is None:
+    raise ImproperlyConfigured("DB_POOL requires psycopg 3: pip install 'psycopg[binary,pool]'")
+
+# Read replicas of the default database ("host" or "host:port", same credentials), added
+# as the "replica_<n>" aliases. Safe reads are routed to them by ReplicaRouter, while
+# writes, transactions and requests pinned by ReadYourWritesMiddleware use the primary.
+# DB_REPLICA_MAX_LAG is the read-your-writes window in seconds after a write, which also
+# bounds how long responses read from a replica are cached.
+DB_REPLICA_HOSTS = env.get_list("DB_REPLICA_HOSTS", default="", required=False)
+DB_REPLICA_MAX_LAG = env.get_int("DB_REPLICA_MAX_LAG", default=5, required=False)
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ["apps.common.routers.ReplicaRouter"]
+
+# Wallet lock contention report (`wallet_contention` command, admin page): lock waits of
+# at least WALLET_LOCK_CONTENTION_MIN_WAIT_MS are aggregated per wallet over the last
+# WALLET_LOCK_CONTENTION_WINDOW seconds, and the WALLET_LOCK_CONTENTION_TOP_N most
+# contended wallets are reported.
+WALLET_LOCK_CONTENTION_MIN_WAIT_MS = env.get_int(
+    "WALLET_LOCK_CONTENTION_MIN_WAIT_MS", default=1, required=False
+)
+WALLET_LOCK_CONTENTION_WINDOW = env.get_int(
+    "WALLET_LOCK_CONTENTION_WINDOW", default=15 * 60, required=False
+)
+WALLET_LOCK_CONTENTION_TOP_N = env.get_int("WALLET_LOCK_CONTENTION_TOP_N", default=20, required=False)
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -110,8 +208,20 @@ if not TEST:
             "PASSWORD": env.get_str("DB_PASSWORD"),
             "HOST": env.get_str("DB_HOST"),
             "PORT": env.get_int("DB_PORT"),
+            "CONN_MAX_AGE": 0 if DB_POOL else DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+            "OPTIONS": {"pool": DB_POOL_OPTIONS} if DB_POOL else {},
         }
     }
+    for index, replica_host in enumerate(DB_REPLICA_HOSTS):
+        host, _, port = replica_host.partition(":")
+        DATABASES[f"replica_{index}"] = {
+            **DATABASES["default"],
+            "HOST": host,
+            "PORT": int(port) if port else DATABASES["default"]["PORT"],
+            "OPTIONS": {"pool": dict(DB_POOL_OPTIONS)} if DB_POOL else {},
+        }
+        DATABASE_REPLICAS.append(f"replica_{index}")
 
     REDIS_HOST = env.get_str("REDIS_HOST")
     REDIS_PORT = env.get_int("REDIS_PORT")
@@ -128,6 +238,24 @@ if not TEST:
         }
     }
 
+    # Backend of the read-through model instance cache: "redis", "locmem" or "dummy"
+    # (disabled). Invalidation always goes through the shared default cache.
+    OBJECT_CACHE_BACKEND = env.get_str("OBJECT_CACHE_BACKEND", default="redis", required=False)
+    if OBJECT_CACHE_BACKEND == "locmem":
+        CACHES["objects"] = {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "objects",
+            "OPTIONS": {
+                "MAX_ENTRIES": env.get_int(
+                    "OBJECT_CACHE_MAX_ENTRIES", default=10_000, required=False
+                ),
+            },
+        }
+    elif OBJECT_CACHE_BACKEND == "dummy":
+        CACHES["objects"] = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    else:
+        CACHES["objects"] = CACHES["default"]
+
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
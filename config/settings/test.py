@@ -9,12 +9,31 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR.parent / "db.sqlite3",
-    }
+    },
+    # Read replica for routing tests: mirrors the test database, enabled per test by
+    # overriding DATABASE_REPLICAS.
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR.parent / "db.sqlite3",
+        "TEST": {"MIRROR": "default"},
+    },
 }
 
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "test-cache",
-    }
+    },
+    "objects": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-objects",
+    },
 }
+
+# SQLite ignores the INCLUDE columns of covering indexes; PostgreSQL uses them.
+SILENCED_SYSTEM_CHECKS = ["models.W040"]
+
+# Fail tests whose requests execute more queries than their budget.
+QUERY_PROFILING = True
+QUERY_BUDGET = 15
+QUERY_BUDGET_ACTION = "raise"
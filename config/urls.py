@@ -5,10 +5,18 @@ from django.urls import include, path
 
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.account.admin.contention import wallet_contention_view
+
 
 urlpatterns = [
+    path(
+        "admin/wallet-contention/",
+        admin.site.admin_view(wallet_contention_view),
+        name="wallet-contention",
+    ),
     path("admin/", admin.site.urls),
     path("api/", include("api.v1.urls", namespace="api")),
+    path("metrics/", include("apps.metrics.urls")),
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 if settings.DEBUG:
@@ -24,8 +32,9 @@ if settings.DEBUG:
 """
 Project-level URL configuration:
 
-- 'admin/': Django admin interface.
+- 'admin/': Django admin interface, with the wallet lock contention page.
 - 'api/': Includes versioned API URLs under namespace 'api'.
+- 'metrics/': Prometheus metrics of all workers, for scraping.
 - Static files served during development with static() helper.
 
 Commented-out section provides OpenAPI schema and Swagger UI integration
@@ -11,12 +11,21 @@ User.objects.create_superuser('$DJANGO_ADMIN_USERNAME', '$DJANGO_ADMIN_EMAIL', '
   | python manage.py shell
 fi
 
-exec watchmedo auto-restart \
-  --directory=. \
-  --pattern=*.py \
-  --recursive \
-  -- \
-  gunicorn \
-  --bind 0.0.0.0:${APPLICATION_PORT:-8000} \
-  config.wsgi:application \
-  --reload
+# Metrics of all gunicorn workers are aggregated from the files of this directory, which
+# must be emptied before the server starts (see apps/common/metrics.py).
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# Server settings come from config/gunicorn.py (SERVER_PROFILE, SERVER_INTERFACE and
+# GUNICORN_* variables). Only the dev profile watches the source tree for changes.
+if [ "${SERVER_PROFILE:-production}" = "dev" ]; then
+  exec watchmedo auto-restart \
+    --directory=. \
+    --pattern=*.py \
+    --recursive \
+    -- \
+    gunicorn --config config/gunicorn.py
+fi
+
+exec gunicorn --config config/gunicorn.py
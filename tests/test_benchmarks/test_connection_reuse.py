@@ -0,0 +1,94 @@
+"""
+Benchmark of the request cycle with per-request, persistent and pooled database
+connections (see DB_CONN_MAX_AGE and DB_POOL in the settings).
+
+Every simulated request does what Django does around a view: close the connection if
+it is obsolete or unusable (request_started), run a query, then do the same check
+again (request_finished). Run with `pytest tests/test_benchmarks -s` to print the
+requests per second of each configuration; against PostgreSQL the difference is the
+cost of a new connection, which dominates small GETs.
+"""
+
+import importlib.util
+import time
+
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.db.utils import ConnectionHandler
+
+import pytest
+
+
+REQUESTS = 200
+
+CONFIGURATIONS = [
+    pytest.param({"CONN_MAX_AGE": 0}, REQUESTS, id="per-request"),
+    pytest.param({"CONN_MAX_AGE": 60}, 1, id="persistent"),
+    pytest.param({"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True}, 1, id="health-checks"),
+    pytest.param(
+        {"CONN_MAX_AGE": 0, "OPTIONS": {"pool": {"min_size": 1, "max_size": 2}}},
+        None,
+        id="pool",
+        marks=pytest.mark.skipif(
+            connection.vendor != "postgresql" or importlib.util.find_spec("psycopg_pool") is None,
+            reason="Connection pooling requires PostgreSQL and psycopg 3",
+        ),
+    ),
+]
+
+
+def _build_connection(tmp_path, **overrides):
+    """
+    Returns a standalone connection to the test database with the given settings.
+
+    SQLite test databases live in memory and are never closed, so a file database is
+    used instead.
+    """
+    settings_dict = {**connection.settings_dict, **overrides}
+    if connection.vendor == "sqlite":
+        settings_dict["NAME"] = str(tmp_path / "benchmark.sqlite3")
+    return ConnectionHandler({"default": settings_dict})["default"]
+
+
+def _serve(db, requests: int) -> tuple[float, int]:
+    """
+    Runs the simulated requests, returning the requests per second and the number of
+    connections opened.
+    """
+    opened = []
+
+    def on_connection_created(sender, connection, **kwargs):
+        if connection is db:
+            opened.append(connection)
+
+    connection_created.connect(on_connection_created)
+    try:
+        started = time.perf_counter()
+        for _ in range(requests):
+            db.close_if_unusable_or_obsolete()
+            with db.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            db.close_if_unusable_or_obsolete()
+        elapsed = time.perf_counter() - started
+    finally:
+        connection_created.disconnect(on_connection_created)
+        db.close()
+        if getattr(db, "pool", None) is not None:
+            db.close_pool()
+    return requests / elapsed, len(opened)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("overrides, expected_connections", CONFIGURATIONS)
+def test_connection_reuse_throughput(request, tmp_path, overrides, expected_connections):
+    db = _build_connection(tmp_path, **overrides)
+
+    throughput, opened = _serve(db, REQUESTS)
+
+    print(
+        f"\n{request.node.callspec.id:>14}: {throughput:10.1f} req/s, "
+        f"{opened} connection(s) opened for {REQUESTS} requests"
+    )
+    if expected_connections is not None:
+        assert opened == expected_connections
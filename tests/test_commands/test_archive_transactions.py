@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+from apps.account.models import ArchivedTransaction, Transaction, Wallet
+from apps.account.services import WalletService
+
+
+@pytest.mark.django_db
+def test_archive_transactions_archives_before_date():
+    wallet = Wallet.objects.create(label="Test Wallet")
+    old = WalletService.apply_cash_flow(wallet.id, Decimal("25"), txid="old")
+    WalletService.apply_cash_flow(wallet.id, Decimal("5"), txid="recent")
+    Transaction.all_objects.filter(pk=old.pk).update(
+        created_at=datetime(2024, 12, 31, tzinfo=timezone.utc)
+    )
+    out = StringIO()
+
+    call_command("archive_transactions", "--before", "2025-01-01", stdout=out)
+
+    assert "Archived 1 transaction(s) of 1 wallet(s)." in out.getvalue()
+    assert ArchivedTransaction.objects.filter(txid="old").exists()
+    assert sorted(Transaction.objects.values_list("amount", flat=True)) == [
+        Decimal("5"),
+        Decimal("25"),
+    ]
+
+
+@pytest.mark.django_db
+def test_archive_transactions_rejects_future_date():
+    future = (datetime.now(timezone.utc) + timedelta(days=2)).date().isoformat()
+
+    with pytest.raises(CommandError, match="in the past"):
+        call_command("archive_transactions", "--before", future)
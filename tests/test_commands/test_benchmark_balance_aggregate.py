@@ -0,0 +1,21 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+import pytest
+
+from apps.account.models import Transaction, Wallet
+
+
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_reports_sizes_and_cleans_up():
+    out = StringIO()
+
+    call_command("benchmark_balance_aggregate", sizes=[5, 20], repeat=2, stdout=out)
+
+    lines = out.getvalue().splitlines()
+    assert lines[0].split() == ["transactions", "before", "ms", "after", "ms", "speedup"]
+    assert [line.split()[0] for line in lines[1:]] == ["5", "20"]
+    assert not Wallet.all_objects.exists()
+    assert not Transaction.all_objects.exists()
+    assert any(index.include for index in Transaction._meta.indexes)
@@ -0,0 +1,25 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+import pytest
+
+from apps.account.management.commands.benchmark_uuid_inserts import Command
+from apps.common.identifiers import uuid7
+
+
+def test_benchmark_uuid_inserts_requires_postgresql():
+    with pytest.raises(CommandError, match="PostgreSQL"):
+        call_command("benchmark_uuid_inserts", rows=10)
+
+
+def test_benchmark_uuid_inserts_builds_copy_rows():
+    wallet_ids = [uuid7(), uuid7()]
+
+    buffer = Command._build_batch(uuid7, wallet_ids, timezone.now(), 0, 3)
+
+    rows = [line.split(",") for line in buffer.getvalue().splitlines()]
+    assert len(rows) == 3
+    assert all(len(row) == 7 for row in rows)
+    assert [row[4] for row in rows] == [str(wallet_ids[0]), str(wallet_ids[1]), str(wallet_ids[0])]
+    assert rows[0][2] < rows[1][2] < rows[2][2]
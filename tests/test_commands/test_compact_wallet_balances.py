@@ -0,0 +1,70 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from apps.account.models import Transaction, Wallet, WalletBalanceCheckpoint
+
+
+def compact(*args):
+    call_command(
+        "compact_wallet_balances", "--lag", "0", "--min-transactions", "1", *args, stdout=StringIO()
+    )
+
+
+@pytest.mark.django_db
+def test_compact_writes_checkpoint_and_tail_sum_matches_ledger():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    Transaction.objects.create(wallet=wallet, txid="tx2", amount=Decimal("-3.0"))
+
+    compact()
+
+    checkpoint = WalletBalanceCheckpoint.get_latest(wallet.pk)
+    assert checkpoint.balance == Decimal("7.0")
+    assert checkpoint.transaction_count == 2
+
+    Transaction.objects.create(wallet=wallet, txid="tx3", amount=Decimal("5.0"))
+
+    assert wallet.calculate_ledger_balance() == Decimal("12.0")
+    assert wallet.calculate_ledger_balance(use_checkpoint=False) == Decimal("12.0")
+    compact("--verify")
+
+
+@pytest.mark.django_db
+def test_compact_skips_wallet_below_min_transactions():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+
+    call_command(
+        "compact_wallet_balances", "--lag", "0", "--min-transactions", "2", stdout=StringIO()
+    )
+
+    assert WalletBalanceCheckpoint.get_latest(wallet.pk) is None
+
+
+@pytest.mark.django_db
+def test_changing_covered_transaction_invalidates_checkpoint():
+    wallet = Wallet.objects.create(label="Wallet")
+    tx = Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    Transaction.objects.create(wallet=wallet, txid="tx2", amount=Decimal("2.0"))
+    compact()
+
+    tx.delete()
+
+    assert WalletBalanceCheckpoint.get_latest(wallet.pk) is None
+    assert wallet.calculate_ledger_balance() == Decimal("2.0")
+    compact("--verify")
+
+
+@pytest.mark.django_db
+def test_verify_detects_stale_checkpoint():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    compact()
+    WalletBalanceCheckpoint.objects.filter(wallet=wallet).update(balance=Decimal("1.0"))
+
+    with pytest.raises(CommandError):
+        compact("--verify")
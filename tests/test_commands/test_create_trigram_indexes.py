@@ -0,0 +1,10 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+
+@pytest.mark.django_db
+def test_create_trigram_indexes_requires_postgresql():
+    with pytest.raises(CommandError, match="require PostgreSQL"):
+        call_command("create_trigram_indexes")
@@ -0,0 +1,10 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+
+@pytest.mark.django_db
+def test_detach_transaction_partitions_requires_partitioned_table():
+    with pytest.raises(CommandError, match="not partitioned"):
+        call_command("detach_transaction_partitions", "--before", "2025-01-01")
@@ -0,0 +1,36 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_test_reports_requests_and_statuses(live_server):
+    out = StringIO()
+
+    call_command(
+        "load_test",
+        "--url",
+        live_server.url,
+        "--paths",
+        "/api/v1/healthcheck/healthz/",
+        "/api/v1/account/wallets/missing/",
+        "--requests",
+        "20",
+        "--concurrency",
+        "4",
+        stdout=out,
+    )
+
+    summary, latency, statuses = out.getvalue().splitlines()
+    assert summary.startswith("requests=20 concurrency=4 ")
+    assert "errors=0" in summary
+    assert latency.startswith("latency ms: p50=")
+    assert statuses == "statuses: 200=10, 404=10"
+
+
+def test_load_test_rejects_invalid_url():
+    with pytest.raises(CommandError, match="Invalid --url"):
+        call_command("load_test", "--url", "localhost:8000")
@@ -0,0 +1,16 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+
+@pytest.mark.django_db
+def test_partition_transactions_requires_postgresql():
+    with pytest.raises(CommandError, match="requires PostgreSQL"):
+        call_command("partition_transactions", months_ahead=1)
+
+
+@pytest.mark.django_db
+def test_partition_transactions_undo_requires_partitioned_table():
+    with pytest.raises(CommandError, match="not partitioned"):
+        call_command("partition_transactions", undo=True)
@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.utils import timezone
+
+import pytest
+
+from apps.account.models import IdempotencyRecord
+
+
+@pytest.mark.django_db
+def test_purge_deletes_only_expired_records():
+    old = IdempotencyRecord.objects.create(key="old", scope="test", fingerprint="fp")
+    IdempotencyRecord.objects.filter(pk=old.pk).update(
+        created_at=timezone.now() - timedelta(days=2)
+    )
+    IdempotencyRecord.objects.create(key="new", scope="test", fingerprint="fp")
+
+    call_command("purge_idempotency_records", older_than=86400)
+
+    assert list(IdempotencyRecord.objects.values_list("key", flat=True)) == ["new"]
@@ -0,0 +1,62 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+import pytest
+
+from apps.account.models import Transaction, Wallet, WalletSlot
+from apps.account.services import WalletService
+
+
+@pytest.mark.django_db
+def test_rebuild_wallet_balances_fixes_drift():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    Wallet.objects.filter(pk=wallet.pk).update(balance=Decimal("99.0"))
+
+    call_command("rebuild_wallet_balances", stdout=StringIO())
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("10.0")
+
+
+@pytest.mark.django_db
+def test_rebuild_wallet_balances_fixes_sharded_wallet():
+    wallet = Wallet.objects.create(label="Omnibus")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    WalletService.set_slot_count(str(wallet.id), 2)
+    WalletSlot.objects.filter(wallet=wallet).update(balance=Decimal("7.0"))
+
+    call_command("rebuild_wallet_balances", stdout=StringIO())
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("10.0")
+    assert list(wallet.slots.order_by("index").values_list("balance", flat=True)) == [
+        Decimal("10.0"),
+        Decimal("0"),
+    ]
+
+
+@pytest.mark.django_db
+def test_rebuild_wallet_balances_check_reports_mismatch():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    Wallet.objects.filter(pk=wallet.pk).update(balance=Decimal("99.0"))
+
+    with pytest.raises(CommandError):
+        call_command("rebuild_wallet_balances", "--check", stdout=StringIO())
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("99.0")
+
+
+@pytest.mark.django_db
+def test_rebuild_wallet_balances_check_passes_when_consistent():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+
+    out = StringIO()
+    call_command("rebuild_wallet_balances", "--check", stdout=out)
+
+    assert "0 mismatch(es)" in out.getvalue()
@@ -0,0 +1,30 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+from apps.account.models import Wallet
+from apps.account.services import WalletService
+
+
+@pytest.mark.django_db
+def test_shard_wallet_sets_slot_count():
+    wallet = Wallet.objects.create(label="Omnibus")
+    WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal("3"))
+    out = StringIO()
+
+    call_command("shard_wallet", "--wallet", str(wallet.id), "--slots", "8", stdout=out)
+
+    assert f"Wallet {wallet.id} has 8 slot(s)" in out.getvalue()
+    assert wallet.slots.count() == 8
+
+
+@pytest.mark.django_db
+def test_shard_wallet_rejects_too_many_slots():
+    wallet = Wallet.objects.create(label="Omnibus")
+
+    with pytest.raises(CommandError, match="between 0 and"):
+        call_command("shard_wallet", "--wallet", str(wallet.id), "--slots", "100000")
@@ -0,0 +1,26 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+import pytest
+
+from apps.account.models import Wallet
+from apps.account.services import WalletContentionService
+
+
+@pytest.mark.django_db
+def test_wallet_contention_reports_and_resets(settings):
+    settings.WALLET_LOCK_CONTENTION_MIN_WAIT_MS = 0
+    wallet = Wallet.objects.create(label="Omnibus")
+    WalletContentionService.reset()
+    WalletContentionService.record([wallet.id], 0.012)
+    out = StringIO()
+
+    call_command("wallet_contention", "--limit", "5", stdout=out)
+    call_command("wallet_contention", "--reset", stdout=out)
+    call_command("wallet_contention", stdout=out)
+
+    lines = out.getvalue().splitlines()
+    assert lines[1].split() == [str(wallet.id), "Omnibus", "1", "12.00", "12.00", "12.00"]
+    assert lines[2] == "Lock contention statistics reset."
+    assert lines[3] == "No lock contention recorded."
@@ -1,11 +1,15 @@
+import uuid
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from django.test import override_settings
 
 import pytest
 
 from apps.account.models import Transaction, Wallet
 from apps.common.exceptions import ValidationError as CustomValidationError
+from apps.common.identifiers import uuid7
 
 
 @pytest.mark.django_db
@@ -59,3 +63,50 @@ def test_transaction_soft_delete():
     assert tx.is_deleted is True
     assert Transaction.objects.count() == 0
     assert Transaction.all_objects.count() == 1
+
+
+def test_soft_delete_mixin_generates_live_indexes():
+    live = {
+        tuple(index.fields): index
+        for index in Transaction._meta.indexes
+        if index.name.endswith("_live")
+    }
+
+    assert set(live) == {
+        ("txid",),
+        ("created_at", "id"),
+        ("wallet", "created_at", "id"),
+        ("wallet",),
+    }
+    assert live[("wallet",)].include == ("amount",)
+    assert all(index.condition == Q(is_deleted=False) for index in live.values())
+
+
+@pytest.mark.django_db
+def test_default_manager_queries_use_live_index():
+    wallet = Wallet.objects.create(label="Indexed")
+
+    plan = Transaction.objects.filter(wallet=wallet).order_by("created_at", "id").explain()
+
+    assert "_live" in plan
+
+
+def test_uuid7_sets_version_and_variant_and_increases():
+    ids = [uuid7() for _ in range(10_000)]
+
+    assert all(value.version == 7 for value in ids)
+    assert all(value.variant == uuid.RFC_4122 for value in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.mark.django_db
+def test_uuid_pk_generator_configurable_per_model():
+    with override_settings(
+        UUID_PK_GENERATOR="uuid4", UUID_PK_GENERATORS={"account.transaction": "uuid7"}
+    ):
+        wallet = Wallet.objects.create(label="Test Wallet")
+        tx = Transaction.objects.create(wallet=wallet, txid="tx-uuid7", amount=Decimal("1"))
+
+    assert wallet.id.version == 4
+    assert tx.id.version == 7
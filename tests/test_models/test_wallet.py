@@ -1,8 +1,11 @@
 from decimal import Decimal
 
+from django.core.cache import caches
+
 import pytest
 
-from apps.account.models import Transaction, Wallet
+from apps.account.models import Transaction, Wallet, WalletSlot
+from apps.common.cache import ObjectCache
 from apps.common.exceptions import ValidationError
 
 
@@ -51,3 +54,127 @@ def test_transaction_prevents_negative_wallet_balance():
         tx2.full_clean()
 
     assert "Wallet balance cannot become negative." in str(exc.value)
+
+
+@pytest.mark.django_db
+def test_wallet_stored_balance_matches_ledger():
+    wallet = Wallet.objects.create(label="Wallet")
+    tx = Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    Transaction.objects.create(wallet=wallet, txid="tx2", amount=Decimal("-4.0"))
+
+    tx.amount = Decimal("12.0")
+    tx.save()
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("8.0")
+    assert wallet.balance == wallet.calculate_ledger_balance()
+
+
+@pytest.mark.django_db
+def test_wallet_stored_balance_updated_on_soft_delete():
+    wallet = Wallet.objects.create(label="Wallet")
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    tx = Transaction.objects.create(wallet=wallet, txid="tx2", amount=Decimal("5.0"))
+
+    tx.delete()
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("10.0")
+
+
+@pytest.mark.django_db
+def test_soft_delete_cannot_make_balance_negative():
+    wallet = Wallet.objects.create(label="Wallet")
+    tx = Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("10.0"))
+    Transaction.objects.create(wallet=wallet, txid="tx2", amount=Decimal("-8.0"))
+
+    with pytest.raises(ValidationError):
+        tx.delete()
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("2.0")
+
+
+@pytest.mark.django_db
+def test_object_cache_reads_through_and_counts_hits(django_assert_num_queries):
+    caches["objects"].clear()
+    ObjectCache.reset_stats()
+    wallet = Wallet.objects.create(label="Cached")
+
+    assert ObjectCache.get(Wallet, wallet.pk) == wallet
+    with django_assert_num_queries(0):
+        assert ObjectCache.get(Wallet, wallet.pk).label == "Cached"
+
+    assert ObjectCache.get_stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+@pytest.mark.django_db
+def test_object_cache_invalidated_on_balance_change_and_soft_delete():
+    wallet = Wallet.objects.create(label="Cached")
+    ObjectCache.get(Wallet, wallet.pk)
+
+    Transaction.objects.create(wallet=wallet, txid="tx-cache", amount=Decimal("7"))
+    assert ObjectCache.get(Wallet, wallet.pk).balance == Decimal("7")
+
+    wallet.delete()
+    assert ObjectCache.get(Wallet, wallet.pk).is_deleted
+
+
+@pytest.mark.django_db
+def test_object_cache_normalizes_pk():
+    caches["objects"].clear()
+    wallet = Wallet.objects.create(label="Cached")
+    ObjectCache.get(Wallet, str(wallet.pk).upper())
+
+    Transaction.objects.create(wallet=wallet, txid="tx-cache", amount=Decimal("7"))
+
+    assert ObjectCache.get(Wallet, str(wallet.pk).upper()).balance == Decimal("7")
+    assert ObjectCache.get(Wallet, wallet.pk.hex).balance == Decimal("7")
+
+
+@pytest.mark.django_db
+def test_wallet_save_does_not_overwrite_balance():
+    wallet = Wallet.objects.create(label="Stale")
+    stale = Wallet.objects.get(pk=wallet.pk)
+    Transaction.objects.create(wallet=wallet, txid="tx-stale", amount=Decimal("3"))
+
+    stale.label = "Renamed"
+    stale.save()
+
+    wallet.refresh_from_db()
+    assert wallet.label == "Renamed"
+    assert wallet.balance == Decimal("3")
+
+
+@pytest.mark.django_db
+def test_sharded_wallet_balance_sums_slots():
+    wallet = Wallet.objects.create(label="Omnibus")
+    Wallet.all_objects.filter(pk=wallet.pk).update(slot_count=2)
+    WalletSlot.objects.create(wallet=wallet, index=0, balance=Decimal("4"))
+    WalletSlot.objects.create(wallet=wallet, index=1, balance=Decimal("6"))
+
+    assert Wallet.objects.get(pk=wallet.pk).balance == Decimal("10")
+    wallet.refresh_from_db(fields=["balance"])
+    assert wallet.balance == Decimal("10")
+    assert Wallet.get_balances([wallet.pk]) == {wallet.pk: Decimal("10")}
+
+
+@pytest.mark.django_db
+def test_sharded_wallet_transactions_update_slots():
+    wallet = Wallet.objects.create(label="Omnibus")
+    Wallet.all_objects.filter(pk=wallet.pk).update(slot_count=3)
+    for index, balance in enumerate(["5", "1", "3"]):
+        WalletSlot.objects.create(wallet=wallet, index=index, balance=Decimal(balance))
+
+    Transaction.objects.create(wallet=wallet, txid="tx1", amount=Decimal("-7"))
+
+    slots = dict(WalletSlot.objects.filter(wallet=wallet).values_list("index", "balance"))
+    assert slots == {0: Decimal("0"), 1: Decimal("1"), 2: Decimal("1")}
+    assert Wallet.objects.get(pk=wallet.pk).balance == Decimal("2")
+    with pytest.raises(ValidationError):
+        Transaction.objects.create(wallet=wallet, txid="tx2", amount=Decimal("-3"))
+
+    Transaction.objects.create(wallet=wallet, txid="tx3", amount=Decimal("4"))
+
+    assert Wallet.all_objects.values_list("balance", flat=True).get(pk=wallet.pk) == 0
+    assert Wallet.objects.get(pk=wallet.pk).balance == Decimal("6")
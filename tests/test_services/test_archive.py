@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone as dj_timezone
+
+import pytest
+
+from apps.account.models import (
+    ArchivedTransaction,
+    Transaction,
+    Wallet,
+    WalletBalanceCheckpoint,
+)
+from apps.account.services import TransactionArchiveService, WalletService
+from apps.common.exceptions import ValidationError
+
+
+BEFORE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _backdate(tx, created_at):
+    Transaction.all_objects.filter(pk=tx.pk).update(created_at=created_at)
+
+
+@pytest.fixture
+def wallet_with_history():
+    wallet = Wallet.objects.create(label="Archived Wallet")
+    old_deposit = WalletService.apply_cash_flow(wallet.id, Decimal("100"), txid="old-deposit")
+    old_withdrawal = WalletService.apply_cash_flow(wallet.id, Decimal("-30"), txid="old-withdrawal")
+    deleted = WalletService.apply_cash_flow(wallet.id, Decimal("5"), txid="old-deleted")
+    deleted.delete()
+    recent = WalletService.apply_cash_flow(wallet.id, Decimal("10"), txid="recent")
+    for tx, days in ((old_deposit, 30), (old_withdrawal, 20), (deleted, 10)):
+        _backdate(tx, BEFORE - timedelta(days=days))
+    _backdate(recent, BEFORE + timedelta(days=1))
+    WalletBalanceCheckpoint.objects.create(
+        wallet=wallet,
+        last_transaction_created_at=BEFORE - timedelta(days=20),
+        last_transaction_id=old_withdrawal.id,
+        balance=Decimal("70"),
+        transaction_count=2,
+    )
+    wallet.refresh_from_db()
+    return wallet
+
+
+@pytest.mark.django_db
+def test_archive_moves_old_transactions_and_carries_balance_forward(wallet_with_history):
+    result = TransactionArchiveService.archive(BEFORE)
+
+    assert result == {"wallets": 1, "archived": 3}
+    assert set(ArchivedTransaction.objects.values_list("txid", flat=True)) == {
+        "old-deposit",
+        "old-withdrawal",
+        "old-deleted",
+    }
+    assert ArchivedTransaction.objects.get(txid="old-deleted").is_deleted
+
+    carry_forward = Transaction.objects.get(
+        txid=TransactionArchiveService.get_carry_forward_txid(wallet_with_history.id, BEFORE)
+    )
+    assert carry_forward.amount == Decimal("70")
+    assert carry_forward.created_at == BEFORE
+    assert Transaction.all_objects.filter(wallet=wallet_with_history).count() == 2
+
+    wallet = Wallet.objects.get(pk=wallet_with_history.pk)
+    assert wallet.balance == Decimal("80")
+    assert wallet.calculate_ledger_balance() == Decimal("80")
+    assert not WalletBalanceCheckpoint.objects.exists()
+
+
+@pytest.mark.django_db
+def test_archive_is_idempotent_for_the_same_cutoff(wallet_with_history):
+    TransactionArchiveService.archive(BEFORE)
+
+    assert TransactionArchiveService.archive(BEFORE) == {"wallets": 0, "archived": 0}
+    assert Wallet.objects.get(pk=wallet_with_history.pk).calculate_ledger_balance() == (
+        Decimal("80")
+    )
+
+
+@pytest.mark.django_db
+def test_archived_txid_cannot_be_reused(wallet_with_history):
+    TransactionArchiveService.archive(BEFORE)
+
+    with pytest.raises(DjangoValidationError):
+        Transaction.objects.create(wallet=wallet_with_history, txid="old-deposit", amount=1)
+
+
+def test_archive_rejects_future_or_naive_cutoff():
+    with pytest.raises(ValidationError):
+        TransactionArchiveService.archive(dj_timezone.now() + timedelta(days=1))
+    with pytest.raises(ValidationError):
+        TransactionArchiveService.archive(datetime(2025, 1, 1))
@@ -0,0 +1,94 @@
+from decimal import Decimal
+from uuid import uuid4
+
+from django.db import OperationalError, transaction
+
+import pytest
+
+from apps.account.models import Wallet
+from apps.account.services import WalletContentionService, WalletService
+
+
+@pytest.fixture(autouse=True)
+def contention_store(settings):
+    settings.WALLET_LOCK_CONTENTION_MIN_WAIT_MS = 0
+    WalletContentionService.reset()
+    yield
+    WalletContentionService.reset()
+
+
+@pytest.mark.django_db
+def test_get_top_wallets_ranks_by_total_wait():
+    hot = Wallet.objects.create(label="Omnibus")
+    cold = Wallet.objects.create(label="Customer")
+
+    WalletContentionService.record([hot.id], 0.004)
+    WalletContentionService.record([hot.id, cold.id], 0.010)
+
+    wallets = WalletContentionService.get_top_wallets()
+
+    assert [wallet["wallet_id"] for wallet in wallets] == [str(hot.id), str(cold.id)]
+    assert wallets[0] == {
+        "wallet_id": str(hot.id),
+        "label": "Omnibus",
+        "contended_locks": 2,
+        "total_wait_ms": 14.0,
+        "avg_wait_ms": 7.0,
+        "max_wait_ms": 10.0,
+    }
+    assert len(WalletContentionService.get_top_wallets(limit=1)) == 1
+
+
+@pytest.mark.django_db
+def test_record_ignores_waits_below_minimum(settings):
+    settings.WALLET_LOCK_CONTENTION_MIN_WAIT_MS = 5
+
+    WalletContentionService.record([uuid4()], 0.001)
+
+    assert WalletContentionService.get_top_wallets() == []
+
+
+@pytest.mark.django_db
+def test_wallet_operations_record_lock_waits():
+    source = Wallet.objects.create(label="Source")
+    dest = Wallet.objects.create(label="Destination")
+
+    WalletService.apply_cash_flow(wallet_id=str(source.id), amount=Decimal("5"))
+    WalletService.transfer(source_id=str(source.id), dest_id=str(dest.id), amount=Decimal("2"))
+
+    locks = {
+        wallet["wallet_id"]: wallet["contended_locks"]
+        for wallet in WalletContentionService.get_top_wallets()
+    }
+    assert locks == {str(source.id): 2, str(dest.id): 1}
+
+
+@pytest.mark.django_db
+def test_lock_waits_are_recorded_when_the_transaction_rolls_back():
+    wallet = Wallet.objects.create(label="Omnibus")
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal("5"))
+            raise RuntimeError("rolled back")
+
+    assert not wallet.transactions.exists()
+    assert [entry["wallet_id"] for entry in WalletContentionService.get_top_wallets()] == [
+        str(wallet.id)
+    ]
+
+
+@pytest.mark.django_db
+def test_lock_waits_are_recorded_when_locking_fails(monkeypatch):
+    wallet = Wallet.objects.create(label="Omnibus")
+
+    def lock_timeout(queryset):
+        raise OperationalError("canceling statement due to lock timeout")
+
+    monkeypatch.setattr("django.db.models.query.QuerySet.first", lock_timeout)
+    with pytest.raises(OperationalError):
+        WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal("-5"))
+
+    assert [entry["wallet_id"] for entry in WalletContentionService.get_top_wallets()] == [
+        str(wallet.id)
+    ]
@@ -0,0 +1,45 @@
+from django.core.cache import cache
+
+import pytest
+
+from apps.account.exceptions import IdempotencyKeyConflictError
+from apps.account.models import IdempotencyRecord
+from apps.account.services import IdempotencyService
+
+
+@pytest.mark.django_db
+class TestIdempotencyService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.calls = 0
+
+    def _handler(self):
+        self.calls += 1
+        return {"status_code": 200, "content": '{"ok": true}', "content_type": "application/json"}
+
+    def test_execute_runs_handler_once(self):
+        first = IdempotencyService.execute("key-1", "test", "fp", self._handler)
+        second = IdempotencyService.execute("key-1", "test", "fp", self._handler)
+
+        assert self.calls == 1
+        assert first["replayed"] is False
+        assert second["replayed"] is True
+        assert second["content"] == first["content"]
+        assert IdempotencyRecord.objects.filter(key="key-1").count() == 1
+
+    def test_execute_falls_back_to_database_on_cache_miss(self):
+        IdempotencyService.execute("key-2", "test", "fp", self._handler)
+        cache.clear()
+
+        result = IdempotencyService.execute("key-2", "test", "fp", self._handler)
+
+        assert self.calls == 1
+        assert result["replayed"] is True
+        assert result["status_code"] == 200
+
+    def test_execute_rejects_different_fingerprint(self):
+        IdempotencyService.execute("key-3", "test", "fp", self._handler)
+
+        with pytest.raises(IdempotencyKeyConflictError):
+            IdempotencyService.execute("key-3", "test", "other", self._handler)
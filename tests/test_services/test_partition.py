@@ -0,0 +1,135 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.db import IntegrityError, connection
+
+import pytest
+
+from apps.account.models import Transaction, Wallet
+from apps.account.services import TransactionPartitionService
+from apps.common.exceptions import ValidationError
+
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Table partitioning requires PostgreSQL"
+)
+
+
+def test_partition_name_and_month_arithmetic():
+    assert TransactionPartitionService.get_partition_name(date(2026, 3, 1)) == (
+        "account_transaction_p2026_03"
+    )
+    assert TransactionPartitionService.add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert TransactionPartitionService.add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_month_start_uses_utc():
+    local = datetime(2026, 4, 1, 1, 30, tzinfo=timezone(timedelta(hours=3)))
+
+    assert TransactionPartitionService.get_month_start(local) == date(2026, 3, 1)
+    assert TransactionPartitionService.get_month_start(date(2026, 4, 17)) == date(2026, 4, 1)
+
+
+@pytest.mark.django_db
+def test_partition_operations_require_partitioned_table():
+    assert not TransactionPartitionService.is_partitioned()
+
+    with pytest.raises(ValidationError):
+        TransactionPartitionService.create_partitions(3)
+    with pytest.raises(ValidationError):
+        TransactionPartitionService.detach_partitions(date(2025, 1, 1))
+
+
+@pytest.fixture
+def partitioned_wallet():
+    wallet = Wallet.objects.create(label="Partitioned")
+    old = Transaction.objects.create(wallet=wallet, txid="tx-old", amount=Decimal("1"))
+    Transaction.all_objects.filter(pk=old.pk).update(
+        created_at=datetime.now(timezone.utc) - timedelta(days=95)
+    )
+    Transaction.objects.create(wallet=wallet, txid="tx-new", amount=Decimal("2"))
+    TransactionPartitionService.partition_table(months_ahead=1)
+    yield wallet
+    if TransactionPartitionService.is_partitioned():
+        TransactionPartitionService.unpartition_table()
+
+
+def _count_rows(table):
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+        return cursor.fetchone()[0]
+
+
+@requires_postgresql
+@pytest.mark.django_db(transaction=True)
+def test_partition_table_keeps_rows_and_txid_uniqueness(partitioned_wallet):
+    current = TransactionPartitionService.get_month_start(datetime.now(timezone.utc))
+    next_month = TransactionPartitionService.add_months(current, 1)
+    names = [partition["name"] for partition in TransactionPartitionService.list_partitions()]
+
+    assert TransactionPartitionService.is_partitioned()
+    assert names[-2:] == [
+        TransactionPartitionService.get_partition_name(current),
+        TransactionPartitionService.get_partition_name(next_month),
+    ]
+    assert set(Transaction.objects.values_list("txid", flat=True)) == {"tx-old", "tx-new"}
+    assert partitioned_wallet.calculate_ledger_balance() == Decimal("3")
+    with pytest.raises(IntegrityError):
+        Transaction.objects.bulk_create(
+            [Transaction(wallet=partitioned_wallet, txid="tx-new", amount=Decimal("1"))]
+        )
+
+    Transaction.all_objects.filter(txid="tx-new").update(txid="tx-renamed")
+    Transaction.objects.bulk_create(
+        [Transaction(wallet=partitioned_wallet, txid="tx-new", amount=Decimal("1"))]
+    )
+    Transaction.all_objects.filter(txid="tx-new").delete()
+    Transaction.objects.bulk_create(
+        [Transaction(wallet=partitioned_wallet, txid="tx-new", amount=Decimal("1"))]
+    )
+
+    TransactionPartitionService.unpartition_table()
+
+    assert not TransactionPartitionService.is_partitioned()
+    assert Transaction.objects.count() == 3
+
+
+@requires_postgresql
+@pytest.mark.django_db(transaction=True)
+def test_create_partitions_moves_rows_out_of_default_partition(partitioned_wallet):
+    late = TransactionPartitionService.add_months(
+        TransactionPartitionService.get_month_start(datetime.now(timezone.utc)), 3
+    )
+    Transaction.all_objects.filter(txid="tx-new").update(
+        created_at=datetime(late.year, late.month, 2, tzinfo=timezone.utc)
+    )
+
+    assert TransactionPartitionService.count_default_rows() == 1
+
+    created = TransactionPartitionService.create_partitions(months_ahead=3)
+
+    assert TransactionPartitionService.get_partition_name(late) in created
+    assert TransactionPartitionService.count_default_rows() == 0
+    assert _count_rows(TransactionPartitionService.get_partition_name(late)) == 1
+    with pytest.raises(IntegrityError):
+        Transaction.objects.bulk_create(
+            [Transaction(wallet=partitioned_wallet, txid="tx-new", amount=Decimal("1"))]
+        )
+
+
+@requires_postgresql
+@pytest.mark.django_db(transaction=True)
+def test_detach_partitions_concurrently(partitioned_wallet):
+    current = TransactionPartitionService.get_month_start(datetime.now(timezone.utc))
+    oldest = TransactionPartitionService.list_partitions()[0]["name"]
+
+    with pytest.raises(ValidationError, match="live transactions"):
+        TransactionPartitionService.detach_partitions(current)
+
+    Transaction.all_objects.filter(txid="tx-old").update(is_deleted=True)
+    detached = TransactionPartitionService.detach_partitions(current, drop=True)
+
+    assert oldest in detached
+    remaining = [partition["name"] for partition in TransactionPartitionService.list_partitions()]
+    assert not set(detached) & set(remaining)
+    assert set(Transaction.all_objects.values_list("txid", flat=True)) == {"tx-new"}
@@ -1,5 +1,8 @@
 from decimal import Decimal
 
+from django.db import transaction as db_transaction
+from django.test import override_settings
+
 import pytest
 
 from apps.account.models import Transaction, Wallet
@@ -40,3 +43,32 @@ def test_transaction_service_create_negative_balance_raises():
 
     with pytest.raises(ValidationError):
         TransactionService.create(wallet=wallet, amount=Decimal("-20.00"))
+
+
+@pytest.mark.django_db
+def test_transaction_service_create_trusted_updates_locked_wallet():
+    wallet = Wallet.objects.create(label="Test Wallet")
+
+    with db_transaction.atomic():
+        locked = Wallet.objects.select_for_update().get(pk=wallet.pk)
+        TransactionService.create(wallet=locked, amount=Decimal("7.50"), trusted=True)
+
+    assert locked.balance == Decimal("7.50")
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("7.50")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_transaction_service_create_trusted_outside_atomic_block_validates_balance():
+    wallet = Wallet.objects.create(label="Test Wallet")
+
+    with pytest.raises(ValidationError):
+        TransactionService.create(wallet=wallet, amount=Decimal("-1.00"), trusted=True)
+
+
+@override_settings(UUID_PK_GENERATORS={"account.transaction": "uuid7"})
+def test_transaction_service_generated_txids_are_time_ordered():
+    txids = [TransactionService.generate_txid() for _ in range(100)]
+
+    assert all(len(txid) == 32 and txid[12] == "7" for txid in txids)
+    assert txids == sorted(txids)
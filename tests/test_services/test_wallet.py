@@ -2,9 +2,12 @@ from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from prometheus_client import REGISTRY
 
 from apps.account.exceptions import SameWalletException, WalletNotFoundError
-from apps.account.models import Transaction, Wallet
+from apps.account.models import Transaction, Wallet, WalletSlot
+from apps.account.services.contention import WalletContentionService
+from apps.account.services.transaction import TransactionService
 from apps.account.services.wallet import WalletService
 from apps.common.exceptions import BalanceNegativeError, ValidationError
 
@@ -50,6 +53,7 @@ def test_transfer_success():
     dest = Wallet.objects.create(label="Destination")
 
     WalletService.apply_cash_flow(wallet_id=str(source.id), amount=Decimal("100.00"))
+    source.refresh_from_db()
 
     source_before = source.balance
     dest_before = dest.balance
@@ -110,3 +114,282 @@ def test_transfer_wallet_not_found_raises():
             source_id=str(source.id), dest_id=missing_id, amount=Decimal("10.00")
         )
     assert missing_id in str(exc.value)
+
+
+@pytest.mark.django_db
+def test_apply_cash_flow_reads_balance_once(django_assert_max_num_queries):
+    wallet = Wallet.objects.create(label="My Wallet")
+    WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal("10.00"))
+
+    # savepoint, locked wallet select, txid uniqueness, insert, balance update, release
+    with django_assert_max_num_queries(6):
+        WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal("-4.00"))
+
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("6.00")
+
+
+@pytest.mark.django_db
+def test_transfer_insufficient_funds_rejected_by_service():
+    source = Wallet.objects.create(label="Source")
+    dest = Wallet.objects.create(label="Destination")
+    WalletService.apply_cash_flow(wallet_id=str(source.id), amount=Decimal("5.00"))
+
+    with pytest.raises(BalanceNegativeError):
+        WalletService.transfer(
+            source_id=str(source.id), dest_id=str(dest.id), amount=Decimal("10.00")
+        )
+
+    source.refresh_from_db()
+    assert source.balance == Decimal("5.00")
+    assert not Transaction.objects.filter(wallet=dest).exists()
+
+
+@pytest.mark.django_db
+def test_apply_cash_flows_bulk_applies_all_items():
+    first = Wallet.objects.create(label="First")
+    second = Wallet.objects.create(label="Second")
+    items = [
+        {"wallet_id": str(first.id), "amount": Decimal("10.00"), "txid": "bulk-1"},
+        {"wallet_id": str(second.id), "amount": Decimal("5.00")},
+        {"wallet_id": str(first.id), "amount": Decimal("-4.00")},
+    ]
+
+    results = WalletService.apply_cash_flows_bulk(items)
+
+    assert [result["status"] for result in results] == ["applied"] * 3
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.balance == Decimal("6.00")
+    assert second.balance == Decimal("5.00")
+    assert Transaction.objects.filter(txid="bulk-1", wallet=first).exists()
+    assert Transaction.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_apply_cash_flows_bulk_atomic_rejects_all_on_failure():
+    wallet = Wallet.objects.create(label="Wallet")
+    items = [
+        {"wallet_id": str(wallet.id), "amount": Decimal("10.00")},
+        {"wallet_id": str(wallet.id), "amount": Decimal("-20.00")},
+        {"wallet_id": str(uuid4()), "amount": Decimal("1.00")},
+    ]
+
+    results = WalletService.apply_cash_flows_bulk(items, atomic=True)
+
+    assert [result["status"] for result in results] == ["skipped", "failed", "failed"]
+    assert results[1]["error"] == "Insufficient wallet funds"
+    assert results[2]["error"] == "Wallet not found"
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("0")
+    assert not Transaction.objects.exists()
+
+
+@pytest.mark.django_db
+def test_apply_cash_flows_bulk_best_effort_applies_valid_items():
+    wallet = Wallet.objects.create(label="Wallet")
+    TransactionService.create(wallet=wallet, amount=Decimal("1.00"), txid="existing")
+    items = [
+        {"wallet_id": str(wallet.id), "amount": Decimal("10.00"), "txid": "existing"},
+        {"wallet_id": str(wallet.id), "amount": Decimal("10.00"), "txid": "new"},
+        {"wallet_id": str(wallet.id), "amount": Decimal("5.00"), "txid": "new"},
+        {"wallet_id": str(wallet.id), "amount": Decimal("-12.00")},
+    ]
+
+    results = WalletService.apply_cash_flows_bulk(items, atomic=False)
+
+    assert [result["status"] for result in results] == ["failed", "applied", "failed", "failed"]
+    assert results[0]["error"] == "Duplicate txid"
+    assert results[1]["transaction_id"] is not None
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("11.00")
+
+
+@pytest.mark.django_db
+def test_transfer_many_nets_balances():
+    first = Wallet.objects.create(label="First")
+    second = Wallet.objects.create(label="Second")
+    third = Wallet.objects.create(label="Third")
+    WalletService.apply_cash_flow(wallet_id=str(first.id), amount=Decimal("10.00"))
+
+    wallets = WalletService.transfer_many(
+        [
+            {"source_id": str(second.id), "dest_id": str(third.id), "amount": Decimal("4.00")},
+            {"source_id": str(first.id), "dest_id": str(second.id), "amount": Decimal("10.00")},
+            {"source_id": str(third.id), "dest_id": str(first.id), "amount": Decimal("1.00")},
+        ]
+    )
+
+    balances = {wallet.id: wallet.balance for wallet in wallets}
+    assert balances == {
+        first.id: Decimal("1.00"),
+        second.id: Decimal("6.00"),
+        third.id: Decimal("3.00"),
+    }
+    assert [wallet.id for wallet in wallets] == sorted(balances)
+    for wallet in (first, second, third):
+        wallet.refresh_from_db()
+        assert wallet.balance == balances[wallet.id]
+    assert Transaction.objects.count() == 7
+
+
+@pytest.mark.django_db
+def test_transfer_many_insufficient_funds_writes_nothing():
+    source = Wallet.objects.create(label="Source")
+    dest = Wallet.objects.create(label="Destination")
+    WalletService.apply_cash_flow(wallet_id=str(source.id), amount=Decimal("5.00"))
+
+    with pytest.raises(BalanceNegativeError):
+        WalletService.transfer_many(
+            [
+                {"source_id": str(source.id), "dest_id": str(dest.id), "amount": Decimal("3.00")},
+                {"source_id": str(source.id), "dest_id": str(dest.id), "amount": Decimal("3.00")},
+            ]
+        )
+
+    source.refresh_from_db()
+    assert source.balance == Decimal("5.00")
+    assert Transaction.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_transfer_many_wallet_not_found_raises():
+    source = Wallet.objects.create(label="Source")
+    missing_id = str(uuid4())
+
+    with pytest.raises(WalletNotFoundError) as exc:
+        WalletService.transfer_many(
+            [{"source_id": str(source.id), "dest_id": missing_id, "amount": Decimal("1.00")}]
+        )
+    assert missing_id in str(exc.value)
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+def test_wallet_operations_record_metrics():
+    source = Wallet.objects.create(label="Source")
+    dest = Wallet.objects.create(label="Destination")
+    operations = _sample("wallet_operation_duration_seconds_count", operation="apply_cash_flow")
+    lock_waits = _sample("wallet_lock_wait_seconds_count", operation="transfer")
+    rejections = _sample("balance_validation_rejections_total", reason="insufficient_funds")
+
+    WalletService.apply_cash_flow(wallet_id=str(source.id), amount=Decimal("5.00"))
+    WalletService.transfer(source_id=str(source.id), dest_id=str(dest.id), amount=Decimal("2"))
+    with pytest.raises(BalanceNegativeError):
+        WalletService.transfer(source_id=str(source.id), dest_id=str(dest.id), amount=Decimal("10"))
+
+    assert (
+        _sample("wallet_operation_duration_seconds_count", operation="apply_cash_flow")
+        == operations + 1
+    )
+    assert _sample("wallet_lock_wait_seconds_count", operation="transfer") == lock_waits + 2
+    assert (
+        _sample("balance_validation_rejections_total", reason="insufficient_funds")
+        == rejections + 1
+    )
+
+
+@pytest.mark.django_db
+def test_set_slot_count_moves_balance_to_slots_and_back():
+    wallet = Wallet.objects.create(label="Omnibus")
+    WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal("10"))
+
+    wallet = WalletService.set_slot_count(str(wallet.id), 4)
+
+    assert wallet.slot_count == 4
+    assert wallet.balance == Decimal("10")
+    assert list(wallet.slots.order_by("index").values_list("balance", flat=True)) == [
+        Decimal("10"),
+        Decimal("0"),
+        Decimal("0"),
+        Decimal("0"),
+    ]
+
+    wallet = WalletService.set_slot_count(str(wallet.id), 0)
+
+    assert wallet.balance == Decimal("10")
+    assert not wallet.slots.exists()
+
+
+@pytest.mark.django_db
+def test_set_slot_count_rejects_invalid_count():
+    wallet = Wallet.objects.create(label="Omnibus")
+
+    with pytest.raises(ValidationError):
+        WalletService.set_slot_count(str(wallet.id), -1)
+    with pytest.raises(WalletNotFoundError):
+        WalletService.set_slot_count(str(uuid4()), 2)
+
+
+@pytest.mark.django_db
+def test_sharded_wallet_deposits_spread_over_slots(monkeypatch):
+    wallet = Wallet.objects.create(label="Omnibus")
+    WalletService.set_slot_count(str(wallet.id), 2)
+    indexes = iter([0, 1, 1])
+    monkeypatch.setattr("apps.account.models.wallet.random.randrange", lambda _: next(indexes))
+
+    for amount in ["1", "2", "3"]:
+        WalletService.apply_cash_flow(wallet_id=str(wallet.id), amount=Decimal(amount))
+
+    assert list(wallet.slots.order_by("index").values_list("balance", flat=True)) == [
+        Decimal("1"),
+        Decimal("5"),
+    ]
+    wallet.refresh_from_db()
+    assert wallet.balance == Decimal("6")
+    assert wallet.calculate_ledger_balance() == Decimal("6")
+
+
+@pytest.mark.django_db
+def test_sharded_wallet_withdrawals_and_transfers():
+    omnibus = Wallet.objects.create(label="Omnibus")
+    customer = Wallet.objects.create(label="Customer")
+    WalletService.set_slot_count(str(omnibus.id), 3)
+    WalletSlot.objects.filter(wallet=omnibus).update(balance=Decimal("4"))
+
+    WalletService.apply_cash_flow(wallet_id=str(omnibus.id), amount=Decimal("-5"))
+    WalletService.transfer(source_id=str(omnibus.id), dest_id=str(customer.id), amount=Decimal("2"))
+    with pytest.raises(BalanceNegativeError):
+        WalletService.apply_cash_flow(wallet_id=str(omnibus.id), amount=Decimal("-6"))
+    WalletService.transfer_many(
+        [{"source_id": str(customer.id), "dest_id": str(omnibus.id), "amount": Decimal("1")}]
+    )
+    WalletService.apply_cash_flows_bulk(
+        [
+            {"wallet_id": str(omnibus.id), "amount": Decimal("2")},
+            {"wallet_id": str(customer.id), "amount": Decimal("-1")},
+        ]
+    )
+
+    omnibus.refresh_from_db()
+    customer.refresh_from_db()
+    assert omnibus.balance == Decimal("8")
+    assert customer.balance == Decimal("0")
+    assert sum(omnibus.slots.values_list("balance", flat=True)) == Decimal("8")
+
+
+@pytest.mark.django_db
+def test_transfer_to_wallet_unsharded_while_locking(monkeypatch):
+    source = Wallet.objects.create(label="Source")
+    dest = Wallet.objects.create(label="Omnibus")
+    WalletService.apply_cash_flow(wallet_id=str(source.id), amount=Decimal("5"))
+    WalletService.apply_cash_flow(wallet_id=str(dest.id), amount=Decimal("3"))
+    WalletService.set_slot_count(str(dest.id), 2)
+    unsharded = []
+
+    def unshard_after_locking(wallet_ids, wait):
+        if not unsharded:
+            unsharded.append(WalletService.set_slot_count(str(dest.id), 0))
+
+    monkeypatch.setattr(WalletContentionService, "record", unshard_after_locking)
+
+    WalletService.transfer(source_id=str(source.id), dest_id=str(dest.id), amount=Decimal("2"))
+
+    assert unsharded
+    dest.refresh_from_db()
+    assert dest.slot_count == 0
+    assert dest.balance == Decimal("5")
+    assert dest.calculate_ledger_balance() == Decimal("5")
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.account.models import Transaction, Wallet
+from apps.account.services import TransactionArchiveService, WalletService
+
+
+URL = "/api/v1/account/archived-transactions/"
+
+
+@pytest.mark.django_db
+class TestArchivedTransactionViewSet:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Test Wallet")
+        tx = WalletService.apply_cash_flow(self.wallet.id, Decimal("12.5"), txid="archived-tx")
+        Transaction.all_objects.filter(pk=tx.pk).update(
+            created_at=datetime(2024, 6, 1, tzinfo=timezone.utc)
+        )
+        TransactionArchiveService.archive(datetime(2025, 1, 1, tzinfo=timezone.utc))
+        self.tx_id = tx.id
+
+    def test_list_and_filter_archived_transactions(self):
+        response = self.client.get(URL, {"wallet": str(self.wallet.id)})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()["data"]
+        assert [item["attributes"]["txid"] for item in data] == ["archived-tx"]
+        assert data[0]["type"] == "archived-transactions"
+
+        response = self.client.get(URL, {"txid_exact": "other"})
+        assert response.json()["data"] == []
+
+    def test_retrieve_archived_transaction(self):
+        response = self.client.get(f"{URL}{self.tx_id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["attributes"]["amount"] == "12.500000000000000000"
+
+    def test_archive_is_read_only(self):
+        response = self.client.delete(f"{URL}{self.tx_id}/")
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
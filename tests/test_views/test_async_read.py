@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+from django.test import AsyncClient
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework import status
+
+from apps.account.models import Wallet
+from apps.account.services import WalletService
+
+
+def _get(url, params=None):
+    return async_to_sync(AsyncClient().get)(url, params or {})
+
+
+@pytest.mark.django_db
+class TestAsyncReadViews:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.wallets = [Wallet.objects.create(label=f"Async Wallet {i}") for i in range(3)]
+        self.transactions = [
+            WalletService.apply_cash_flow(self.wallets[0].id, Decimal(amount))
+            for amount in ("1", "2", "3")
+        ]
+
+    def test_wallet_list_is_keyset_paginated(self):
+        response = _get("/api/v1/account/async/wallets/", {"page[size]": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert [item["id"] for item in body["data"]] == [str(w.id) for w in self.wallets[:2]]
+        assert body["meta"]["pagination"] == {"size": 2, "count": 3}
+
+        response = _get(body["links"]["next"])
+        assert [item["id"] for item in response.json()["data"]] == [str(self.wallets[2].id)]
+
+    def test_transaction_list_filters_and_orders_like_viewset(self):
+        response = _get(
+            "/api/v1/account/async/transactions/",
+            {"wallet": str(self.wallets[0].id), "amount_min": "2", "page[count]": "false"},
+        )
+
+        body = response.json()
+        assert [item["id"] for item in body["data"]] == [
+            str(tx.id) for tx in reversed(self.transactions[1:])
+        ]
+        assert body["data"][0]["type"] == "transactions"
+        assert "count" not in body["meta"]["pagination"]
+
+    def test_retrieve_and_not_found(self):
+        wallet = self.wallets[0]
+        response = _get(f"/api/v1/account/async/wallets/{wallet.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["attributes"]["balance"] == "6.000000000000000000"
+
+        wallet.delete()
+        response = _get(f"/api/v1/account/async/wallets/{wallet.id}/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_async_views_are_read_only(self):
+        response = async_to_sync(AsyncClient().post)("/api/v1/account/async/wallets/", {})
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+def test_async_healthcheck_reports_services():
+    response = _get("/api/v1/healthcheck/healthz/async/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["attributes"] == {"redis": "ok", "postgres": "ok"}
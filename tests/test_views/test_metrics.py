@@ -0,0 +1,66 @@
+from django.core.cache import cache
+
+import pytest
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.account.models import Wallet
+
+
+METRICS_URL = "/metrics/"
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Metrics Wallet")
+
+    def test_exposes_metrics_in_prometheus_format(self):
+        response = self.client.get(METRICS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        content = response.content.decode()
+        for name in (
+            "http_request_duration_seconds",
+            "wallet_operation_duration_seconds",
+            "wallet_lock_wait_seconds",
+            "cache_requests_total",
+            "balance_validation_rejections_total",
+        ):
+            assert f"# TYPE {name} " in content
+
+    def test_requests_are_labelled_by_viewset_action(self):
+        labels = {"view": "WalletViewSet", "action": "retrieve", "method": "GET", "status": "200"}
+        before = _sample("http_request_duration_seconds_count", **labels)
+
+        self.client.get(f"/api/v1/account/wallets/{self.wallet.id}/")
+
+        assert _sample("http_request_duration_seconds_count", **labels) == before + 1
+
+    def test_response_cache_hits_and_misses_are_counted(self):
+        labels = {"cache": "response", "model": "account.wallet"}
+        hits = _sample("cache_requests_total", result="hit", **labels)
+        misses = _sample("cache_requests_total", result="miss", **labels)
+
+        self.client.get("/api/v1/account/wallets/")
+        self.client.get("/api/v1/account/wallets/")
+
+        assert _sample("cache_requests_total", result="miss", **labels) == misses + 1
+        assert _sample("cache_requests_total", result="hit", **labels) == hits + 1
+
+    def test_multiprocess_mode_aggregates_worker_files(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        response = self.client.get(METRICS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "wallet_operation_duration_seconds" not in response.content.decode()
@@ -0,0 +1,77 @@
+import logging
+import re
+
+from django.core.cache import cache
+from django.test import AsyncClient
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.account.api.v1.views import WalletViewSet
+from apps.account.models import Wallet
+from apps.common.exceptions import QueryBudgetExceededError
+from apps.common.profiling import QueryProfile
+
+
+WALLETS_URL = "/api/v1/account/wallets/"
+SERVER_TIMING = re.compile(r'^db;dur=\d+\.\d{3};desc="(\d+) queries", app;dur=\d+\.\d{3}$')
+
+
+@pytest.mark.django_db
+class TestQueryProfilingMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.client = APIClient()
+        Wallet.objects.create(label="Profiled Wallet")
+
+    def test_server_timing_header_reports_queries(self):
+        response = self.client.get(WALLETS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        assert match and int(match.group(1)) > 0
+
+    def test_async_views_are_profiled(self):
+        response = async_to_sync(AsyncClient().get)("/api/v1/account/async/wallets/")
+
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        assert match and int(match.group(1)) > 0
+
+    def test_over_budget_raises(self, settings):
+        settings.QUERY_BUDGET = 1
+
+        with pytest.raises(QueryBudgetExceededError, match=r"\[GET\] /api/v1/account/wallets/"):
+            self.client.get(WALLETS_URL)
+
+    def test_over_budget_warns(self, settings, caplog):
+        settings.QUERY_BUDGET = 1
+        settings.QUERY_BUDGET_ACTION = "warn"
+
+        with caplog.at_level(logging.WARNING, logger="apps.common.middlewares"):
+            response = self.client.get(WALLETS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        [record] = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert record.db_queries > 1
+        assert record.db_slowest[0]["sql"]
+
+    def test_view_budget_overrides_setting(self, settings, monkeypatch):
+        settings.QUERY_BUDGET = 1
+        monkeypatch.setattr(WalletViewSet, "query_budget", 50, raising=False)
+
+        response = self.client.get(WALLETS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+def test_query_profile_keeps_slowest_statements():
+    profile = QueryProfile(slowest=2, budget=2)
+    for duration in (0.001, 0.004, 0.002):
+        profile.record("default", f"SELECT {duration}", duration)
+
+    assert profile.count == 3
+    assert profile.over_budget
+    assert [entry["sql"] for entry in profile.slowest] == ["SELECT 0.004", "SELECT 0.002"]
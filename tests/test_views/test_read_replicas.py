@@ -0,0 +1,115 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.account.models import Wallet
+from apps.common import routers
+from apps.common.middlewares import ReadYourWritesMiddleware
+
+
+WALLETS_URL = "/api/v1/account/wallets/"
+
+
+def _tables(queries) -> str:
+    return " ".join(query["sql"] for query in queries)
+
+
+@pytest.fixture
+def routing_state():
+    tokens = routers.start_request()
+    yield
+    routers.end_request(tokens)
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestReadReplicaRouting:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+        cache.clear()
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Replica Wallet")
+
+    def _get(self, url, **headers):
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary:
+            with CaptureQueriesContext(connections["replica"]) as replica:
+                response = self.client.get(url, **headers)
+        assert response.status_code == status.HTTP_200_OK
+        return primary, replica
+
+    def test_safe_reads_use_replica(self):
+        primary, replica = self._get(WALLETS_URL)
+
+        assert "account_wallet" in _tables(replica)
+        assert "account_wallet" not in _tables(primary)
+
+    def test_write_sets_read_your_writes_cookie(self):
+        data = {"data": {"type": "wallets", "attributes": {"label": "New Wallet"}}}
+        response = self.client.post(WALLETS_URL, data, format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        cookie = response.cookies[ReadYourWritesMiddleware.COOKIE_NAME]
+        assert cookie["max-age"] == 5
+
+        primary, replica = self._get(WALLETS_URL)
+        assert "account_wallet" in _tables(primary)
+        assert not replica
+
+    def test_header_pins_reads_to_primary(self):
+        primary, replica = self._get(WALLETS_URL, HTTP_X_READ_YOUR_WRITES="1")
+
+        assert "account_wallet" in _tables(primary)
+        assert not replica
+
+    def test_object_cache_misses_read_primary(self):
+        primary, replica = self._get(f"{WALLETS_URL}{self.wallet.id}/")
+
+        assert "account_wallet" in _tables(primary)
+        assert "account_wallet" not in _tables(replica)
+
+    def test_responses_from_replica_are_cached_for_replica_lag(self, settings):
+        settings.DB_REPLICA_MAX_LAG = 0
+        self._get(WALLETS_URL)
+        _, replica = self._get(WALLETS_URL)
+
+        assert "account_wallet" in _tables(replica)
+
+
+@pytest.mark.usefixtures("routing_state")
+class TestReplicaRouter:
+    router = routers.ReplicaRouter()
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+
+    def test_reads_use_replica_until_write(self):
+        assert self.router.db_for_read(Wallet) == "replica"
+        assert routers.has_read_from_replica()
+
+        assert self.router.db_for_write(Wallet) == DEFAULT_DB_ALIAS
+        assert self.router.db_for_read(Wallet) == DEFAULT_DB_ALIAS
+
+    def test_pinned_block_reads_primary(self):
+        with routers.pinned_to_primary():
+            assert self.router.db_for_read(Wallet) == DEFAULT_DB_ALIAS
+        assert self.router.db_for_read(Wallet) == "replica"
+
+    @pytest.mark.django_db(transaction=True)
+    def test_transactions_read_primary(self):
+        with transaction.atomic():
+            assert self.router.db_for_read(Wallet) == DEFAULT_DB_ALIAS
+
+    def test_without_replicas_everything_uses_primary(self, settings):
+        settings.DATABASE_REPLICAS = []
+
+        assert self.router.db_for_read(Wallet) == DEFAULT_DB_ALIAS
+        assert not routers.has_read_from_replica()
+
+    def test_migrations_skip_replicas(self):
+        assert self.router.allow_migrate("replica", "account") is False
+        assert self.router.allow_migrate(DEFAULT_DB_ALIAS, "account") is None
@@ -1,5 +1,11 @@
+import base64
+import json
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -86,3 +92,110 @@ class TestTransactionViewSet:
         filtered_txs = [tx for tx in filtered_txs if tx["txid"] == "abc123"]
         assert len(filtered_txs) == 1
         assert filtered_txs[0]["txid"] == "abc123"
+
+    def test_soft_delete_invalidates_cached_list(self):
+        tx = Transaction.objects.create(wallet=self.wallet, txid="tx-cached", amount=Decimal("5"))
+        Transaction.objects.create(wallet=self.wallet, txid="tx-other", amount=Decimal("1"))
+        url = "/api/v1/account/transactions/?txid=tx-cached"
+        data = self.client.get(url, format="vnd.api+json").json()["data"]
+        assert [item["id"] for item in data] == [str(tx.id)]
+
+        response = self.client.delete(f"/api/v1/account/transactions/{tx.id}/")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        assert self.client.get(url, format="vnd.api+json").json()["data"] == []
+
+
+@pytest.mark.django_db
+class TestTransactionKeysetPagination:
+    url = "/api/v1/account/transactions/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Keyset Wallet")
+        for index in range(7):
+            Transaction.objects.create(wallet=self.wallet, txid=f"ks-{index}", amount=Decimal("1"))
+        self.expected = [
+            str(pk)
+            for pk in Transaction.objects.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        ]
+
+    def _get(self, url):
+        response = self.client.get(url, format="vnd.api+json")
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_walks_all_pages_in_keyset_order(self):
+        seen = []
+        url = f"{self.url}?page[cursor]=&page[size]=3"
+        while url:
+            body = self._get(url)
+            seen += [item["id"] for item in body["data"]]
+            assert body["meta"]["pagination"]["count"] == 7
+            url = body["links"]["next"]
+
+        assert seen == self.expected
+
+    def test_prev_link_returns_previous_page(self):
+        first = self._get(f"{self.url}?page[cursor]=&page[size]=3")
+        second = self._get(first["links"]["next"])
+        assert first["links"]["prev"] is None
+
+        back = self._get(second["links"]["prev"])
+
+        assert [item["id"] for item in back["data"]] == self.expected[:3]
+
+    def test_count_opt_out_skips_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            body = self._get(f"{self.url}?page[cursor]=&page[count]=false")
+
+        assert "count" not in body["meta"]["pagination"]
+        assert not any("COUNT(" in query["sql"].upper() for query in queries)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(f"{self.url}?page[cursor]=garbage", format="vnd.api+json")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cursor_with_invalid_id_returns_404(self):
+        payload = {"c": "2025-01-01T00:00:00+00:00", "i": "x"}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        response = self.client.get(f"{self.url}?page[cursor]={cursor}", format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_page_number_pagination_is_default(self):
+        body = self._get(f"{self.url}?page[number]=2&page[size]=5")
+        assert body["meta"]["pagination"]["page"] == 2
+        assert len(body["data"]) == 2
+
+
+@pytest.mark.django_db
+class TestTransactionTxidFilterModes:
+    url = "/api/v1/account/transactions/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.client = APIClient()
+        wallet = Wallet.objects.create(label="Filter Wallet")
+        for txid in ("abc-1", "abc-12", "xabc-2"):
+            Transaction.objects.create(wallet=wallet, txid=txid, amount=Decimal("1"))
+
+    def _txids(self, query):
+        response = self.client.get(f"{self.url}?{query}", format="vnd.api+json")
+        assert response.status_code == status.HTTP_200_OK
+        return sorted(item["attributes"]["txid"] for item in response.json()["data"])
+
+    def test_exact(self):
+        assert self._txids("txid_exact=abc-1") == ["abc-1"]
+
+    def test_prefix(self):
+        assert self._txids("txid_prefix=abc") == ["abc-1", "abc-12"]
+
+    def test_substring(self):
+        assert self._txids("txid=ABC") == ["abc-1", "abc-12", "xabc-2"]
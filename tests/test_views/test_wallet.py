@@ -1,10 +1,17 @@
+import csv
+import json
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from apps.account.models import Wallet
+from apps.account.models import Transaction, Wallet
+from apps.account.services import WalletService
 
 
 @pytest.mark.django_db
@@ -76,6 +83,19 @@ class TestWalletViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["message"] == "Wallet has been deposited"
 
+    def test_deposit_to_sharded_wallet(self):
+        WalletService.set_slot_count(str(self.wallet1.id), 4)
+        url = f"/api/v1/account/wallets/{self.wallet1.id}/deposit/"
+
+        for amount in ["50.00", "25.00", "-60.00"]:
+            data = {"data": {"type": "wallets", "attributes": {"amount": amount}}}
+            response = self.client.post(url, data, format="vnd.api+json")
+            assert response.status_code == status.HTTP_200_OK
+
+        response = self.client.get(f"/api/v1/account/wallets/{self.wallet1.id}/")
+        assert Decimal(response.data["balance"]) == Decimal("15.00")
+        assert self.wallet1.calculate_ledger_balance() == Decimal("15.00")
+
     def test_transfer_between_wallets(self):
         deposit_url = f"/api/v1/account/wallets/{self.wallet1.id}/deposit/"
         deposit_data = {
@@ -101,3 +121,359 @@ class TestWalletViewSet:
         response = self.client.post(url, transfer_data, format="vnd.api+json")
         assert response.status_code == status.HTTP_200_OK
         assert response.data["message"] == "Transfer has been completed"
+
+
+@pytest.mark.django_db
+class TestWalletListQueryCount:
+    def _list_query_count(self, client):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/api/v1/account/wallets/?page[size]=100", format="vnd.api+json")
+        assert response.status_code == status.HTTP_200_OK
+        return len(queries)
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        client = APIClient()
+        for i in range(3):
+            wallet = Wallet.objects.create(label=f"Wallet {i}")
+            Transaction.objects.create(wallet=wallet, txid=f"tx-{i}", amount=Decimal("10"))
+        small_page = self._list_query_count(client)
+
+        for i in range(3, 30):
+            wallet = Wallet.objects.create(label=f"Wallet {i}")
+            Transaction.objects.create(wallet=wallet, txid=f"tx-{i}", amount=Decimal("10"))
+        large_page = self._list_query_count(client)
+
+        assert large_page == small_page
+
+    def test_list_returns_stored_balance(self):
+        client = APIClient()
+        wallet = Wallet.objects.create(label="Wallet")
+        Transaction.objects.create(wallet=wallet, txid="tx-1", amount=Decimal("12.5"))
+
+        cache.clear()
+        response = client.get("/api/v1/account/wallets/", format="vnd.api+json")
+
+        result = next(w for w in response.data["results"] if w["id"] == str(wallet.id))
+        assert Decimal(result["balance"]) == Decimal("12.5")
+
+    def test_list_sums_slots_of_sharded_wallets_in_one_query(self):
+        client = APIClient()
+        for i in range(3):
+            wallet = Wallet.objects.create(label=f"Wallet {i}")
+            Transaction.objects.create(wallet=wallet, txid=f"tx-{i}", amount=Decimal("10"))
+            WalletService.set_slot_count(str(wallet.id), 2)
+        small_page = self._list_query_count(client)
+
+        for i in range(3, 30):
+            wallet = Wallet.objects.create(label=f"Wallet {i}")
+            Transaction.objects.create(wallet=wallet, txid=f"tx-{i}", amount=Decimal("10"))
+            WalletService.set_slot_count(str(wallet.id), 2)
+        large_page = self._list_query_count(client)
+
+        assert large_page == small_page
+        cache.clear()
+        response = client.get("/api/v1/account/wallets/?page[size]=100", format="vnd.api+json")
+        assert {Decimal(w["balance"]) for w in response.data["results"]} == {Decimal("10")}
+
+
+@pytest.mark.django_db
+class TestWalletBulkDeposit:
+    url = "/api/v1/account/wallets/bulk-deposit/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = APIClient()
+        self.wallet1 = Wallet.objects.create(label="Wallet 1")
+        self.wallet2 = Wallet.objects.create(label="Wallet 2")
+
+    def _payload(self, items, mode="atomic"):
+        return {"data": {"type": "wallets", "attributes": {"mode": mode, "items": items}}}
+
+    def test_bulk_deposit_applies_items(self):
+        items = [
+            {"wallet": str(self.wallet1.id), "amount": "10.00", "txid": "bulk-1"},
+            {"wallet": str(self.wallet2.id), "amount": "2.50"},
+        ]
+        response = self.client.post(self.url, self._payload(items), format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["applied"] == 2
+        assert [r["status"] for r in response.data["data"]] == ["applied", "applied"]
+        self.wallet1.refresh_from_db()
+        assert self.wallet1.balance == Decimal("10.00")
+
+    def test_bulk_deposit_atomic_failure_returns_400(self):
+        items = [
+            {"wallet": str(self.wallet1.id), "amount": "10.00"},
+            {"wallet": str(self.wallet2.id), "amount": "-1.00"},
+        ]
+        response = self.client.post(self.url, self._payload(items), format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["failed"] == 1
+        assert not Transaction.objects.exists()
+
+    def test_bulk_deposit_best_effort_reports_failures(self):
+        items = [
+            {"wallet": str(self.wallet1.id), "amount": "10.00"},
+            {"wallet": str(self.wallet2.id), "amount": "-1.00"},
+        ]
+        response = self.client.post(
+            self.url, self._payload(items, mode="best_effort"), format="vnd.api+json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["status"] for r in response.data["data"]] == ["applied", "failed"]
+        assert Transaction.objects.count() == 1
+
+    def test_bulk_deposit_invalid_payload(self):
+        response = self.client.post(self.url, self._payload([]), format="vnd.api+json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_only_bulk_deposit_accepts_bodies_over_the_upload_limit(self, settings):
+        settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 1024
+        items = [
+            {"wallet": str(self.wallet1.id), "amount": "1.00", "txid": f"bulk-{i}"}
+            for i in range(20)
+        ]
+        response = self.client.post(self.url, self._payload(items), format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["applied"] == 20
+
+        label = {"data": {"type": "wallets", "attributes": {"label": "x" * 2048}}}
+        response = self.client.post("/api/v1/account/wallets/", label, format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert not Wallet.objects.filter(label="x" * 2048).exists()
+
+
+@pytest.mark.django_db
+class TestWalletTransferBatch:
+    url = "/api/v1/account/wallets/transfers/batch/"
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = APIClient()
+        self.wallet1 = Wallet.objects.create(label="Wallet 1")
+        self.wallet2 = Wallet.objects.create(label="Wallet 2")
+        Transaction.objects.create(wallet=self.wallet1, txid="seed", amount=Decimal("10.00"))
+
+    def _payload(self, transfers):
+        return {"data": {"type": "wallets", "attributes": {"transfers": transfers}}}
+
+    def test_transfer_batch(self):
+        transfers = [
+            {
+                "source_wallet": str(self.wallet1.id),
+                "destination_wallet": str(self.wallet2.id),
+                "amount": "6.00",
+            },
+            {
+                "source_wallet": str(self.wallet2.id),
+                "destination_wallet": str(self.wallet1.id),
+                "amount": "1.00",
+            },
+        ]
+        response = self.client.post(self.url, self._payload(transfers), format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["message"] == "Transfer batch has been completed"
+        self.wallet2.refresh_from_db()
+        assert self.wallet2.balance == Decimal("5.00")
+
+    def test_transfer_batch_insufficient_funds(self):
+        transfers = [
+            {
+                "source_wallet": str(self.wallet2.id),
+                "destination_wallet": str(self.wallet1.id),
+                "amount": "1.00",
+            },
+        ]
+        response = self.client.post(self.url, self._payload(transfers), format="vnd.api+json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Transaction.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestWalletIdempotency:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Wallet")
+        self.url = f"/api/v1/account/wallets/{self.wallet.id}/deposit/"
+
+    def _deposit(self, amount, key):
+        data = {"data": {"type": "wallets", "attributes": {"amount": amount}}}
+        return self.client.post(self.url, data, format="vnd.api+json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_stored_response(self):
+        first = self._deposit("50.00", "deposit-1")
+        cache.clear()
+        second = self._deposit("50.00", "deposit-1")
+        third = self._deposit("50.00", "deposit-1")
+
+        assert first.status_code == second.status_code == third.status_code == 200
+        assert first.content == second.content == third.content
+        assert first["Idempotent-Replayed"] == "false"
+        assert second["Idempotent-Replayed"] == "true"
+        assert third["Idempotent-Replayed"] == "true"
+        assert Transaction.objects.filter(wallet=self.wallet).count() == 1
+        self.wallet.refresh_from_db()
+        assert self.wallet.balance == Decimal("50.00")
+
+    def test_key_reused_with_different_request_returns_422(self):
+        assert self._deposit("50.00", "deposit-2").status_code == 200
+
+        response = self._deposit("60.00", "deposit-2")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert Transaction.objects.filter(wallet=self.wallet).count() == 1
+
+    def test_failed_request_is_not_stored(self):
+        assert self._deposit("-10.00", "deposit-3").status_code >= 400
+        WalletService.apply_cash_flow(wallet_id=str(self.wallet.id), amount=Decimal("20.00"))
+
+        response = self._deposit("-10.00", "deposit-3")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Idempotent-Replayed"] == "false"
+
+
+@pytest.mark.django_db
+class TestWalletResponseCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        cache.clear()
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Wallet")
+        self.url = f"/api/v1/account/wallets/{self.wallet.id}/"
+
+    def _get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, format="vnd.api+json")
+        assert response.status_code == status.HTTP_200_OK
+        return response, len(queries)
+
+    def test_repeated_retrieve_is_served_from_cache(self):
+        first, _ = self._get(self.url)
+        second, queries = self._get(self.url)
+
+        assert queries == 0
+        assert second.content == first.content
+
+    def test_deposit_invalidates_retrieve_and_list(self):
+        self._get(self.url)
+        self._get("/api/v1/account/wallets/")
+
+        WalletService.apply_cash_flow(wallet_id=str(self.wallet.id), amount=Decimal("15.00"))
+
+        detail, _ = self._get(self.url)
+        listing, _ = self._get("/api/v1/account/wallets/")
+        assert Decimal(detail.json()["data"]["attributes"]["balance"]) == Decimal("15.00")
+        assert Decimal(listing.json()["data"][0]["attributes"]["balance"]) == Decimal("15.00")
+
+    def test_deposit_invalidates_retrieve_with_non_canonical_pk(self):
+        for pk in (str(self.wallet.id).upper(), self.wallet.id.hex):
+            self._get(f"/api/v1/account/wallets/{pk}/")
+        WalletService.apply_cash_flow(wallet_id=str(self.wallet.id), amount=Decimal("12.00"))
+
+        for pk in (str(self.wallet.id).upper(), self.wallet.id.hex):
+            detail, _ = self._get(f"/api/v1/account/wallets/{pk}/")
+            assert Decimal(detail.json()["data"]["attributes"]["balance"]) == Decimal("12.00")
+
+    def test_update_invalidates_other_wallet_only_for_list(self):
+        other = Wallet.objects.create(label="Other")
+        self._get(self.url)
+
+        other.label = "Renamed"
+        other.save()
+
+        _, queries = self._get(self.url)
+        assert queries == 0
+        listing, _ = self._get("/api/v1/account/wallets/")
+        assert "Renamed" in listing.content.decode()
+
+
+@pytest.mark.django_db
+def test_wallet_list_keyset_pagination():
+    cache.clear()
+    client = APIClient()
+    wallets = [Wallet.objects.create(label=f"Keyset {index}") for index in range(5)]
+
+    seen = []
+    url = "/api/v1/account/wallets/?page[cursor]=&page[size]=2"
+    while url:
+        body = client.get(url, format="vnd.api+json").json()
+        seen += [item["id"] for item in body["data"]]
+        url = body["links"]["next"]
+
+    assert seen == [
+        str(wallet.id) for wallet in sorted(wallets, key=lambda w: (w.created_at, w.id))
+    ]
+
+
+@pytest.mark.django_db
+class TestWalletTransactionExport:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = APIClient()
+        self.wallet = Wallet.objects.create(label="Export")
+        self.other = Wallet.objects.create(label="Other")
+        for index in range(3):
+            WalletService.apply_cash_flow(
+                wallet_id=str(self.wallet.id), amount=Decimal("1.5"), txid=f"export-{index}"
+            )
+        WalletService.apply_cash_flow(wallet_id=str(self.other.id), amount=Decimal("9"))
+        self.url = f"/api/v1/account/wallets/{self.wallet.id}/transactions/export/"
+
+    def test_export_ndjson(self):
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert [row["txid"] for row in rows] == ["export-0", "export-1", "export-2"]
+        assert all(Decimal(row["amount"]) == Decimal("1.5") for row in rows)
+
+    def test_export_csv_with_created_at_range(self):
+        tx = Transaction.objects.get(txid="export-1")
+
+        response = self.client.get(
+            self.url,
+            {"export_format": "csv", "created_at_min": tx.created_at.isoformat()},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        assert rows[0] == ["id", "txid", "amount", "created_at"]
+        assert [row[1] for row in rows[1:]] == ["export-1", "export-2"]
+
+    def test_export_unsupported_format(self):
+        response = self.client.get(self.url, {"export_format": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_deleted_wallet_returns_404(self):
+        self.wallet.delete()
+        response = self.client.get(self.url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_wallet_label_filter_modes():
+    cache.clear()
+    client = APIClient()
+    for label in ("Savings", "Savings EUR", "My Savings"):
+        Wallet.objects.create(label=label)
+
+    def labels(query):
+        response = client.get(f"/api/v1/account/wallets/?{query}", format="vnd.api+json")
+        return sorted(item["attributes"]["label"] for item in response.json()["data"])
+
+    assert labels("label_exact=Savings") == ["Savings"]
+    assert labels("label_prefix=Savings") == ["Savings", "Savings EUR"]
+    assert labels("label=savings") == ["My Savings", "Savings", "Savings EUR"]
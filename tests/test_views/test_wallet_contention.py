@@ -0,0 +1,31 @@
+import pytest
+
+from apps.account.models import Wallet
+from apps.account.services import WalletContentionService
+
+
+URL = "/admin/wallet-contention/"
+
+
+@pytest.mark.django_db
+def test_wallet_contention_page_lists_wallets(admin_client, settings):
+    settings.WALLET_LOCK_CONTENTION_MIN_WAIT_MS = 0
+    wallet = Wallet.objects.create(label="Omnibus")
+    WalletContentionService.reset()
+    WalletContentionService.record([wallet.id], 0.02)
+
+    response = admin_client.get(URL, {"window": "60"})
+
+    WalletContentionService.reset()
+    assert response.status_code == 200
+    assert response.context["window"] == 60
+    assert [row["wallet_id"] for row in response.context["wallets"]] == [str(wallet.id)]
+    assert "Omnibus" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_wallet_contention_page_requires_staff(client):
+    response = client.get(URL)
+
+    assert response.status_code == 302
+    assert "/admin/login/" in response["Location"]
@@ -3,7 +3,7 @@ Environment configuration helper with caching and validation.
 
 This module provides a singleton-based `EnvConfig` class to safely retrieve
 environment variables in Django applications. It includes automatic caching
-and typed access methods (`str`, `int`, `list`). Raises `ImproperlyConfigured`
+and typed access methods (`str`, `int`, `bool`, `list`). Raises `ImproperlyConfigured`
 if a required environment variable is missing or has invalid format.
 
 Example usage:
@@ -43,6 +43,9 @@ class EnvConfig:
         - get_int(var_name, default=None, required=True) -> int:
             Returns an integer value of an environment variable.
 
+        - get_bool(var_name, default=False) -> bool:
+            Returns a boolean value of an environment variable.
+
     Raises:
         - ImproperlyConfigured: If a required variable is missing or has invalid format.
     """
@@ -119,7 +122,7 @@ class EnvConfig:
                                   or cannot be converted to an integer.
         """
         raw = self.get_str(var_name, default=None, required=required)
-        if raw is None:
+        if raw is None or raw == "":
             if default is not None:
                 return default
             raise ImproperlyConfigured(f"Set the {var_name} environment variable")
@@ -128,6 +131,22 @@ class EnvConfig:
         except ValueError:
             raise ImproperlyConfigured(f"Environment variable {var_name} must be an integer")
 
+    def get_bool(self, var_name: str, default=False) -> bool:
+        """
+        Retrieve a boolean environment variable; "true", "1" and "yes" (any case) are true.
+
+        Args:
+            var_name (str): The name of the environment variable.
+            default (bool, optional): Value if not set or empty. Defaults to False.
+
+        Returns:
+            bool: The boolean value.
+        """
+        raw = self.get_str(var_name, default=None, required=False)
+        if raw is None or raw == "":
+            return default
+        return raw.lower() in ("true", "1", "yes")
+
 
 def get_env() -> EnvConfig:
     """